@@ -1,41 +1,224 @@
 #!/usr/bin/env python3
+import os
+import json
+import time
 import boto3
-import shutil
-import requests
+import urllib3
+from itertools import islice
+from botocore.config import Config
 from datetime import datetime, timezone
 
+IMDS_URL = 'http://169.254.169.254/latest'
+IMDS_TOKEN_TTL = 21600  # Max IMDSv2 token lifetime (6 hours)
+IMDS_TOKEN_CACHE = '/run/imds_token'  # tmpfs, cleared on reboot
+IMDS_TOKEN_MIN_REMAINING = 300  # Refresh token when less than 5 minutes left
+
+MAX_DATUMS_PER_CALL = 1000  # PutMetricData API limit
+# Filesystem types that never represent real persistent storage
+VIRTUAL_FSTYPES = {'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'iso9660'}
+
+
+def _load_cached_token():
+    """Return cached IMDSv2 token if it is still valid, else None."""
+    try:
+        with open(IMDS_TOKEN_CACHE, 'r') as f:
+            cached = json.load(f)
+        if cached['expires_at'] - time.time() > IMDS_TOKEN_MIN_REMAINING:
+            return cached['token']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_cached_token(token, expires_at):
+    """Persist IMDSv2 token so subsequent cron runs can skip the PUT round-trip."""
+    tmp_path = f"{IMDS_TOKEN_CACHE}.{os.getpid()}"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'token': token, 'expires_at': expires_at}, f)
+        os.replace(tmp_path, IMDS_TOKEN_CACHE)
+    except OSError:
+        # Cache is an optimization only - never fail publishing because of it
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _drop_cached_token():
+    """Forget the cached IMDSv2 token (e.g. after IMDS rejected it)."""
+    try:
+        os.unlink(IMDS_TOKEN_CACHE)
+    except OSError:
+        pass
+
+
+def get_imds_token(pool, refresh=False):
+    """Get IMDSv2 token, reusing the cached one while it is still valid."""
+    if not refresh:
+        token = _load_cached_token()
+        if token:
+            return token
+
+    resp = pool.request('PUT', f'{IMDS_URL}/api/token',
+                        headers={'X-aws-ec2-metadata-token-ttl-seconds': str(IMDS_TOKEN_TTL)})
+    if resp.status != 200:
+        # Never cache an error body as a token
+        raise RuntimeError(f"IMDS token request failed: HTTP {resp.status}")
+
+    token = resp.data.decode()
+    _save_cached_token(token, time.time() + IMDS_TOKEN_TTL)
+    return token
+
+
 # Get instance metadata
-def get_instance_metadata():
-    token = requests.put('http://169.254.169.254/latest/api/token',
-                        headers={'X-aws-ec2-metadata-token-ttl-seconds': '21600'}).text
-    instance_id = requests.get('http://169.254.169.254/latest/meta-data/instance-id',
-                              headers={'X-aws-ec2-metadata-token': token}).text
-    return instance_id
+def get_instance_metadata(pool):
+    token = get_imds_token(pool)
+    resp = pool.request('GET', f'{IMDS_URL}/meta-data/instance-id',
+                        headers={'X-aws-ec2-metadata-token': token})
+    if resp.status == 401:
+        # Cached token was rejected (expired early, instance stopped/started): fetch a new one
+        _drop_cached_token()
+        token = get_imds_token(pool, refresh=True)
+        resp = pool.request('GET', f'{IMDS_URL}/meta-data/instance-id',
+                            headers={'X-aws-ec2-metadata-token': token})
+    if resp.status != 200:
+        raise RuntimeError(f"IMDS instance-id request failed: HTTP {resp.status}")
+    return resp.data.decode()
+
+
+def get_mount_points():
+    """Return real block-device mount points from /proc/mounts (deduplicated by device)."""
+    mounts = []
+    seen_devices = set()
+    with open('/proc/mounts', 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            device, path, fstype = parts[0], parts[1], parts[2]
+            if not device.startswith('/dev/') or device.startswith('/dev/loop'):
+                continue
+            if fstype in VIRTUAL_FSTYPES or device in seen_devices:
+                continue
+            seen_devices.add(device)
+            mounts.append(path)
+    return mounts or ['/']
+
+
+def get_disk_used_percent(path):
+    """Return disk used percentage for a mount point, or None for empty filesystems.
+
+    Matches the CloudWatch agent's used_percent: used / (used + available to
+    unprivileged users), so reserved blocks don't count as free space.
+    """
+    st = os.statvfs(path)
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + st.f_bavail * st.f_frsize
+    if usable == 0:
+        return None
+    return (used / usable) * 100
+
 
-instance_id = get_instance_metadata()
-cw = boto3.client('cloudwatch', region_name='us-east-1')
+def read_cpu_times():
+    """Return (idle, total) jiffies from the aggregate cpu line of /proc/stat."""
+    with open('/proc/stat', 'r') as f:
+        values = [int(x) for x in f.readline().split()[1:]]
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+    return idle, sum(values)
+
+
+def get_cpu_usage_percent(interval=1.0):
+    """Sample /proc/stat twice and return CPU busy percentage over the interval."""
+    idle1, total1 = read_cpu_times()
+    time.sleep(interval)
+    idle2, total2 = read_cpu_times()
+    total_delta = total2 - total1
+    if total_delta <= 0:
+        return 0.0
+    return ((total_delta - (idle2 - idle1)) / total_delta) * 100
+
+
+def get_mem_used_percent():
+    """Return memory used percentage from /proc/meminfo (MemTotal vs MemAvailable)."""
+    meminfo = {}
+    with open('/proc/meminfo', 'r') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            meminfo[key] = int(value.split()[0])
+    total = meminfo['MemTotal']
+    available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
+    return ((total - available) / total) * 100
+
+
+def build_metric_data(instance_id, timestamp):
+    """Collect all metrics for this instance into a single MetricData list."""
+    instance_dim = {'Name': 'InstanceId', 'Value': instance_id}
+
+    def datum(name, value, unit, extra_dims=()):
+        return {
+            'MetricName': name,
+            'Value': value,
+            'Unit': unit,
+            'Timestamp': timestamp,
+            'Dimensions': [instance_dim, *extra_dims]
+        }
+
+    metric_data = []
+    for path in get_mount_points():
+        used_percent = get_disk_used_percent(path)
+        if used_percent is None:
+            continue
+        metric_data.append(datum('disk_used_percent', used_percent, 'Percent',
+                                 [{'Name': 'path', 'Value': path}]))
+
+    metric_data.append(datum('mem_used_percent', get_mem_used_percent(), 'Percent'))
+    metric_data.append(datum('cpu_usage_active', get_cpu_usage_percent(), 'Percent'))
+    metric_data.append(datum('load_avg_1m', os.getloadavg()[0], 'None'))
+    return metric_data
+
+
+def publish(cw, metric_data):
+    """Publish datums in as few PutMetricData calls as the API limit allows."""
+    datums = iter(metric_data)
+    calls = 0
+    while True:
+        chunk = list(islice(datums, MAX_DATUMS_PER_CALL))
+        if not chunk:
+            break
+        cw.put_metric_data(Namespace='CWAgent', MetricData=chunk)
+        calls += 1
+    return calls
+
+
+# urllib3 directly (already a botocore dependency) - IMDS is a single host
+pool = urllib3.PoolManager(num_pools=1, maxsize=2, timeout=1.0)
+
+instance_id = get_instance_metadata(pool)
+cw = boto3.client(
+    'cloudwatch',
+    region_name='us-east-1',
+    config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        connect_timeout=2,
+        read_timeout=5,
+        retries={'mode': 'adaptive', 'max_attempts': 3}
+    )
+)
 
 # Collect metrics
-total, used, free = shutil.disk_usage('/')
-disk_used_percent = (used / total) * 100
+timestamp = datetime.now(timezone.utc)
+metric_data = build_metric_data(instance_id, timestamp)
 
 # Publish to CloudWatch
-timestamp = datetime.now(timezone.utc)
 print(f"{timestamp}: Publishing metrics for {instance_id}")
-print(f"  disk_used_percent = {disk_used_percent:.2f}%")
-
-cw.put_metric_data(
-    Namespace='CWAgent',
-    MetricData=[{
-        'MetricName': 'disk_used_percent',
-        'Value': disk_used_percent,
-        'Unit': 'Percent',
-        'Timestamp': timestamp,
-        'Dimensions': [
-            {'Name': 'InstanceId', 'Value': instance_id},
-            {'Name': 'path', 'Value': '/'}
-        ]
-    }]
-)
+for d in metric_data:
+    path = next((dim['Value'] for dim in d['Dimensions'] if dim['Name'] == 'path'), None)
+    label = f"{d['MetricName']}[{path}]" if path else d['MetricName']
+    print(f"  {label} = {d['Value']:.2f}")
+
+calls = publish(cw, metric_data)
 
-print("✓ Metrics published successfully to CloudWatch")
+print(f"✓ {len(metric_data)} metrics published successfully to CloudWatch in {calls} call(s)")
@@ -7,17 +7,18 @@ actual or simulated monitoring cycles.
 """
 
 import asyncio
+import statistics
 import sys
 import argparse
+import time
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config.loader import ConfigLoader
-from src.workflow import MonitoringWorkflow
-from src.utils.logger import setup_logger
+# src.* imports are deferred until after argument parsing: the workflow pulls in
+# boto3, langgraph, paramiko etc., which --help and argument errors never need
 
 
 class CostProfiler:
@@ -27,16 +28,49 @@ class CostProfiler:
     INPUT_PRICE_PER_1M = 0.80   # $0.80 per 1M input tokens
     OUTPUT_PRICE_PER_1M = 4.00  # $4.00 per 1M output tokens
 
-    def __init__(self, config_path: str):
-        """Initialize cost profiler."""
+    def __init__(self, config_path: str, build_workflow: bool = True, dry_run: bool = False):
+        """
+        Initialize cost profiler.
+
+        Args:
+            config_path: Path to configuration file
+            build_workflow: Set False when only profiling from usage history
+            dry_run: Skip Telegram delivery and metric history updates
+        """
+        from src.config.loader import ConfigLoader
+        from src.utils.logger import setup_logger
+
         self.logger = setup_logger("cost_profiler")
         self.config_path = config_path
 
         self.logger.info("Loading configuration...")
         self.config = ConfigLoader.load_from_file(config_path)
 
-        self.logger.info("Initializing workflow...")
-        self.workflow = MonitoringWorkflow(self.config, self.logger)
+        self.workflow = None
+        if build_workflow:
+            # Load the workflow (and its heavy dependencies) only once config is valid
+            from src.workflow import MonitoringWorkflow
+
+            # Disable the analysis cache: a hit on production's cached analysis
+            # would report 0 tokens and $0/cycle
+            workflow_config = self.config.model_copy(update={
+                'llm': self.config.llm.model_copy(update={'analysis_cache_ttl_seconds': 0})
+            })
+
+            self.logger.info("Initializing workflow...")
+            # Profiling cycles stay out of the usage log that --from-history reads
+            self.workflow = MonitoringWorkflow(
+                workflow_config,
+                self.logger,
+                record_usage=False,
+                send_telegram=not dry_run,
+                update_history=not dry_run
+            )
+
+    async def close(self):
+        """Release resources held by the profiled workflow."""
+        if self.workflow is not None:
+            await self.workflow.close()
 
     async def profile_single_cycle(self) -> dict:
         """
@@ -45,10 +79,6 @@ class CostProfiler:
         Returns:
             dict: Profile results with token usage and cost breakdown
         """
-        self.logger.info("=" * 70)
-        self.logger.info("COST PROFILING: Single Monitoring Cycle")
-        self.logger.info("=" * 70)
-
         start_time = datetime.now()
 
         # Run monitoring cycle
@@ -59,17 +89,16 @@ class CostProfiler:
         duration = (end_time - start_time).total_seconds()
 
         # Extract metrics
-        token_usage = final_state.get('token_usage', 0)
+        token_usage = final_state.get('token_usage', {})
         all_results = final_state.get('all_results', [])
         issues = final_state.get('issues', [])
 
-        # Calculate costs
-        # Note: We don't have exact input/output split, so estimate 50/50
-        estimated_input = token_usage // 2
-        estimated_output = token_usage // 2
+        # Calculate costs from the real input/output split
+        input_tokens = token_usage.get('input', 0)
+        output_tokens = token_usage.get('output', 0)
 
-        input_cost = (estimated_input / 1_000_000) * self.INPUT_PRICE_PER_1M
-        output_cost = (estimated_output / 1_000_000) * self.OUTPUT_PRICE_PER_1M
+        input_cost = (input_tokens / 1_000_000) * self.INPUT_PRICE_PER_1M
+        output_cost = (output_tokens / 1_000_000) * self.OUTPUT_PRICE_PER_1M
         total_cost = input_cost + output_cost
 
         profile = {
@@ -78,9 +107,9 @@ class CostProfiler:
             'total_checks': len(all_results),
             'issues_detected': len(issues),
             'token_usage': {
-                'total': token_usage,
-                'estimated_input': estimated_input,
-                'estimated_output': estimated_output
+                'total': token_usage.get('total', 0),
+                'input': input_tokens,
+                'output': output_tokens
             },
             'cost': {
                 'per_cycle': total_cost,
@@ -91,6 +120,128 @@ class CostProfiler:
 
         return profile
 
+    async def profile_cycles(self, samples: int = 1) -> dict:
+        """
+        Profile several monitoring cycles concurrently.
+
+        Cycles are I/O-bound (Bedrock, collectors), so running them with
+        asyncio.gather takes roughly as long as the slowest cycle while
+        giving projections real variance instead of a sample of one.
+
+        Args:
+            samples: Number of cycles to run
+
+        Returns:
+            dict: Profile with duration, token and cost figures averaged over
+                  all cycles, plus a 'samples' summary (mean/stdev/p50/p95)
+        """
+        self.logger.info("=" * 70)
+        self.logger.info(f"COST PROFILING: {samples} Monitoring Cycle(s)")
+        self.logger.info("=" * 70)
+
+        wall_start = time.perf_counter()
+        profiles = await asyncio.gather(*(self.profile_single_cycle() for _ in range(samples)))
+        wall_seconds = time.perf_counter() - wall_start
+
+        durations = [p['duration_seconds'] for p in profiles]
+        tokens = [p['token_usage']['total'] for p in profiles]
+        costs = [p['cost']['per_cycle'] for p in profiles]
+
+        profile = dict(profiles[0])
+        profile['duration_seconds'] = statistics.mean(durations)
+        profile['token_usage'] = {
+            key: statistics.mean(p['token_usage'][key] for p in profiles)
+            for key in profile['token_usage']
+        }
+        profile['cost'] = {
+            key: statistics.mean(p['cost'][key] for p in profiles)
+            for key in profile['cost']
+        }
+        profile['samples'] = {
+            'count': samples,
+            'source': f"{samples} concurrent cycles, {wall_seconds:.1f}s wall",
+            'duration': self._summarize(durations),
+            'tokens': self._summarize(tokens),
+            'cost_per_cycle': self._summarize(costs),
+        }
+
+        return profile
+
+    def profile_from_history(self, days: float) -> dict:
+        """
+        Build a profile from cycles recorded by production runs.
+
+        Uses the real input/output token split logged per cycle, so no
+        monitoring cycle (and no Bedrock call) is needed.
+
+        Args:
+            days: Look-back window in days
+
+        Returns:
+            dict: Profile with per-cycle means plus a 'samples' summary
+
+        Raises:
+            ValueError: If no cycles were recorded in the window
+        """
+        from src.services.usage_log import UsageLog
+
+        usage_log = UsageLog(self.config.monitoring.usage_log_path, logger=self.logger)
+        try:
+            rows = usage_log.cycles(days)
+        finally:
+            usage_log.close()
+
+        if not rows:
+            raise ValueError(
+                f"No cycles recorded in the last {days:g} day(s) "
+                f"in {self.config.monitoring.usage_log_path}"
+            )
+
+        durations = [r['duration_ms'] / 1000 for r in rows]
+        inputs = [r['input_tokens'] for r in rows]
+        outputs = [r['output_tokens'] for r in rows]
+        input_costs = [(i / 1_000_000) * self.INPUT_PRICE_PER_1M for i in inputs]
+        output_costs = [(o / 1_000_000) * self.OUTPUT_PRICE_PER_1M for o in outputs]
+        costs = [i + o for i, o in zip(input_costs, output_costs)]
+
+        return {
+            'timestamp': datetime.fromtimestamp(rows[-1]['ts']).isoformat(),
+            'duration_seconds': statistics.mean(durations),
+            'total_checks': round(statistics.mean(r['n_checks'] for r in rows)),
+            'issues_detected': round(statistics.mean(r['n_issues'] for r in rows)),
+            'token_usage': {
+                'total': statistics.mean(i + o for i, o in zip(inputs, outputs)),
+                'input': statistics.mean(inputs),
+                'output': statistics.mean(outputs)
+            },
+            'cost': {
+                'per_cycle': statistics.mean(costs),
+                'input_cost': statistics.mean(input_costs),
+                'output_cost': statistics.mean(output_costs)
+            },
+            'samples': {
+                'count': len(rows),
+                'source': f"{len(rows)} recorded cycles over the last {days:g} day(s)",
+                'duration': self._summarize(durations),
+                'tokens': self._summarize([i + o for i, o in zip(inputs, outputs)]),
+                'cost_per_cycle': self._summarize(costs),
+            }
+        }
+
+    @staticmethod
+    def _summarize(values: list) -> dict:
+        """Return mean, population stdev, p50 and p95 of sample values."""
+        if len(values) > 1:
+            p95 = statistics.quantiles(values, n=20, method='inclusive')[18]
+        else:
+            p95 = values[0]
+        return {
+            'mean': statistics.mean(values),
+            'stdev': statistics.pstdev(values),
+            'p50': statistics.median(values),
+            'p95': p95,
+        }
+
     def project_costs(self, cost_per_cycle: float, cycles_per_day: int = 4) -> dict:
         """
         Project daily and monthly costs.
@@ -127,10 +278,25 @@ class CostProfiler:
         print(f"  Total Checks: {profile['total_checks']}")
         print(f"  Issues Detected: {profile['issues_detected']}")
 
+        samples = profile.get('samples')
+        if samples and samples['count'] > 1:
+            print(f"\n🎲 SAMPLES ({samples['source']})")
+            for label, key, fmt in (
+                ("Duration (s)", 'duration', "{:.1f}"),
+                ("Tokens", 'tokens', "{:,.0f}"),
+                ("Cost per Cycle ($)", 'cost_per_cycle', "{:.4f}"),
+            ):
+                stats = samples[key]
+                print(
+                    f"  {label}: mean {fmt.format(stats['mean'])}, "
+                    f"stdev {fmt.format(stats['stdev'])}, "
+                    f"p50 {fmt.format(stats['p50'])}, p95 {fmt.format(stats['p95'])}"
+                )
+
         print("\n🔢 TOKEN USAGE")
-        print(f"  Total Tokens: {profile['token_usage']['total']:,}")
-        print(f"  Estimated Input: {profile['token_usage']['estimated_input']:,}")
-        print(f"  Estimated Output: {profile['token_usage']['estimated_output']:,}")
+        print(f"  Total Tokens: {profile['token_usage']['total']:,.0f}")
+        print(f"  Input Tokens: {profile['token_usage']['input']:,.0f}")
+        print(f"  Output Tokens: {profile['token_usage']['output']:,.0f}")
 
         print("\n💰 COST BREAKDOWN (per cycle)")
         print(f"  Input Cost: ${profile['cost']['input_cost']:.4f}")
@@ -201,20 +367,47 @@ async def main():
         help='Number of cycles per day for projections (default: 4)'
     )
 
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=1,
+        help='Number of monitoring cycles to run concurrently (default: 1)'
+    )
+
+    parser.add_argument(
+        '--from-history',
+        type=float,
+        metavar='DAYS',
+        help='Project costs from cycles recorded in the last DAYS days (no monitoring cycle is run)'
+    )
+
     parser.add_argument(
         '--dry-run',
         action='store_true',
-        help='Run without sending Telegram notifications'
+        help='Run without sending Telegram notifications or updating metric history '
+             '(implied by --samples > 1)'
     )
 
     args = parser.parse_args()
 
-    try:
-        # Create profiler
-        profiler = CostProfiler(args.config)
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.from_history is not None and args.from_history <= 0:
+        parser.error("--from-history must be a positive number of days")
 
-        # Profile single cycle
-        profile = await profiler.profile_single_cycle()
+    try:
+        if args.from_history is not None:
+            # Project from recorded production cycles - no LLM cost
+            profiler = CostProfiler(args.config, build_workflow=False)
+            profile = profiler.profile_from_history(args.from_history)
+        else:
+            # Profile one or more cycles concurrently; several samples would send
+            # several reports and count each RED metric several times
+            profiler = CostProfiler(args.config, dry_run=args.dry_run or args.samples > 1)
+            try:
+                profile = await profiler.profile_cycles(args.samples)
+            finally:
+                await profiler.close()
 
         # Project costs
         projections = profiler.project_costs(
@@ -3,7 +3,7 @@
 Script to generate visual representation of the monitoring workflow graph.
 
 Usage:
-    python scripts/visualize_workflow.py [output_path]
+    python scripts/visualize_workflow.py [output_path] [config_path]
 
 Requirements:
     pip install pygraphviz  # or pip install grandalf
@@ -16,13 +16,19 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config.loader import ConfigLoader
-from src.workflow import MonitoringWorkflow
-from src.utils.logger import setup_logger
+# src.* imports are deferred into main(): the workflow pulls in boto3,
+# langgraph, pygraphviz etc., which --help and a missing config never need
 
 
 def main():
     """Generate workflow graph visualization."""
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print(__doc__)
+        return 0
+
+    from src.config.loader import ConfigLoader
+    from src.utils.logger import setup_logger
+
     # Setup logging
     logger = setup_logger("visualize")
 
@@ -34,6 +40,9 @@ def main():
         logger.info(f"Loading configuration from {config_path}")
         config = ConfigLoader.load_from_file(config_path)
 
+        # Load the workflow (and its heavy dependencies) only once config is valid
+        from src.workflow import MonitoringWorkflow
+
         logger.info("Initializing workflow")
         workflow = MonitoringWorkflow(config, logger)
 
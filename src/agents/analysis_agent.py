@@ -1,15 +1,109 @@
 """AI-powered root cause analysis agent."""
 
 import json
-import re
 import logging
-from typing import List, Dict
+from collections import defaultdict
+from itertools import groupby, islice
+from operator import attrgetter
+from typing import List, Dict, Final, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..services.analysis_cache import AnalysisCache
 from ..services.bedrock_client import BedrockClient
 from ..services.budget_tracker import BudgetTracker
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
-from ..utils.status import HealthStatus
+from ..utils.status import STATUS_EMOJI, HealthStatus
+
+
+# Opening fence of a ```json markdown code block
+_JSON_FENCE: Final[str] = '```json'
+
+# Shared decoder: raw_decode() stops at the end of the first complete object
+_JSON_DECODER = json.JSONDecoder()
+
+# Issues sharing this signature across targets are sent to Claude as one block
+_ISSUE_SIGNATURE = attrgetter('collector_name', 'status', 'message')
+
+# Target names listed per deduplicated block (full list goes to affected_systems)
+_MAX_LISTED_TARGETS = 10
+
+# Upper-case status labels for the prompt, keyed by the enum itself
+_STATUS_LABEL: Final[Dict[HealthStatus, str]] = {status: status.value.upper() for status in HealthStatus}
+
+# Defaults merged under each parsed recommendation
+_REC_DEFAULTS: Final[Dict[str, str]] = {
+    'priority': 'medium',
+    'action': 'No action specified',
+    'rationale': '',
+}
+
+# Per-issue prompt block; optional lines are passed as "" when absent
+_ISSUE_TMPL = (
+    "{emoji} **{name}**\n"
+    "- Status: {status}\n"
+    "- Message: {msg}\n"
+    "{targets_line}{metrics_line}{error_line}\n"
+).format_map
+
+# System prompt defining Claude's role
+_SYSTEM_PROMPT: Final[str] = """You are an expert Site Reliability Engineer (SRE) and infrastructure analyst.
+
+Your expertise includes:
+- Root cause analysis and issue correlation
+- Cloud infrastructure (AWS, Azure, VPS servers)
+- Container orchestration (Docker)
+- Database performance and reliability
+- API monitoring and debugging
+- System resource optimization
+
+Your analysis should be:
+- **Practical**: Focus on actionable recommendations
+- **Concise**: Get to the point quickly
+- **Structured**: Use the requested JSON format
+- **Evidence-based**: Reference specific metrics and symptoms
+
+Always correlate related issues to identify systemic problems rather than treating each issue in isolation."""
+
+# Analysis instructions appended after the issue list
+_INSTRUCTIONS_SUFFIX: Final[str] = """
+---
+
+Analyze these infrastructure issues and provide:
+
+1. **Root Cause**: Identify underlying cause by correlating related issues
+2. **Severity**: Assess overall impact (critical/high/medium/low)
+3. **Affected Systems**: List impacted system names
+4. **Recommendations**: Provide specific, actionable remediation steps with priorities
+
+**Respond in JSON format:**
+
+```json
+{
+  "root_cause": "Brief explanation of the underlying cause",
+  "severity": "critical|high|medium|low",
+  "affected_systems": ["system1", "system2"],
+  "recommendations": [
+    {
+      "priority": "immediate|high|medium|low",
+      "action": "Specific remediation step",
+      "rationale": "Why this will help resolve the issue"
+    }
+  ]
+}
+```
+
+Be concise and practical. Focus on actionable insights.
+"""
+
+
+def _by_collector(entry: Tuple[CollectorResult, List[str]]) -> str:
+    """Sort/group key for deduplicated issues in the analysis prompt."""
+    return entry[0].collector_name
 
 
 class AnalysisAgent:
@@ -20,7 +114,13 @@ class AnalysisAgent:
     and generates actionable recommendations.
     """
 
-    def __init__(self, bedrock_client: BedrockClient, budget_tracker: BudgetTracker, logger: logging.Logger = None):
+    def __init__(
+        self,
+        bedrock_client: BedrockClient,
+        budget_tracker: BudgetTracker,
+        logger: logging.Logger = None,
+        analysis_cache: Optional[AnalysisCache] = None
+    ):
         """
         Initialize analysis agent.
 
@@ -28,10 +128,12 @@ class AnalysisAgent:
             bedrock_client: Bedrock client for LLM calls
             budget_tracker: Budget tracker to enforce spending limits
             logger: Optional logger instance
+            analysis_cache: Optional cache to reuse analyses of repeated issue sets
         """
         self.bedrock = bedrock_client
         self.budget = budget_tracker
         self.logger = logger or logging.getLogger(__name__)
+        self.cache = analysis_cache
 
     async def analyze(self, issues: List[CollectorResult]) -> Dict:
         """
@@ -59,6 +161,37 @@ class AnalysisAgent:
                 "token_usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
             }
 
+        # Reuse previous analysis if the same (or a near-identical) issue set was seen recently
+        cache_key = None
+        signature = None
+        if self.cache is not None and self.cache.enabled:
+            cache_key = self.cache.fingerprint(issues)
+            signature = self.cache.signature(issues)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(
+                    f"Analysis cache hit, skipping AI call "
+                    f"(exact-hit ratio {self.cache.hit_ratio:.0%}, "
+                    f"similar-hit ratio {self.cache.similar_hit_ratio:.0%})"
+                )
+                cached['token_usage'] = {
+                    "input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "cached": True
+                }
+                return cached
+
+            similar = self.cache.get_similar(signature)
+            if similar is not None:
+                cached, score = similar
+                self.logger.info(
+                    f"Analysis cache similar hit ({score:.2f}), skipping AI call "
+                    f"(exact-hit ratio {self.cache.hit_ratio:.0%}, "
+                    f"similar-hit ratio {self.cache.similar_hit_ratio:.0%})"
+                )
+                cached['token_usage'] = {
+                    "input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "semantic_cached": True
+                }
+                return cached
+
         # Check budget before LLM call
         if not self.budget.can_make_request(estimated_tokens=8000):
             self.logger.warning("Budget exceeded, skipping AI analysis")
@@ -92,6 +225,19 @@ class AnalysisAgent:
             analysis = self._parse_analysis_response(response)
             analysis['token_usage'] = usage
 
+            # Claude saw one block per issue signature - make sure every
+            # collapsed target is reported as affected
+            if len({_ISSUE_SIGNATURE(issue) for issue in issues}) < len(issues):
+                affected = analysis['affected_systems']
+                affected.extend(
+                    name for name in dict.fromkeys(issue.target_name for issue in issues)
+                    if name not in affected
+                )
+
+            # Only cache analyses that were parsed successfully
+            if cache_key is not None and 'parse_error' not in analysis:
+                self.cache.set(cache_key, analysis, signature)
+
             self.logger.info(
                 f"Analysis completed: {analysis.get('severity', 'unknown')} severity, "
                 f"{len(analysis.get('recommendations', []))} recommendations"
@@ -122,6 +268,8 @@ class AnalysisAgent:
         Build structured analysis prompt from issues.
 
         Groups issues by collector type and formats them for Claude.
+        Issues with the same (collector, status, message) on several targets
+        are emitted once with an "Affected targets" line.
 
         Args:
             issues: List of issues to analyze
@@ -129,64 +277,60 @@ class AnalysisAgent:
         Returns:
             str: Formatted prompt
         """
-        prompt = "# Infrastructure Issues Detected\n\n"
+        parts: List[str] = ["# Infrastructure Issues Detected\n\n"]
 
         # Group issues by collector type for better correlation
-        by_collector = {}
-        for issue in issues:
-            by_collector.setdefault(issue.collector_name, []).append(issue)
-
-        # Format each collector group
-        for collector_name, collector_issues in sorted(by_collector.items()):
-            prompt += f"## {collector_name.upper()} Issues\n\n"
-
-            for issue in collector_issues:
-                status_emoji = issue.status.to_emoji()
-                prompt += f"{status_emoji} **{issue.target_name}**\n"
-                prompt += f"- Status: {issue.status.value.upper()}\n"
-                prompt += f"- Message: {issue.message}\n"
-
-                if issue.metrics:
-                    # Format key metrics (limit to most important)
-                    metrics_str = ", ".join([f"{k}={v}" for k, v in list(issue.metrics.items())[:5]])
-                    prompt += f"- Metrics: {metrics_str}\n"
-
-                if issue.error:
-                    prompt += f"- Error: {issue.error}\n"
-
-                prompt += "\n"
+        # (stable sort keeps the original issue order within each group)
+        deduped = sorted(self._dedupe_issues(issues), key=_by_collector)
+        for collector_name, entries in groupby(deduped, key=_by_collector):
+            parts.append(f"## {collector_name.upper()} Issues\n\n")
+
+            for issue, targets in entries:
+                targets_line = ""
+                if len(targets) > 1:
+                    listed = ", ".join(targets[:_MAX_LISTED_TARGETS])
+                    if len(targets) > _MAX_LISTED_TARGETS:
+                        listed += ", …"
+                    targets_line = f"- Affected targets ({len(targets)}): {listed}\n"
+
+                # Format key metrics (limit to most important)
+                metrics_line = (
+                    "- Metrics: " + ", ".join(f"{k}={v}" for k, v in islice(issue.metrics.items(), 5)) + "\n"
+                    if issue.metrics else ""
+                )
+                parts.append(_ISSUE_TMPL({
+                    "emoji": STATUS_EMOJI[issue.status],
+                    "name": issue.target_name,
+                    "status": _STATUS_LABEL[issue.status],
+                    "msg": issue.message,
+                    "targets_line": targets_line,
+                    "metrics_line": metrics_line,
+                    "error_line": f"- Error: {issue.error}\n" if issue.error else "",
+                }))
 
         # Add analysis instructions
-        prompt += """
----
-
-Analyze these infrastructure issues and provide:
+        parts.append(_INSTRUCTIONS_SUFFIX)
+        return "".join(parts)
 
-1. **Root Cause**: Identify underlying cause by correlating related issues
-2. **Severity**: Assess overall impact (critical/high/medium/low)
-3. **Affected Systems**: List impacted system names
-4. **Recommendations**: Provide specific, actionable remediation steps with priorities
+    @staticmethod
+    def _dedupe_issues(issues: List[CollectorResult]) -> List[Tuple[CollectorResult, List[str]]]:
+        """
+        Collapse issues sharing a (collector, status, message) signature.
 
-**Respond in JSON format:**
+        Args:
+            issues: Issues to analyze
 
-```json
-{
-  "root_cause": "Brief explanation of the underlying cause",
-  "severity": "critical|high|medium|low",
-  "affected_systems": ["system1", "system2"],
-  "recommendations": [
-    {
-      "priority": "immediate|high|medium|low",
-      "action": "Specific remediation step",
-      "rationale": "Why this will help resolve the issue"
-    }
-  ]
-}
-```
+        Returns:
+            List of (representative issue, affected target names), in first-seen order
+        """
+        groups: Dict[tuple, List[CollectorResult]] = defaultdict(list)
+        for issue in issues:
+            groups[_ISSUE_SIGNATURE(issue)].append(issue)
 
-Be concise and practical. Focus on actionable insights.
-"""
-        return prompt
+        return [
+            (group[0], list(dict.fromkeys(issue.target_name for issue in group)))
+            for group in groups.values()
+        ]
 
     def _get_system_prompt(self) -> str:
         """
@@ -195,23 +339,7 @@ Be concise and practical. Focus on actionable insights.
         Returns:
             str: System prompt defining Claude's role
         """
-        return """You are an expert Site Reliability Engineer (SRE) and infrastructure analyst.
-
-Your expertise includes:
-- Root cause analysis and issue correlation
-- Cloud infrastructure (AWS, Azure, VPS servers)
-- Container orchestration (Docker)
-- Database performance and reliability
-- API monitoring and debugging
-- System resource optimization
-
-Your analysis should be:
-- **Practical**: Focus on actionable recommendations
-- **Concise**: Get to the point quickly
-- **Structured**: Use the requested JSON format
-- **Evidence-based**: Reference specific metrics and symptoms
-
-Always correlate related issues to identify systemic problems rather than treating each issue in isolation."""
+        return _SYSTEM_PROMPT
 
     def _parse_analysis_response(self, response: str) -> Dict:
         """
@@ -226,47 +354,31 @@ Always correlate related issues to identify systemic problems rather than treati
             dict: Parsed analysis result
         """
         try:
-            # Try to extract JSON from markdown code block
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to extract JSON without code block
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    # No JSON found, use response as-is
-                    raise ValueError("No JSON found in response")
-
-            # Parse JSON
-            analysis = json.loads(json_str)
+            # Prefer JSON inside a markdown code block, else the first object in the text
+            fence = response.find(_JSON_FENCE)
+            start = response.find('{', fence + len(_JSON_FENCE) if fence != -1 else 0)
+            if start == -1:
+                # No JSON found, use response as-is
+                raise ValueError("No JSON found in response")
+
+            # Parse JSON in a single pass, ignoring any trailing text or fence
+            analysis = self._loads_first_object(response, start)
+            if not isinstance(analysis, dict):
+                raise ValueError("Response JSON is not an object")
 
             # Validate required fields
-            if 'root_cause' not in analysis:
-                analysis['root_cause'] = "Unable to determine root cause"
-
-            if 'severity' not in analysis:
-                analysis['severity'] = "unknown"
-
-            if 'affected_systems' not in analysis:
-                analysis['affected_systems'] = []
-
-            if 'recommendations' not in analysis:
-                analysis['recommendations'] = []
+            analysis.setdefault('root_cause', "Unable to determine root cause")
+            analysis.setdefault('severity', "unknown")
+            analysis.setdefault('affected_systems', [])
+            recs = analysis.setdefault('recommendations', [])
 
             # Validate recommendation structure
-            for rec in analysis['recommendations']:
-                if 'priority' not in rec:
-                    rec['priority'] = 'medium'
-                if 'action' not in rec:
-                    rec['action'] = 'No action specified'
-                if 'rationale' not in rec:
-                    rec['rationale'] = ''
+            analysis['recommendations'] = [_REC_DEFAULTS | rec for rec in recs]
 
             return analysis
 
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
             self.logger.error(f"Failed to parse analysis response: {e}")
             self.logger.debug(f"Response text: {response[:500]}")
 
@@ -285,3 +397,33 @@ Always correlate related issues to identify systemic problems rather than treati
                 "parse_error": str(e),
                 "raw_response": response[:500]  # Include truncated response for debugging
             }
+
+    @staticmethod
+    def _loads_first_object(text: str, start: int):
+        """
+        Decode the JSON value starting at text[start].
+
+        Uses orjson on the span up to the last closing brace (before any closing
+        code fence) when available, falling back to the stdlib raw_decode which
+        stops at the end of the first complete value.
+
+        Args:
+            text: Raw response text
+            start: Index of the opening brace
+
+        Returns:
+            Decoded JSON value
+
+        Raises:
+            ValueError: If no valid JSON value starts at *start*
+        """
+        if orjson is not None:
+            fence_end = text.find('```', start)
+            end = text.rfind('}', start, fence_end if fence_end != -1 else len(text)) + 1
+            try:
+                return orjson.loads(text[start:end].encode())
+            except orjson.JSONDecodeError:
+                pass  # Trailing text with braces - let raw_decode find the object end
+
+        obj, _ = _JSON_DECODER.raw_decode(text, start)
+        return obj
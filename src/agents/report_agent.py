@@ -2,12 +2,60 @@
 
 import time
 import logging
-from datetime import datetime
-from typing import List, Dict
+from collections import Counter
+from itertools import islice
+from typing import List, Dict, Tuple
 
-from .state import MonitoringState
+from .state import ISSUE_STATUSES, MonitoringState
 from ..utils.metrics import CollectorResult
-from ..utils.status import HealthStatus
+from ..utils.status import STATUS_EMOJI, HealthStatus, worst_status
+
+
+# Section separators and headings shared by the builders
+_SEP = "━━━━━━━━━━━━━━━━━━━━━━━━\n"
+_HDR_SUMMARY = "## 📦 Summary by Type\n\n"
+_HDR_ISSUES = "## 🚨 Issues Detected\n\n"
+_HDR_CRITICAL = "### 🔴 Critical Issues\n\n"
+_HDR_WARNINGS = "### 🟡 Warnings\n\n"
+_HDR_UNKNOWN = "### ⚪ Unknown Status\n\n"
+_HDR_ANALYSIS = "## 🤖 AI Analysis\n\n"
+_HDR_ACTIONS = "**Recommended Actions**:\n\n"
+_FOOTER_SIGNATURE = "\n_Generated by Monitoring AI Agent_"
+
+# Fixed-shape header and footer skeletons, filled via format_map
+_HEADER_TMPL = (
+    "{emoji} **Infrastructure Health Report**\n"
+    "📅 {ts}\n"
+    "\n"
+    "📊 **Overall Status**: {status}\n"
+    "✅ {passed}/{total} checks passed\n"
+).format_map
+_FOOTER_TMPL = (
+    _SEP
+    + "⏱ **Execution time**: {duration:.1f}s\n"
+    "🔤 **LLM tokens used**: {tokens:,}\n"
+).format_map
+
+# Caps on list lengths rendered from the AI analysis
+_MAX_AFFECTED = 5
+_MAX_RECS = 10
+
+_PRIORITY_EMOJI = {
+    'IMMEDIATE': '🔥',
+    'HIGH': '⚠️',
+    'MEDIUM': 'ℹ️',
+    'LOW': '💡',
+}
+
+
+def _fmt_val(v) -> str:
+    """Format a single metric value for display."""
+    # Format value based on type
+    if isinstance(v, float):
+        return f"{v:.2f}"
+    if isinstance(v, int):
+        return f"{v:,}"
+    return str(v)
 
 
 class ReportAgent:
@@ -53,31 +101,99 @@ class ReportAgent:
         Returns:
             str: Formatted Telegram message (markdown)
         """
+        # Bind state fields once
         all_results = state.get('all_results', [])
         issues = state.get('issues', [])
         analysis = state.get('root_cause_analysis', {})
+        status_counts = state.get('status_counts')
+        issues_by_status = state.get('issues_by_status')
+        results_by_collector = state.get('results_by_collector')
+        execution_start = state.get('execution_start')
+        token_usage = state.get('token_usage', {}).get('total', 0)
+        errors = state.get('errors', ())
 
         self.logger.info(f"Generating report: {len(all_results)} total checks, {len(issues)} issues")
 
-        # Build report sections
-        report = self._build_header(all_results, issues)
-        report += "\n" + self._build_summary_section(all_results)
+        # Bin issues by severity once for header and issues section
+        # (prebuilt by the workflow when available)
+        if issues_by_status is not None:
+            partitioned = tuple(issues_by_status.get(status, []) for status in ISSUE_STATUSES)
+        else:
+            partitioned = self._partition_by_status(issues)
+
+        if status_counts is None:
+            status_counts = Counter(issue.status for issue in issues)
+
+        if results_by_collector is None:
+            results_by_collector = self._group_by_collector(all_results)
+
+        # Read the clock once for header timestamp and footer duration
+        now = time.time()
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(now))
+
+        # Build report sections and join once
+        sections = [
+            self._build_header(all_results, issues, status_counts, timestamp),
+            self._build_summary_section(results_by_collector),
+        ]
 
         if issues:
-            report += "\n" + self._build_issues_section(issues)
-            report += "\n" + self._build_analysis_section(analysis)
+            sections.append(self._build_issues_section(partitioned))
+            sections.append(self._build_analysis_section(analysis))
+
+        duration = now - execution_start if execution_start is not None else 0.0
+        sections.append(self._build_footer(duration, token_usage, errors))
 
-        report += "\n" + self._build_footer(state)
+        return "\n".join(sections)
 
-        return report
+    @staticmethod
+    def _partition_by_status(
+        issues: List[CollectorResult]
+    ) -> Tuple[List[CollectorResult], List[CollectorResult], List[CollectorResult]]:
+        """
+        Split issues into RED, YELLOW and UNKNOWN lists in a single pass.
 
-    def _build_header(self, all_results: List[CollectorResult], issues: List[CollectorResult]) -> str:
+        Args:
+            issues: Non-GREEN results
+
+        Returns:
+            Tuple of (red, yellow, unknown) issue lists, each in original order
+        """
+        buckets = {
+            HealthStatus.RED: [],
+            HealthStatus.YELLOW: [],
+            HealthStatus.UNKNOWN: [],
+        }
+        for issue in issues:
+            bucket = buckets.get(issue.status)
+            if bucket is not None:
+                bucket.append(issue)
+
+        return buckets[HealthStatus.RED], buckets[HealthStatus.YELLOW], buckets[HealthStatus.UNKNOWN]
+
+    @staticmethod
+    def _group_by_collector(all_results: List[CollectorResult]) -> Dict[str, List[CollectorResult]]:
+        """Group results by collector name, preserving order within each group."""
+        by_collector: Dict[str, List[CollectorResult]] = {}
+        for result in all_results:
+            by_collector.setdefault(result.collector_name, []).append(result)
+        return by_collector
+
+    def _build_header(
+        self,
+        all_results: List[CollectorResult],
+        issues: List[CollectorResult],
+        status_counts: Dict[HealthStatus, int],
+        timestamp: str
+    ) -> str:
         """
         Build report header with overall status.
 
         Args:
             all_results: All check results
             issues: Only RED/YELLOW results
+            status_counts: Result count per status
+            timestamp: Formatted report time (UTC)
 
         Returns:
             str: Formatted header
@@ -86,8 +202,8 @@ class ReportAgent:
         passed = total - len(issues)
 
         # Count by severity
-        red_count = len([i for i in issues if i.status == HealthStatus.RED])
-        yellow_count = len([i for i in issues if i.status == HealthStatus.YELLOW])
+        red_count = status_counts.get(HealthStatus.RED, 0)
+        yellow_count = status_counts.get(HealthStatus.YELLOW, 0)
 
         # Determine overall status
         if red_count > 0:
@@ -100,112 +216,98 @@ class ReportAgent:
             overall_emoji = "🟢"
             overall_status = "All Systems Healthy"
 
-        # Format timestamp
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
-
-        header = f"""{overall_emoji} **Infrastructure Health Report**
-📅 {timestamp}
-
-📊 **Overall Status**: {overall_status}
-✅ {passed}/{total} checks passed
-"""
+        parts = [_HEADER_TMPL({
+            "emoji": overall_emoji,
+            "ts": timestamp,
+            "status": overall_status,
+            "passed": passed,
+            "total": total,
+        })]
 
         if red_count > 0:
-            header += f"🔴 {red_count} critical issue(s)\n"
+            parts.append(f"🔴 {red_count} critical issue(s)\n")
         if yellow_count > 0:
-            header += f"🟡 {yellow_count} warning(s)\n"
+            parts.append(f"🟡 {yellow_count} warning(s)\n")
 
-        header += "\n━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        parts.append("\n")
+        parts.append(_SEP)
 
-        return header
+        return "".join(parts)
 
-    def _build_summary_section(self, all_results: List[CollectorResult]) -> str:
+    def _build_summary_section(self, results_by_collector: Dict[str, List[CollectorResult]]) -> str:
         """
         Build summary section grouped by collector type.
 
         Args:
-            all_results: All check results
+            results_by_collector: All check results grouped by collector name
 
         Returns:
             str: Formatted summary
         """
-        # Group by collector type
-        by_collector = {}
-        for result in all_results:
-            by_collector.setdefault(result.collector_name, []).append(result)
-
-        summary = "## 📦 Summary by Type\n\n"
+        parts = [_HDR_SUMMARY]
 
-        for collector_name, results in sorted(by_collector.items()):
-            issues = [r for r in results if r.status != HealthStatus.GREEN]
-            passed = len(results) - len(issues)
+        for collector_name in sorted(results_by_collector):
+            results = results_by_collector[collector_name]
+            statuses = [result.status for result in results]
+            passed = statuses.count(HealthStatus.GREEN)
+            status_emoji = STATUS_EMOJI[worst_status(statuses)]
 
-            # Determine worst status for this collector
-            if issues:
-                worst_status = min(
-                    issues,
-                    key=lambda x: ['green', 'yellow', 'red', 'unknown'].index(x.status.value)
-                ).status
-                status_emoji = worst_status.to_emoji()
-            else:
-                status_emoji = "🟢"
+            parts.append(f"{status_emoji} **{collector_name.upper()}**: {passed}/{len(results)} healthy\n")
 
-            summary += f"{status_emoji} **{collector_name.upper()}**: {passed}/{len(results)} healthy\n"
+        return "".join(parts)
 
-        return summary
-
-    def _build_issues_section(self, issues: List[CollectorResult]) -> str:
+    def _build_issues_section(
+        self,
+        partitioned: Tuple[List[CollectorResult], List[CollectorResult], List[CollectorResult]]
+    ) -> str:
         """
         Build detailed issues section.
 
         Args:
-            issues: List of RED/YELLOW results
+            partitioned: (red, yellow, unknown) issues from _partition_by_status
 
         Returns:
             str: Formatted issues section
         """
-        section = "\n━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        section += "## 🚨 Issues Detected\n\n"
+        parts = ["\n", _SEP, _HDR_ISSUES]
 
-        # Group by severity
-        red_issues = [i for i in issues if i.status == HealthStatus.RED]
-        yellow_issues = [i for i in issues if i.status == HealthStatus.YELLOW]
-        unknown_issues = [i for i in issues if i.status == HealthStatus.UNKNOWN]
+        # Grouped by severity
+        red_issues, yellow_issues, unknown_issues = partitioned
 
         # Critical issues
         if red_issues:
-            section += "### 🔴 Critical Issues\n\n"
+            parts.append(_HDR_CRITICAL)
             for issue in red_issues:
-                section += f"**{self._escape_markdown(issue.target_name)}** ({issue.collector_name})\n"
-                section += f"└─ {self._escape_markdown(issue.message)}\n"
+                parts.append(f"**{self._escape_markdown(issue.target_name)}** ({issue.collector_name})\n")
+                parts.append(f"└─ {self._escape_markdown(issue.message)}\n")
 
                 if issue.metrics:
                     metrics_str = self._format_metrics(issue.metrics)
-                    section += f"   📊 {metrics_str}\n"
+                    parts.append(f"   📊 {metrics_str}\n")
 
-                section += "\n"
+                parts.append("\n")
 
         # Warnings
         if yellow_issues:
-            section += "### 🟡 Warnings\n\n"
+            parts.append(_HDR_WARNINGS)
             for issue in yellow_issues:
-                section += f"**{self._escape_markdown(issue.target_name)}** ({issue.collector_name})\n"
-                section += f"└─ {self._escape_markdown(issue.message)}\n"
+                parts.append(f"**{self._escape_markdown(issue.target_name)}** ({issue.collector_name})\n")
+                parts.append(f"└─ {self._escape_markdown(issue.message)}\n")
 
                 if issue.metrics:
                     metrics_str = self._format_metrics(issue.metrics)
-                    section += f"   📊 {metrics_str}\n"
+                    parts.append(f"   📊 {metrics_str}\n")
 
-                section += "\n"
+                parts.append("\n")
 
         # Unknown status
         if unknown_issues:
-            section += "### ⚪ Unknown Status\n\n"
+            parts.append(_HDR_UNKNOWN)
             for issue in unknown_issues:
-                section += f"**{issue.target_name}** ({issue.collector_name})\n"
-                section += f"└─ {issue.message}\n\n"
+                parts.append(f"**{issue.target_name}** ({issue.collector_name})\n")
+                parts.append(f"└─ {issue.message}\n\n")
 
-        return section
+        return "".join(parts)
 
     def _build_analysis_section(self, analysis: Dict) -> str:
         """
@@ -217,85 +319,71 @@ class ReportAgent:
         Returns:
             str: Formatted analysis section
         """
-        section = "━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        section += "## 🤖 AI Analysis\n\n"
+        parts = [_SEP, _HDR_ANALYSIS]
 
         if not analysis or isinstance(analysis, str):
-            section += f"{analysis or 'No analysis available'}\n"
-            return section
+            parts.append(f"{analysis or 'No analysis available'}\n")
+            return "".join(parts)
 
         # Root cause
         root_cause = analysis.get('root_cause', 'Unknown')
         severity = analysis.get('severity', 'unknown').upper()
 
-        section += f"**Root Cause**: {self._escape_markdown(root_cause)}\n"
-        section += f"**Severity**: {severity}\n\n"
+        parts.append(f"**Root Cause**: {self._escape_markdown(root_cause)}\n")
+        parts.append(f"**Severity**: {severity}\n\n")
 
         # Affected systems
         affected = analysis.get('affected_systems', [])
         if affected:
-            section += f"**Affected Systems**: {', '.join(affected[:5])}\n"
-            if len(affected) > 5:
-                section += f"   ... and {len(affected) - 5} more\n"
-            section += "\n"
+            parts.append(f"**Affected Systems**: {', '.join(affected[:_MAX_AFFECTED])}\n")
+            if len(affected) > _MAX_AFFECTED:
+                parts.append(f"   ... and {len(affected) - _MAX_AFFECTED} more\n")
+            parts.append("\n")
 
         # Recommendations
         recommendations = analysis.get('recommendations', [])
         if recommendations:
-            section += "**Recommended Actions**:\n\n"
+            parts.append(_HDR_ACTIONS)
 
-            for i, rec in enumerate(recommendations, 1):
+            for i, rec in enumerate(recommendations[:_MAX_RECS], 1):
                 priority = rec.get('priority', 'medium').upper()
                 action = rec.get('action', 'No action specified')
                 rationale = rec.get('rationale', '')
 
-                # Priority emoji
-                priority_emoji = {
-                    'IMMEDIATE': '🔥',
-                    'HIGH': '⚠️',
-                    'MEDIUM': 'ℹ️',
-                    'LOW': '💡'
-                }.get(priority, 'ℹ️')
+                priority_emoji = _PRIORITY_EMOJI.get(priority, 'ℹ️')
 
-                section += f"{i}. {priority_emoji} **[{priority}]** {self._escape_markdown(action)}\n"
+                parts.append(f"{i}. {priority_emoji} **[{priority}]** {self._escape_markdown(action)}\n")
 
                 if rationale:
-                    section += f"   └─ {self._escape_markdown(rationale)}\n"
+                    parts.append(f"   └─ {self._escape_markdown(rationale)}\n")
+
+                parts.append("\n")
 
-                section += "\n"
+            if len(recommendations) > _MAX_RECS:
+                parts.append(f"... and {len(recommendations) - _MAX_RECS} more\n")
 
-        return section
+        return "".join(parts)
 
-    def _build_footer(self, state: MonitoringState) -> str:
+    def _build_footer(self, duration: float, token_usage: int, errors: List[str]) -> str:
         """
         Build footer with execution metadata.
 
         Args:
-            state: MonitoringState with execution metadata
+            duration: Execution time in seconds
+            token_usage: Total LLM tokens used
+            errors: Errors collected during the cycle
 
         Returns:
             str: Formatted footer
         """
-        # Calculate execution time
-        execution_start = state.get('execution_start', time.time())
-        duration = time.time() - execution_start
-
-        # Get token usage
-        token_usage = state.get('token_usage', 0)
-
-        # Get errors
-        errors = state.get('errors', [])
-
-        footer = "━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        footer += f"⏱ **Execution time**: {duration:.1f}s\n"
-        footer += f"🔤 **LLM tokens used**: {token_usage:,}\n"
+        parts = [_FOOTER_TMPL({"duration": duration, "tokens": token_usage})]
 
         if errors:
-            footer += f"⚠️ **Errors encountered**: {len(errors)}\n"
+            parts.append(f"⚠️ **Errors encountered**: {len(errors)}\n")
 
-        footer += "\n_Generated by Monitoring AI Agent_"
+        parts.append(_FOOTER_SIGNATURE)
 
-        return footer
+        return "".join(parts)
 
     def _format_metrics(self, metrics: Dict, max_items: int = 3) -> str:
         """
@@ -311,23 +399,16 @@ class ReportAgent:
         if not metrics:
             return "No metrics"
 
-        # Format key-value pairs
-        items = []
-        for k, v in list(metrics.items())[:max_items]:
-            # Format value based on type
-            if isinstance(v, float):
-                formatted_v = f"{v:.2f}"
-            elif isinstance(v, int):
-                formatted_v = f"{v:,}"
-            else:
-                formatted_v = str(v)
-
-            items.append(f"{k}={formatted_v}")
+        # Single metric: no list or join needed
+        if len(metrics) == 1 and max_items >= 1:
+            k, v = next(iter(metrics.items()))
+            return f"{k}={_fmt_val(v)}"
 
-        result = ", ".join(items)
+        # Format key-value pairs, stopping after max_items
+        items = [f"{k}={_fmt_val(v)}" for k, v in islice(metrics.items(), max_items)]
 
         # Add ellipsis if truncated
         if len(metrics) > max_items:
-            result += f", ... ({len(metrics) - max_items} more)"
+            items.append(f"... ({len(metrics) - max_items} more)")
 
-        return result
+        return ", ".join(items)
@@ -1,9 +1,62 @@
 """LangGraph state definition for monitoring workflow."""
 
-from typing import TypedDict, List, Annotated, Optional
+from typing import TypedDict, List, Dict, Annotated, Optional
 import operator
 
 from ..utils.metrics import CollectorResult
+from ..utils.status import HealthStatus
+
+
+# Statuses that count as issues, in report order
+ISSUE_STATUSES = (HealthStatus.RED, HealthStatus.YELLOW, HealthStatus.UNKNOWN)
+
+
+TOKEN_USAGE_KEYS = ("input", "output", "total")
+
+
+def empty_token_usage() -> Dict[str, int]:
+    """Return a zeroed token usage dict."""
+    return dict.fromkeys(TOKEN_USAGE_KEYS, 0)
+
+
+def index_results(all_results: List[CollectorResult]) -> Dict:
+    """
+    Build all result-derived state fields in a single pass.
+
+    Args:
+        all_results: All check results
+
+    Returns:
+        dict: State update with all_results, issues, status_counts,
+              issues_by_status and results_by_collector
+    """
+    status_counts = dict.fromkeys(HealthStatus, 0)
+    issues_by_status = {status: [] for status in ISSUE_STATUSES}
+    results_by_collector: Dict[str, List[CollectorResult]] = {}
+    issues = []
+
+    for result in all_results:
+        status_counts[result.status] += 1
+        results_by_collector.setdefault(result.collector_name, []).append(result)
+        bucket = issues_by_status.get(result.status)
+        if bucket is not None:
+            bucket.append(result)
+            issues.append(result)
+
+    return {
+        "all_results": all_results,
+        "issues": issues,
+        "status_counts": status_counts,
+        "issues_by_status": issues_by_status,
+        "results_by_collector": results_by_collector,
+    }
+
+
+def add_token_usage(left: Optional[Dict[str, int]], right: Optional[Dict[str, int]]) -> Dict[str, int]:
+    """Reducer summing input/output/total token counts across workflow nodes."""
+    left = left or {}
+    right = right or {}
+    return {key: left.get(key, 0) + right.get(key, 0) for key in TOKEN_USAGE_KEYS}
 
 
 class MonitoringState(TypedDict, total=False):
@@ -29,6 +82,11 @@ class MonitoringState(TypedDict, total=False):
     all_results: List[CollectorResult]  # All check results
     issues: List[CollectorResult]  # Only RED/YELLOW status items
 
+    # Precomputed views of all_results (see index_results)
+    status_counts: Dict[HealthStatus, int]  # Result count per status
+    issues_by_status: Dict[HealthStatus, List[CollectorResult]]  # RED/YELLOW/UNKNOWN issues
+    results_by_collector: Dict[str, List[CollectorResult]]  # All results per collector
+
     # AI analysis outputs
     root_cause_analysis: dict  # Structured analysis from Claude
     recommendations: List[dict]  # Actionable recommendations
@@ -38,5 +96,5 @@ class MonitoringState(TypedDict, total=False):
 
     # Metadata
     execution_start: float  # Timestamp when workflow started
-    token_usage: Annotated[int, operator.add]  # Cumulative LLM tokens (auto-sum across nodes)
+    token_usage: Annotated[Dict[str, int], add_token_usage]  # Cumulative LLM tokens {input, output, total} (auto-sum across nodes)
     errors: Annotated[List[str], operator.add]  # Cumulative errors (auto-append across nodes)
@@ -45,6 +45,10 @@ class APICollector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # Thresholds are constant for the collector's lifetime
+        self._timeout_ms = thresholds.get("api_timeout_ms", 5000)
+        self._slow_ms = thresholds.get("api_slow_ms", 2000)
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -70,9 +74,21 @@ class APICollector(BaseCollector):
 
         self.logger.info(f"Checking {len(self.config)} API endpoints")
 
-        # Run all checks concurrently
-        tasks = [self._check_endpoint(endpoint_config) for endpoint_config in self.config]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Bound in-flight checks to keep FD usage and DNS load predictable
+        max_concurrency = min(self.thresholds.get("api_max_concurrency", 32), len(self.config))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # One client for all checks so connections (and TLS sessions) are pooled
+        limits = httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency
+        )
+        async with httpx.AsyncClient(follow_redirects=True, limits=limits) as client:
+            tasks = [
+                self._bounded_check(endpoint_config, semaphore, client)
+                for endpoint_config in self.config
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Handle exceptions from gather
         final_results = []
@@ -93,37 +109,47 @@ class APICollector(BaseCollector):
 
         return final_results
 
+    async def _bounded_check(
+        self,
+        config: APIEndpointConfig,
+        semaphore: asyncio.Semaphore,
+        client: "httpx.AsyncClient"
+    ) -> CollectorResult:
+        """Run _check_endpoint once a concurrency slot is free."""
+        async with semaphore:
+            return await self._check_endpoint(config, client)
+
     @traceable(name="APICollector._check_endpoint")
-    async def _check_endpoint(self, config: APIEndpointConfig) -> CollectorResult:
+    async def _check_endpoint(self, config: APIEndpointConfig, client: "httpx.AsyncClient") -> CollectorResult:
         """
         Check single API endpoint.
 
         Args:
             config: API endpoint configuration
+            client: Shared HTTP client for this collection run
 
         Returns:
             CollectorResult: Health check result
         """
-        start_time = time.time()
+        # Monotonic clock: immune to NTP/wall-clock jumps during the request
+        start = time.perf_counter()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    config.url,
-                    timeout=config.timeout_ms / 1000.0,
-                    follow_redirects=True
-                )
+            response = await client.get(
+                config.url,
+                timeout=config.timeout_ms / 1000.0
+            )
 
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.perf_counter() - start) * 1000.0
 
             # Determine status
             if response.status_code != 200:
                 status = HealthStatus.RED
                 message = f"HTTP {response.status_code}"
-            elif response_time_ms > self.thresholds.get("api_timeout_ms", 5000):
+            elif response_time_ms > self._timeout_ms:
                 status = HealthStatus.RED
                 message = f"Timeout ({response_time_ms:.0f}ms)"
-            elif response_time_ms > self.thresholds.get("api_slow_ms", 2000):
+            elif response_time_ms > self._slow_ms:
                 status = HealthStatus.YELLOW
                 message = f"Slow ({response_time_ms:.0f}ms)"
             else:
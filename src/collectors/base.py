@@ -1,8 +1,10 @@
 """Base collector abstract class for all monitoring collectors."""
 
 from abc import ABC, abstractmethod
-from typing import List, Any, Optional, Dict
+from typing import List, Any, AsyncIterator, Awaitable, Iterable, Optional, Dict, Tuple
+import asyncio
 import logging
+import os
 from functools import wraps
 
 try:
@@ -52,6 +54,9 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release connections held across collect() calls (no-op by default)."""
+
     def _determine_status(
         self,
         metric_name: str,
@@ -91,13 +96,45 @@ class BaseCollector(ABC):
             return HealthStatus.GREEN
 
 
+def _tracing_enabled() -> bool:
+    """Return True when LangSmith tracing is switched on via environment."""
+    return any(
+        os.getenv(var, "").lower() == "true"
+        for var in ("LANGCHAIN_TRACING_V2", "LANGSMITH_TRACING")
+    )
+
+
+async def as_completed_indexed(aws: Iterable[Awaitable]) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield (index, result) pairs as each awaitable finishes.
+
+    Like asyncio.gather(return_exceptions=True), exceptions are yielded in
+    place of results; the index lets callers keep their configured order.
+
+    Args:
+        aws: Awaitables to run concurrently
+
+    Yields:
+        Tuple[int, Any]: Position in aws and its result or exception
+    """
+    async def indexed(i: int, aw: Awaitable) -> Tuple[int, Any]:
+        try:
+            return i, await aw
+        except Exception as e:
+            return i, e
+
+    for next_done in asyncio.as_completed([indexed(i, aw) for i, aw in enumerate(aws)]):
+        yield await next_done
+
+
 def safe_collect(func):
     """
     Decorator to handle collector exceptions gracefully and add LangSmith tracing.
 
     Combines error handling with LangSmith tracing for comprehensive observability.
     When LangSmith is enabled, each collector's execution will appear as a nested
-    trace within the aggregate node.
+    trace within the aggregate node. When tracing is disabled at decoration time,
+    the traceable layer is skipped entirely.
 
     Args:
         func: Collector method to wrap
@@ -105,8 +142,6 @@ def safe_collect(func):
     Returns:
         Wrapped function that catches exceptions and traces execution
     """
-    @wraps(func)
-    @traceable
     async def wrapper(self, *args, **kwargs):
         try:
             return await func(self, *args, **kwargs)
@@ -121,4 +156,8 @@ def safe_collect(func):
                 message=f"Collection error: {safe_msg}",
                 error=safe_msg
             )]
+
+    wrapper = wraps(func)(wrapper)
+    if _tracing_enabled():
+        wrapper = wraps(func)(traceable(wrapper))
     return wrapper
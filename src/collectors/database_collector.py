@@ -1,20 +1,30 @@
 """PostgreSQL database health check collector."""
 
 import os
+import ssl
 import asyncio
-from typing import List
+from typing import Dict, List, Optional, Tuple
 import logging
 
 try:
-    import psycopg2
+    import asyncpg
 except ImportError:
-    psycopg2 = None
+    asyncpg = None
 
 from ..config.models import DatabaseConfig
 from ..utils.status import HealthStatus
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
-from .base import BaseCollector, safe_collect
+from .base import BaseCollector, as_completed_indexed, safe_collect
+
+
+# Planner row estimate: a catalog lookup instead of a full table scan
+_ROW_ESTIMATE_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass($1)"
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a PostgreSQL identifier, doubling embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
 
 
 class DatabaseCollector(BaseCollector):
@@ -36,8 +46,14 @@ class DatabaseCollector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
-        if psycopg2 is None:
-            self.logger.warning("psycopg2 not installed, database checks will fail")
+        # Connection pools reused across collect() ticks, keyed by (host, port, database, user)
+        self._pools: Dict[Tuple[str, int, str, str], "asyncpg.Pool"] = {}
+
+        # (POSTGRES_USER, POSTGRES_PASSWORD), read from the environment on first use
+        self._credentials: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+        if asyncpg is None:
+            self.logger.warning("asyncpg not installed, database checks will fail")
 
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
@@ -51,132 +67,220 @@ class DatabaseCollector(BaseCollector):
             self.logger.info("No databases configured")
             return []
 
-        if psycopg2 is None:
+        if asyncpg is None:
             return [CollectorResult(
                 collector_name="database",
                 target_name="all",
                 status=HealthStatus.UNKNOWN,
                 metrics={},
-                message="psycopg2 library not installed",
-                error="ImportError: psycopg2"
+                message="asyncpg library not installed",
+                error="ImportError: asyncpg"
             )]
 
         self.logger.info(f"Checking {len(self.config)} database(s)")
 
-        # Run all checks concurrently (using asyncio for consistency)
-        tasks = [self._check_database_async(db_config) for db_config in self.config]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Bound concurrent connects/queries so many databases don't open all at once
+        semaphore = asyncio.Semaphore(min(self.thresholds.get("db_max_concurrency", 4), len(self.config)))
 
-        # Handle exceptions from gather
-        final_results = []
-        for i, result in enumerate(results):
+        # Run all checks concurrently on the event loop, handling each as it finishes
+        tasks = [self._bounded_check(db_config, semaphore) for db_config in self.config]
+        final_results: List[Optional[CollectorResult]] = [None] * len(self.config)
+        async for i, result in as_completed_indexed(tasks):
             if isinstance(result, Exception):
-                db_name = f"{self.config[i].host}/{self.config[i].database}" if i < len(self.config) else "unknown"
+                db_name = f"{self.config[i].host}/{self.config[i].database}"
                 self.logger.error(f"Database check failed for {db_name}: {result}")
-                final_results.append(CollectorResult(
+                final_results[i] = CollectorResult(
                     collector_name="database",
                     target_name=db_name,
                     status=HealthStatus.UNKNOWN,
                     metrics={},
                     message=f"Check failed: {str(result)}",
                     error=str(result)
-                ))
+                )
             else:
-                final_results.append(result)
+                final_results[i] = result
 
         return final_results
 
-    async def _check_database_async(self, config: DatabaseConfig) -> CollectorResult:
+    async def _bounded_check(self, config: DatabaseConfig, semaphore: asyncio.Semaphore) -> CollectorResult:
+        """Run _check_database once a concurrency slot is free."""
+        async with semaphore:
+            return await self._check_database(config)
+
+    async def close(self) -> None:
+        """Close all cached connection pools."""
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            try:
+                await pool.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing database pool: {e}")
+
+    async def _get_pool(self, config: DatabaseConfig, username: str, password: str) -> "asyncpg.Pool":
         """
-        Async wrapper for database check (runs in thread pool).
+        Return the cached pool for a database, creating it on first use.
 
         Args:
             config: Database configuration
+            username: Database user
+            password: Database password
 
         Returns:
-            CollectorResult: Database health check result
+            asyncpg.Pool: Connection pool for the database
+        """
+        key = self._pool_key(config, username)
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        pool = await asyncpg.create_pool(
+            host=config.host,
+            port=config.port,
+            database=config.database,
+            user=username,
+            password=password,
+            ssl=self._ssl_param(config),
+            min_size=1,
+            max_size=2,
+            timeout=10,
+            command_timeout=10,
+            # Keep idle connections between ticks; staleness is handled on use
+            max_inactive_connection_lifetime=0,
+            server_settings=self._server_settings(config)
+        )
+
+        # Another check for the same database may have won the race
+        existing = self._pools.setdefault(key, pool)
+        if existing is not pool:
+            await pool.close()
+        return existing
+
+    def _discard_pool(self, key: Tuple[str, int, str, str]) -> None:
+        """Drop a cached pool whose connections are no longer usable."""
+        pool = self._pools.pop(key, None)
+        if pool is not None:
+            pool.terminate()
+
+    def _get_credentials(self) -> Tuple[Optional[str], Optional[str]]:
         """
-        # Run blocking DB call in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._check_database, config)
+        Return database credentials, reading the environment only once.
 
-    def _check_database(self, config: DatabaseConfig) -> CollectorResult:
+        The environment doesn't change while the process runs, so missing
+        credentials are logged once here rather than on every check.
+
+        Returns:
+            Tuple of (username, password); either may be None if unset
         """
-        Check single database connection.
+        if self._credentials is None:
+            self._credentials = (os.getenv('POSTGRES_USER'), os.getenv('POSTGRES_PASSWORD'))
+            if not all(self._credentials):
+                self.logger.warning("POSTGRES_USER or POSTGRES_PASSWORD not set, database checks will fail")
+        return self._credentials
+
+    @staticmethod
+    def _pool_key(config: DatabaseConfig, username: str) -> Tuple[str, int, str, str]:
+        """Return the pool cache key for a database and user."""
+        return (config.host, config.port, config.database, username)
+
+    @staticmethod
+    def _server_settings(config: DatabaseConfig) -> Dict[str, str]:
+        """
+        Session settings sent at connect time so a blocked server can't stall a check.
 
         Args:
             config: Database configuration
 
         Returns:
-            CollectorResult: Database health check result
+            dict: PostgreSQL run-time parameters for each pooled connection
         """
-        target_name = f"{config.host}/{config.database}"
+        return {
+            "statement_timeout": str(config.statement_timeout_ms),
+            "lock_timeout": str(config.lock_timeout_ms),
+            "idle_in_transaction_session_timeout": str(config.statement_timeout_ms),
+        }
+
+    @staticmethod
+    def _ssl_param(config: DatabaseConfig):
+        """
+        Translate libpq-style SSL settings into an asyncpg ssl argument.
 
-        try:
-            # Get credentials from environment
-            username = os.getenv('POSTGRES_USER')
-            password = os.getenv('POSTGRES_PASSWORD')
+        Args:
+            config: Database configuration
 
-            if not username or not password:
-                return CollectorResult(
-                    collector_name="database",
-                    target_name=target_name,
-                    status=HealthStatus.UNKNOWN,
-                    metrics={},
-                    message="Missing POSTGRES_USER or POSTGRES_PASSWORD environment variables",
-                    error="Missing credentials"
-                )
+        Returns:
+            ssl.SSLContext when a root certificate is configured, else the sslmode string
+        """
+        if not config.sslrootcert or config.ssl_mode in ("disable", "allow", "prefer"):
+            return config.ssl_mode
 
-            # Attempt connection
-            conn_params = {
-                'host': config.host,
-                'port': config.port,
-                'database': config.database,
-                'user': username,
-                'password': password,
-                'sslmode': config.ssl_mode,
-                'connect_timeout': 10
-            }
+        # libpq verifies the server certificate whenever a root certificate is supplied
+        ctx = ssl.create_default_context(cafile=config.sslrootcert)
+        ctx.check_hostname = config.ssl_mode == "verify-full"
+        return ctx
 
-            # Add SSL root certificate if specified
-            if config.sslrootcert:
-                conn_params['sslrootcert'] = config.sslrootcert
+    async def _check_database(self, config: DatabaseConfig) -> CollectorResult:
+        """
+        Check single database connection.
 
-            conn = psycopg2.connect(**conn_params)
+        Args:
+            config: Database configuration
 
-            cursor = conn.cursor()
+        Returns:
+            CollectorResult: Database health check result
+        """
+        target_name = f"{config.host}/{config.database}"
 
-            # Get database version
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
+        # Get credentials from environment (cached after the first check)
+        username, password = self._get_credentials()
 
-            metrics = {
-                "version": version.split(',')[0] if ',' in version else version[:100],
-                "host": config.host,
-                "port": config.port,
-                "database": config.database
-            }
+        if not username or not password:
+            return CollectorResult(
+                collector_name="database",
+                target_name=target_name,
+                status=HealthStatus.UNKNOWN,
+                metrics={},
+                message="Missing POSTGRES_USER or POSTGRES_PASSWORD environment variables",
+                error="Missing credentials"
+            )
 
-            # Optional: query table statistics
-            if config.table:
-                try:
-                    # Use parameterized query to prevent SQL injection
-                    cursor.execute(
-                        f"SELECT COUNT(*) FROM {psycopg2.extensions.quote_ident(config.table, conn)};"
-                    )
-                    count = cursor.fetchone()[0]
-                    metrics["row_count"] = count
-                    metrics["table"] = config.table
-                except Exception as e:
-                    self.logger.warning(f"Failed to query table {config.table}: {e}")
-                    metrics["table_query_error"] = type(e).__name__
+        # Attempt connection (reuses the pooled connection after the first tick)
+        key = self._pool_key(config, username)
+        reused = key in self._pools
+        try:
+            pool = await self._get_pool(config, username, password)
+        except Exception as e:
+            self.logger.error(f"Database connection failed for {target_name}: {e}")
+            safe_msg = sanitize_error(e)
+            return CollectorResult(
+                collector_name="database",
+                target_name=target_name,
+                status=HealthStatus.RED,
+                metrics={},
+                message=f"Connection failed: {safe_msg}",
+                error=safe_msg
+            )
 
-            cursor.close()
-            conn.close()
+        try:
+            try:
+                metrics = await self._query_database(pool, config)
+            except (OSError, asyncpg.InterfaceError) as e:
+                if not reused:
+                    raise
+                # Pooled connection went stale between ticks (server restart,
+                # dropped idle TCP): rebuild the pool once and retry
+                self.logger.info(f"Reconnecting to {target_name}: {e}")
+                self._discard_pool(key)
+                pool = await self._get_pool(config, username, password)
+                metrics = await self._query_database(pool, config)
 
             message = f"Connected successfully"
             if config.table and "row_count" in metrics:
-                message += f", table {config.table}: {metrics['row_count']} rows"
+                if metrics["row_count"] is None:
+                    message += f", table {config.table}: row count unknown (never analyzed)"
+                else:
+                    approx = "~" if metrics.get("row_count_estimated") else ""
+                    message += f", table {config.table}: {approx}{metrics['row_count']} rows"
 
             return CollectorResult(
                 collector_name="database",
@@ -186,7 +290,7 @@ class DatabaseCollector(BaseCollector):
                 message=message
             )
 
-        except psycopg2.OperationalError as e:
+        except (OSError, asyncio.TimeoutError, asyncpg.InterfaceError) as e:
             self.logger.error(f"Database connection failed for {target_name}: {e}")
             safe_msg = sanitize_error(e)
             return CollectorResult(
@@ -198,7 +302,7 @@ class DatabaseCollector(BaseCollector):
                 error=safe_msg
             )
 
-        except psycopg2.Error as e:
+        except asyncpg.PostgresError as e:
             self.logger.error(f"Database error for {target_name}: {e}")
             safe_msg = sanitize_error(e)
             return CollectorResult(
@@ -221,3 +325,54 @@ class DatabaseCollector(BaseCollector):
                 message=f"Unexpected error: {safe_msg}",
                 error=safe_msg
             )
+
+    async def _query_database(self, pool: "asyncpg.Pool", config: DatabaseConfig) -> Dict:
+        """
+        Run the health queries on a pooled connection.
+
+        Args:
+            pool: Connection pool for the database
+            config: Database configuration
+
+        Returns:
+            dict: Collected metrics
+        """
+        async with pool.acquire() as conn:
+            # Get database version
+            version = await conn.fetchval("SELECT version()")
+
+            metrics = {
+                "version": version.split(',')[0] if ',' in version else version[:100],
+                "host": config.host,
+                "port": config.port,
+                "database": config.database
+            }
+
+            # Optional: query table statistics
+            if config.table:
+                try:
+                    if config.exact_count:
+                        metrics["row_count"] = await conn.fetchval(
+                            f"SELECT COUNT(*) FROM {_quote_ident(config.table)}"
+                        )
+                    else:
+                        count = await conn.fetchval(_ROW_ESTIMATE_QUERY, _quote_ident(config.table))
+                        if count is None:
+                            # to_regclass() resolved nothing: no scan needed to know that
+                            self.logger.warning(f"Table {config.table} not found")
+                            metrics["table_query_error"] = "UndefinedTableError"
+                            return metrics
+                        if count < 0:
+                            # Never analyzed (reltuples = -1): no estimate, and no full
+                            # scan unless exact_count asks for one
+                            metrics["row_count"] = None
+                            metrics["row_count_note"] = "never analyzed"
+                        else:
+                            metrics["row_count"] = count
+                            metrics["row_count_estimated"] = True
+                    metrics["table"] = config.table
+                except Exception as e:
+                    self.logger.warning(f"Failed to query table {config.table}: {e}")
+                    metrics["table_query_error"] = type(e).__name__
+
+        return metrics
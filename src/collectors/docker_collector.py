@@ -2,17 +2,74 @@
 
 import json
 import asyncio
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config.models import VPSServerConfig
 from ..utils.status import HealthStatus
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
-from .base import BaseCollector, safe_collect
+from .base import BaseCollector, as_completed_indexed, safe_collect
 from .ssh_helper import SSHHelper
 
 
+# Keepalive interval for SSH connections held open between ticks
+_SSH_KEEPALIVE_SECONDS = 30
+
+# Cap on docker inspect output kept in memory (roughly 10k containers' worth of lines)
+_DOCKER_INSPECT_MAX_BYTES = 4 * 1024 * 1024
+
+# Upper bound on concurrent SSH sessions run from the collector's thread pool
+_MAX_WORKERS = 16
+
+# One remote exec: inspect every container and emit only the fields we classify on,
+# one JSON object per line (a narrow template keeps env/config out of the output)
+_DOCKER_INSPECT_CMD = (
+    "docker ps -aq --no-trunc | xargs -r docker inspect --format "
+    "'{\"ID\":{{json .Id}},\"Name\":{{json .Name}},\"Image\":{{json .Config.Image}},"
+    "\"State\":{{json .State.Status}},\"ExitCode\":{{json .State.ExitCode}},"
+    "\"Health\":{{if .State.Health}}{{json .State.Health.Status}}{{else}}null{{end}}}'"
+)
+
+
+def _running_status(container: dict) -> Tuple[HealthStatus, str]:
+    """Classify a running or paused container by its health check."""
+    if container.get('Health') == 'unhealthy':
+        return HealthStatus.RED, "Container unhealthy"
+    # Either explicitly healthy, starting, or no health check configured
+    return HealthStatus.GREEN, "Container running"
+
+
+def _exited_status(container: dict) -> Tuple[HealthStatus, str]:
+    """Classify an exited container by its exit code."""
+    exit_code = container.get('ExitCode')
+    if exit_code == 0:
+        # Exit 0 is clean - common for cron jobs or one-off tasks
+        return HealthStatus.GREEN, f"Container stopped cleanly (exit {exit_code})"
+    if exit_code is not None:
+        return HealthStatus.RED, f"Container exited with error (exit {exit_code})"
+    return HealthStatus.YELLOW, "Container stopped"
+
+
+# Docker State.Status -> classifier returning (status, message)
+_STATE_HANDLERS = {
+    'running': _running_status,
+    'paused': _running_status,
+    'restarting': lambda c: (HealthStatus.YELLOW, "Container restarting"),
+    'exited': _exited_status,
+    'created': lambda c: (HealthStatus.YELLOW, "Container created but not started"),
+    'dead': lambda c: (HealthStatus.RED, "Container in error state"),
+    'removing': lambda c: (HealthStatus.RED, "Container in error state"),
+}
+
+
 class DockerCollector(BaseCollector):
     """Collector for Docker container health checks via SSH."""
 
@@ -32,6 +89,19 @@ class DockerCollector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # SSH connections reused across collect() ticks, keyed by (host, port, username);
+        # each key has a lock so one server's connection is used by one thread at a time
+        self._ssh_clients: Dict[Tuple[str, int, str], object] = {}
+        self._ssh_locks: Dict[Tuple[str, int, str], threading.Lock] = {
+            self._ssh_key(server_config): threading.Lock() for server_config in config
+        }
+
+        # Dedicated pool sized to the server list instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(len(config) or 1, _MAX_WORKERS),
+            thread_name_prefix="docker-collect"
+        )
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -56,46 +126,109 @@ class DockerCollector(BaseCollector):
 
         self.logger.info(f"Checking Docker containers on {len(self.config)} server(s)")
 
-        # Run all checks concurrently
-        tasks = [self._collect_server_async(server_config) for server_config in self.config]
-        results_nested = await asyncio.gather(*tasks, return_exceptions=True)
+        # Bound concurrent SSH sessions to stay under sshd's MaxStartups
+        semaphore = asyncio.Semaphore(min(self.thresholds.get("ssh_max_concurrency", 8), len(self.config)))
 
-        # Flatten results (each server returns multiple containers)
-        final_results = []
-        for i, result in enumerate(results_nested):
+        # Run all checks concurrently, handling each server as it finishes
+        tasks = [self._collect_server_async(server_config, semaphore) for server_config in self.config]
+        per_server: List[List[CollectorResult]] = [[] for _ in self.config]
+        async for i, result in as_completed_indexed(tasks):
             if isinstance(result, Exception):
-                server_name = self.config[i].name if i < len(self.config) else "unknown"
+                server_name = self.config[i].name
                 self.logger.error(f"Docker check failed for {server_name}: {result}")
-                final_results.append(CollectorResult(
+                per_server[i] = [CollectorResult(
                     collector_name="docker",
                     target_name=server_name,
                     status=HealthStatus.UNKNOWN,
                     metrics={},
                     message=f"Check failed: {str(result)}",
                     error=str(result)
-                ))
+                )]
             elif isinstance(result, list):
                 # Server returned multiple container results
-                final_results.extend(result)
+                per_server[i] = result
             else:
                 # Server returned single result (likely error)
-                final_results.append(result)
+                per_server[i] = [result]
+
+        # Flatten in configured server order (each server returns multiple containers)
+        return [result for server_results in per_server for result in server_results]
+
+    async def close(self) -> None:
+        """Close all cached SSH connections and the collector's thread pool."""
+        clients = list(self._ssh_clients.values())
+        self._ssh_clients.clear()
+        for client in clients:
+            SSHHelper.close_client(client, self.logger)
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _ssh_key(config: VPSServerConfig) -> Tuple[str, int, str]:
+        """Return the connection cache key for a server."""
+        return (config.host, config.port, config.username)
+
+    def _run_docker_inspect(self, config: VPSServerConfig) -> str:
+        """
+        Inspect all containers on a server over a cached SSH connection.
+
+        Reconnects once if a connection reused from an earlier tick has
+        dropped. Must be called with the server's lock held.
+
+        Args:
+            config: VPS server configuration
 
-        return final_results
+        Returns:
+            str: docker inspect output, one JSON object per line
+        """
+        key = self._ssh_key(config)
+        client = self._ssh_clients.get(key)
+        reused = client is not None and SSHHelper.is_connected(client)
+
+        if not reused:
+            if client is not None:
+                SSHHelper.close_client(client, self.logger)
+            # Establish SSH connection
+            client = SSHHelper.create_client(config, self.logger, keepalive_interval=_SSH_KEEPALIVE_SECONDS)
+            self._ssh_clients[key] = client
+
+        for attempt in (0, 1):
+            try:
+                # List and inspect all containers in a single exec
+                return SSHHelper.exec_command(
+                    client,
+                    _DOCKER_INSPECT_CMD,
+                    timeout=15,
+                    logger=self.logger,
+                    max_bytes=_DOCKER_INSPECT_MAX_BYTES
+                )
+            except RuntimeError:
+                # Command ran and failed; the connection itself is fine
+                raise
+            except Exception:
+                # Transport-level failure: drop the connection so the next use reconnects
+                self._ssh_clients.pop(key, None)
+                SSHHelper.close_client(client, self.logger)
+                if attempt or not reused:
+                    raise
+                self.logger.info(f"Reconnecting to {config.host}: cached SSH connection dropped")
+                client = SSHHelper.create_client(config, self.logger, keepalive_interval=_SSH_KEEPALIVE_SECONDS)
+                self._ssh_clients[key] = client
 
-    async def _collect_server_async(self, config: VPSServerConfig) -> List[CollectorResult]:
+    async def _collect_server_async(self, config: VPSServerConfig, semaphore: asyncio.Semaphore) -> List[CollectorResult]:
         """
         Async wrapper for Docker container collection.
 
         Args:
             config: VPS server configuration
+            semaphore: Limits SSH sessions in flight
 
         Returns:
             List[CollectorResult]: Container check results from this server
         """
         # Run blocking SSH calls in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._collect_server, config)
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._collect_server, config)
 
     def _collect_server(self, config: VPSServerConfig) -> List[CollectorResult]:
         """
@@ -107,19 +240,10 @@ class DockerCollector(BaseCollector):
         Returns:
             List[CollectorResult]: Container check results
         """
-        client = None
         try:
-            # Establish SSH connection
-            client = SSHHelper.create_client(config, self.logger)
-
-            # Execute docker ps command with JSON format
-            # Format: one JSON object per line
-            docker_output = SSHHelper.exec_command(
-                client,
-                'docker ps -a --format "{{json .}}"',
-                timeout=15,
-                logger=self.logger
-            )
+            # Serialize use of this server's cached connection
+            with self._ssh_locks[self._ssh_key(config)]:
+                docker_output = self._run_docker_inspect(config)
 
             # Parse container list
             containers = self._parse_containers(docker_output)
@@ -135,12 +259,7 @@ class DockerCollector(BaseCollector):
                 )]
 
             # Create result for each container
-            results = []
-            for container in containers:
-                result = self._check_container(container, config)
-                results.append(result)
-
-            return results
+            return [self._check_container(container, config) for container in containers]
 
         except ImportError as e:
             safe_msg = sanitize_error(e)
@@ -165,38 +284,39 @@ class DockerCollector(BaseCollector):
                 error=safe_msg
             )]
 
-        finally:
-            if client:
-                SSHHelper.close_client(client, self.logger)
-
     def _parse_containers(self, docker_output: str) -> List[dict]:
         """
-        Parse docker ps JSON output.
+        Parse docker inspect JSON output.
 
         Args:
-            docker_output: Output from docker ps -a --format "{{json .}}"
+            docker_output: Output from _DOCKER_INSPECT_CMD
 
         Returns:
             List[dict]: Parsed container data
 
         Example output (one JSON per line):
-            {"Command":"nginx -g 'daemon off;'","CreatedAt":"2024-01-15 10:30:45","ID":"abc123","Image":"nginx:latest","Names":"web-server","Ports":"0.0.0.0:80->80/tcp","Status":"Up 2 days"}
-            {"Command":"python app.py","CreatedAt":"2024-01-15 10:30:50","ID":"def456","Image":"python:3.11","Names":"api-server","Ports":"0.0.0.0:8000->8000/tcp","Status":"Up 2 days (healthy)"}
+            {"ID":"abc123...","Name":"/web-server","Image":"nginx:latest","State":"running","ExitCode":0,"Health":null}
+            {"ID":"def456...","Name":"/api-server","Image":"python:3.11","State":"running","ExitCode":0,"Health":"healthy"}
         """
-        containers = []
-        lines = docker_output.strip().split('\n')
+        lines = [line for line in (raw.strip() for raw in docker_output.split('\n')) if line]
+        if not lines:
+            return []
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        if orjson is not None:
+            try:
+                # One C-level parse for the whole output
+                return orjson.loads('[' + ','.join(lines) + ']')
+            except orjson.JSONDecodeError:
+                pass  # A malformed line - parse line by line to skip just that one
 
+        loads = orjson.loads if orjson is not None else json.loads
+        containers = []
+        for line in lines:
             try:
-                container_data = json.loads(line)
-                containers.append(container_data)
-            except json.JSONDecodeError as e:
+                containers.append(loads(line))
+            except ValueError as e:
+                # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
                 self.logger.warning(f"Failed to parse container JSON: {line[:100]} - {e}")
-                continue
 
         return containers
 
@@ -205,75 +325,36 @@ class DockerCollector(BaseCollector):
         Check single container health.
 
         Args:
-            container: Parsed container data from docker ps
+            container: Parsed container data from docker inspect
             server_config: Server configuration
 
         Returns:
             CollectorResult: Container health check result
         """
         container_id = container.get('ID', 'unknown')[:12]  # Short ID
-        container_name = container.get('Names', 'unknown')
-        status_str = container.get('Status', '').lower()
+        container_name = (container.get('Name') or 'unknown').lstrip('/')
+        state = (container.get('State') or '').lower()
+        health = container.get('Health')
         image = container.get('Image', 'unknown')
 
         # Target name: server/container
         target_name = f"{server_config.name}/{container_name}"
 
-        # Determine health status from Status field
+        # Determine health status from docker's structured state
         # Examples:
-        #   "Up 2 days" -> GREEN
-        #   "Up 2 days (healthy)" -> GREEN
-        #   "Up 2 days (unhealthy)" -> RED
-        #   "Restarting (1) 5 seconds ago" -> YELLOW
-        #   "Exited (0) 2 hours ago" -> YELLOW
-        #   "Exited (1) 2 hours ago" -> RED
-        #   "Created" -> YELLOW
-
-        if 'up' in status_str:
-            if '(unhealthy)' in status_str:
-                status = HealthStatus.RED
-                message = "Container unhealthy"
-            elif '(healthy)' in status_str or 'healthy' not in status_str:
-                # Either explicitly healthy or no health check configured
-                status = HealthStatus.GREEN
-                message = "Container running"
-            else:
-                status = HealthStatus.GREEN
-                message = "Container running"
-
-        elif 'restarting' in status_str:
-            status = HealthStatus.YELLOW
-            message = "Container restarting"
-
-        elif 'exited' in status_str:
-            # Check exit code
-            # Format: "Exited (0) 2 hours ago"
-            import re
-            match = re.search(r'exited \((\d+)\)', status_str)
-            if match:
-                exit_code = int(match.group(1))
-                if exit_code == 0:
-                    # Exit 0 is clean - common for cron jobs or one-off tasks
-                    status = HealthStatus.GREEN
-                    message = f"Container stopped cleanly (exit {exit_code})"
-                else:
-                    status = HealthStatus.RED
-                    message = f"Container exited with error (exit {exit_code})"
-            else:
-                status = HealthStatus.YELLOW
-                message = "Container stopped"
-
-        elif 'created' in status_str:
-            status = HealthStatus.YELLOW
-            message = "Container created but not started"
-
-        elif 'dead' in status_str or 'removing' in status_str:
-            status = HealthStatus.RED
-            message = "Container in error state"
-
+        #   running                    -> GREEN
+        #   running, health=healthy    -> GREEN
+        #   running, health=unhealthy  -> RED
+        #   restarting                 -> YELLOW
+        #   exited, exit code 0        -> GREEN (clean stop, e.g. one-off jobs)
+        #   exited, exit code 1        -> RED
+        #   created                    -> YELLOW
+
+        handler = _STATE_HANDLERS.get(state)
+        if handler is not None:
+            status, message = handler(container)
         else:
-            status = HealthStatus.UNKNOWN
-            message = f"Unknown status: {status_str}"
+            status, message = HealthStatus.UNKNOWN, f"Unknown status: {state}"
 
         return CollectorResult(
             collector_name="docker",
@@ -282,7 +363,7 @@ class DockerCollector(BaseCollector):
             metrics={
                 "container_id": container_id,
                 "image": image,
-                "status": container.get('Status', 'unknown'),
+                "status": f"{state} ({health})" if health else (state or 'unknown'),
                 "host": server_config.host,
                 "server": server_config.name
             },
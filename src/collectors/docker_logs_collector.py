@@ -41,7 +41,10 @@ class DockerLogsCollector(BaseCollector):
 
         self.logger.info(f"Checking Docker logs on {len(self.config)} target(s)")
 
-        tasks = [self._collect_target_async(target) for target in self.config]
+        # Bound concurrent SSH sessions to stay under sshd's MaxStartups
+        semaphore = asyncio.Semaphore(min(self.thresholds.get("ssh_max_concurrency", 8), len(self.config)))
+
+        tasks = [self._collect_target_async(target, semaphore) for target in self.config]
         results_nested = await asyncio.gather(*tasks, return_exceptions=True)
 
         final_results = []
@@ -64,9 +67,11 @@ class DockerLogsCollector(BaseCollector):
 
         return final_results
 
-    async def _collect_target_async(self, target: DockerLogsTargetConfig) -> List[CollectorResult]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._collect_target, target)
+    async def _collect_target_async(
+        self, target: DockerLogsTargetConfig, semaphore: asyncio.Semaphore
+    ) -> List[CollectorResult]:
+        async with semaphore:
+            return await asyncio.to_thread(self._collect_target, target)
 
     def _collect_target(self, target: DockerLogsTargetConfig) -> List[CollectorResult]:
         client = None
@@ -1,14 +1,20 @@
 """EC2 instance metrics collector via CloudWatch."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 import logging
 
 try:
     import boto3
+    from botocore.config import Config
 except ImportError:
     boto3 = None
+    Config = None
 
 try:
     from langsmith import traceable
@@ -20,10 +26,39 @@ except ImportError:
         return decorator if not args else decorator(args[0])
 
 from ..config.models import EC2InstanceConfig
-from ..utils.status import HealthStatus
+from ..utils.status import HealthStatus, worst_status
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
-from .base import BaseCollector, safe_collect
+from .base import BaseCollector, as_completed_indexed, safe_collect
+
+
+# GetMetricData accepts at most 500 queries per request
+_MAX_METRIC_DATA_QUERIES = 500
+
+# DescribeInstances accepts at most 1000 instance IDs per request
+_MAX_DESCRIBE_INSTANCE_IDS = 1000
+
+# Keep-alive pool and retry settings shared by the cached AWS clients; adaptive
+# mode rate-limits each client and backs off exponentially when throttled
+_CLIENT_CONFIG_KWARGS = {
+    'max_pool_connections': 50,
+    'retries': {'mode': 'adaptive', 'max_attempts': 5},
+}
+
+# Error codes EC2 and CloudWatch return when requests are being throttled
+_THROTTLING_ERROR_CODES = frozenset({'Throttling', 'ThrottlingException', 'RequestLimitExceeded'})
+
+# Upper bound on regions collected concurrently from the collector's thread pool
+_MAX_WORKERS = 16
+
+# How long auto-discovered disk metric dimensions are reused before list_metrics runs again
+_DISK_DIMENSIONS_TTL_SECONDS = 3600
+
+
+def _is_throttling(error: Exception) -> bool:
+    """Return True if a boto3 error means the request was throttled."""
+    response = getattr(error, 'response', None) or {}
+    return response.get('Error', {}).get('Code') in _THROTTLING_ERROR_CODES
 
 
 class EC2Collector(BaseCollector):
@@ -45,6 +80,20 @@ class EC2Collector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # AWS clients reused across collect() ticks, keyed by (service, region)
+        self._clients: Dict[tuple, object] = {}
+        self._clients_lock = threading.Lock()
+
+        # Auto-discovered disk dimensions, keyed by instance ID: (monotonic time, dimensions)
+        self._disk_dim_cache: Dict[str, Tuple[float, List[dict]]] = {}
+
+        # Dedicated pool with one worker per region instead of the loop's default executor
+        regions = {instance_config.region for instance_config in config}
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(len(regions) or 1, _MAX_WORKERS),
+            thread_name_prefix="ec2-collect"
+        )
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -69,61 +118,180 @@ class EC2Collector(BaseCollector):
 
         self.logger.info(f"Checking {len(self.config)} EC2 instance(s)")
 
-        # Run all checks concurrently
-        tasks = [self._collect_instance_async(instance_config) for instance_config in self.config]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions from gather
-        final_results = []
-        for i, result in enumerate(results):
+        # Group instances by region so each region needs one batched call per API
+        by_region: Dict[str, List[EC2InstanceConfig]] = {}
+        for instance_config in self.config:
+            by_region.setdefault(instance_config.region, []).append(instance_config)
+
+        # One metric window end for the whole tick
+        end_time = datetime.now(timezone.utc)
+
+        # Run all regions concurrently (blocking boto3 calls in thread pool)
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(self._executor, self._collect_region, region, configs, end_time)
+            for region, configs in by_region.items()
+        ]
+        region_configs = list(by_region.values())
+
+        # Map results back to instances as each region finishes
+        results_by_config = {}
+        async for i, result in as_completed_indexed(tasks):
+            configs = region_configs[i]
             if isinstance(result, Exception):
-                instance_name = self.config[i].name if i < len(self.config) else "unknown"
-                self.logger.error(f"EC2 check failed for {instance_name}: {result}")
-                final_results.append(CollectorResult(
-                    collector_name="ec2",
-                    target_name=instance_name,
-                    status=HealthStatus.UNKNOWN,
-                    metrics={},
-                    message=f"Check failed: {str(result)}",
-                    error=str(result)
-                ))
+                for instance_config in configs:
+                    self.logger.error(f"EC2 check failed for {instance_config.name}: {result}")
+                    results_by_config[id(instance_config)] = CollectorResult(
+                        collector_name="ec2",
+                        target_name=instance_config.name,
+                        status=HealthStatus.UNKNOWN,
+                        metrics={},
+                        message=f"Check failed: {str(result)}",
+                        error=str(result)
+                    )
             else:
-                final_results.append(result)
+                for instance_config, instance_result in zip(configs, result):
+                    results_by_config[id(instance_config)] = instance_result
+
+        # Preserve configured order
+        return [results_by_config[id(instance_config)] for instance_config in self.config]
+
+    async def close(self) -> None:
+        """Close cached AWS clients and the collector's thread pool."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing AWS client: {e}")
+        self._executor.shutdown(wait=False)
+
+    @traceable(name="EC2Collector._collect_region")
+    def _collect_region(
+        self,
+        region: str,
+        configs: List[EC2InstanceConfig],
+        end_time: datetime
+    ) -> List[CollectorResult]:
+        """
+        Collect metrics for all instances in one region with batched API calls.
 
-        return final_results
+        Args:
+            region: AWS region name
+            configs: EC2 instance configurations in this region
+            end_time: End of the CloudWatch lookback window (UTC)
 
-    async def _collect_instance_async(self, config: EC2InstanceConfig) -> CollectorResult:
+        Returns:
+            List[CollectorResult]: Instance results, aligned with configs
         """
-        Async wrapper for EC2 metrics collection.
+        # Get cached AWS clients
+        ec2_client = self._get_client('ec2', region)
+        cloudwatch_client = self._get_client('cloudwatch', region)
+
+        # Get status for every instance in one call
+        statuses = self._get_instance_statuses(ec2_client, [c.instance_id for c in configs])
+
+        # Get CloudWatch CPU and disk for running instances in one batched call
+        # (last 15 minutes to account for delays)
+        running = [
+            c for c in configs
+            if isinstance(statuses.get(c.instance_id), dict) and statuses[c.instance_id]['state'] == 'running'
+        ]
+        try:
+            cpu_by_instance, disk_used_by_instance = self._get_latest_metrics(
+                cloudwatch_client, running, end_time, minutes=15
+            )
+        except Exception as e:
+            # The batched call already retried; report the region's running
+            # instances as failed instead of fanning out one request per instance
+            self.logger.error(
+                f"Failed to get CloudWatch metrics for {[c.instance_id for c in running]}: {e}"
+            )
+            for config in running:
+                statuses[config.instance_id] = e
+            running = []
+            cpu_by_instance, disk_used_by_instance = {}, {}
+
+        # Disk free %, falling back per instance when the configured dimensions
+        # found nothing (device/fstype have to be auto-discovered)
+        disk_free_by_instance = {}
+        for config in running:
+            if not config.monitor_disk:
+                continue
+            disk_used = disk_used_by_instance.get(config.instance_id)
+            if disk_used is not None:
+                disk_free_by_instance[config.instance_id] = 100.0 - disk_used
+            else:
+                disk_free_by_instance[config.instance_id] = self._get_disk_utilization(
+                    cloudwatch_client,
+                    config.instance_id,
+                    config,
+                    end_time,
+                    minutes=15
+                )
+
+        return [
+            self._build_instance_result(
+                config,
+                statuses.get(config.instance_id),
+                cpu_by_instance.get(config.instance_id),
+                disk_free_by_instance.get(config.instance_id)
+            )
+            for config in configs
+        ]
+
+    def _get_client(self, service: str, region: str):
+        """
+        Return the cached boto3 client for a service and region, creating it on first use.
 
         Args:
-            config: EC2 instance configuration
+            service: AWS service name ('ec2' or 'cloudwatch')
+            region: AWS region name
 
         Returns:
-            CollectorResult: Instance metrics result
+            boto3 client for the service
         """
-        # Run blocking boto3 calls in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._collect_instance, config)
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            # Region workers run in parallel threads; client creation is not thread-safe
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = boto3.client(
+                        service,
+                        region_name=region,
+                        config=Config(**_CLIENT_CONFIG_KWARGS)
+                    )
+                    self._clients[key] = client
+        return client
 
-    @traceable(name="EC2Collector._collect_instance")
-    def _collect_instance(self, config: EC2InstanceConfig) -> CollectorResult:
+    def _build_instance_result(
+        self,
+        config: EC2InstanceConfig,
+        instance_status,
+        cpu_usage: Optional[float],
+        disk_free: Optional[float]
+    ) -> CollectorResult:
         """
-        Collect metrics from single EC2 instance.
+        Build the result for a single EC2 instance.
 
         Args:
             config: EC2 instance configuration
+            instance_status: Status dict from _get_instance_statuses, or the lookup exception
+            cpu_usage: Latest CPU utilization, or None if no data
+            disk_free: Latest disk free percentage, or None if no data or not monitored
 
         Returns:
             CollectorResult: Instance metrics result
         """
         try:
-            # Create AWS clients
-            ec2_client = boto3.client('ec2', region_name=config.region)
-            cloudwatch_client = boto3.client('cloudwatch', region_name=config.region)
-
-            # Get instance status
-            instance_status = self._get_instance_status(ec2_client, config.instance_id)
+            if instance_status is None:
+                raise ValueError(f"Instance {config.instance_id} not found")
+            if isinstance(instance_status, Exception):
+                raise instance_status
 
             # If instance is not running, return early
             if instance_status['state'] != 'running':
@@ -139,23 +307,6 @@ class EC2Collector(BaseCollector):
                     message=f"Instance {instance_status['state']}"
                 )
 
-            # Get CloudWatch metrics (last 15 minutes to account for delays)
-            cpu_usage = self._get_cpu_utilization(
-                cloudwatch_client,
-                config.instance_id,
-                minutes=15
-            )
-
-            # Get disk metrics if monitoring enabled
-            disk_free = None
-            if config.monitor_disk:
-                disk_free = self._get_disk_utilization(
-                    cloudwatch_client,
-                    config.instance_id,
-                    config,
-                    minutes=15
-                )
-
             # Determine status for each metric
             if cpu_usage is not None:
                 cpu_status = self._determine_status("cpu", cpu_usage, higher_is_worse=True)
@@ -178,40 +329,26 @@ class EC2Collector(BaseCollector):
             if disk_status is not None:
                 statuses.append(disk_status)
 
-            if HealthStatus.RED in statuses:
-                overall_status = HealthStatus.RED
-            elif HealthStatus.YELLOW in statuses:
-                overall_status = HealthStatus.YELLOW
-            else:
-                overall_status = HealthStatus.GREEN
+            overall_status = worst_status(statuses)
 
-            # Build metrics dict
+            # Build metrics dict (disk only if monitoring enabled)
             metrics = {
                 "instance_id": config.instance_id,
                 "region": config.region,
                 "state": instance_status['state'],
                 "cpu_usage_pct": round(cpu_usage, 1) if cpu_usage is not None else None,
-                "instance_type": instance_status.get('instance_type', 'unknown')
+                "instance_type": instance_status.get('instance_type', 'unknown'),
+                **({"disk_free_pct": round(disk_free, 1) if disk_free is not None else None}
+                   if config.monitor_disk else {})
             }
 
-            # Add disk metrics if monitoring enabled
-            if config.monitor_disk:
-                metrics["disk_free_pct"] = round(disk_free, 1) if disk_free is not None else None
-
             # Build human-readable message
-            message_parts = []
-            if cpu_usage is not None:
-                message_parts.append(f"CPU: {cpu_usage:.1f}%")
-            else:
-                message_parts.append("CPU: unavailable")
-
-            if config.monitor_disk:
-                if disk_free is not None:
-                    message_parts.append(f"Disk free: {disk_free:.1f}%")
-                else:
-                    message_parts.append("Disk: unavailable")
-
-            message = f"Running, {', '.join(message_parts)}"
+            message_parts = (
+                f"CPU: {cpu_usage:.1f}%" if cpu_usage is not None else "CPU: unavailable",
+                *((f"Disk free: {disk_free:.1f}%" if disk_free is not None else "Disk: unavailable",)
+                  if config.monitor_disk else ())
+            )
+            message = "Running, " + ", ".join(message_parts)
 
             return CollectorResult(
                 collector_name="ec2",
@@ -224,6 +361,16 @@ class EC2Collector(BaseCollector):
         except Exception as e:
             self.logger.error(f"EC2 collection failed for {config.name}: {e}")
             safe_msg = sanitize_error(e)
+            if _is_throttling(e):
+                # Retries ran out under AWS rate limits; says nothing about the instance itself
+                return CollectorResult(
+                    collector_name="ec2",
+                    target_name=config.name,
+                    status=HealthStatus.YELLOW,
+                    metrics={"instance_id": config.instance_id, "region": config.region},
+                    message="AWS API throttled",
+                    error=safe_msg
+                )
             return CollectorResult(
                 collector_name="ec2",
                 target_name=config.name,
@@ -233,102 +380,217 @@ class EC2Collector(BaseCollector):
                 error=safe_msg
             )
 
-    def _get_instance_status(self, ec2_client, instance_id: str) -> dict:
+    def _get_instance_statuses(self, ec2_client, instance_ids: List[str]) -> Dict[str, object]:
         """
-        Get EC2 instance status.
+        Get EC2 instance status for several instances.
 
         Args:
             ec2_client: boto3 EC2 client
-            instance_id: EC2 instance ID
+            instance_ids: EC2 instance IDs
 
         Returns:
-            dict: Instance status information
+            dict: Instance ID to status information; IDs missing from the
+                  response are absent, and IDs whose lookup failed map to
+                  the exception
 
-        Raises:
-            Exception: If instance not found or API error
+        Note:
+            DescribeInstances rejects the whole batch if any ID is invalid, so
+            a failed batch falls back to one call per instance to keep
+            failures isolated. Throttled batches are not split, since one call
+            per instance would only add to the request rate.
         """
-        response = ec2_client.describe_instances(InstanceIds=[instance_id])
-
-        if not response['Reservations']:
-            raise ValueError(f"Instance {instance_id} not found")
-
-        instance = response['Reservations'][0]['Instances'][0]
-
-        return {
-            'state': instance['State']['Name'],  # running, stopped, terminated, etc.
-            'instance_type': instance.get('InstanceType', 'unknown'),
-            'launch_time': instance.get('LaunchTime')
-        }
+        if len(instance_ids) > _MAX_DESCRIBE_INSTANCE_IDS:
+            statuses = {}
+            for offset in range(0, len(instance_ids), _MAX_DESCRIBE_INSTANCE_IDS):
+                statuses.update(self._get_instance_statuses(
+                    ec2_client, instance_ids[offset:offset + _MAX_DESCRIBE_INSTANCE_IDS]
+                ))
+            return statuses
 
-    @traceable(name="EC2Collector._get_cpu_utilization")
-    def _get_cpu_utilization(
+        try:
+            response = ec2_client.describe_instances(InstanceIds=instance_ids)
+        except Exception as e:
+            if len(instance_ids) == 1 or _is_throttling(e):
+                return dict.fromkeys(instance_ids, e)
+            self.logger.warning(f"Batched describe_instances failed ({e}), retrying per instance")
+            statuses = {}
+            for instance_id in instance_ids:
+                statuses.update(self._get_instance_statuses(ec2_client, [instance_id]))
+            return statuses
+
+        statuses = {}
+        for reservation in response['Reservations']:
+            for instance in reservation['Instances']:
+                statuses[instance['InstanceId']] = {
+                    'state': instance['State']['Name'],  # running, stopped, terminated, etc.
+                    'instance_type': instance.get('InstanceType', 'unknown'),
+                    'launch_time': instance.get('LaunchTime')
+                }
+
+        return statuses
+
+    def _get_latest_metrics(
         self,
         cloudwatch_client,
-        instance_id: str,
+        configs: List[EC2InstanceConfig],
+        end_time: datetime,
         minutes: int = 5
-    ) -> Optional[float]:
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
         """
-        Get average CPU utilization from CloudWatch.
+        Get latest CPU and disk usage for several instances in one request.
+
+        CPU is queried for every instance; disk_used_percent only for instances
+        with monitor_disk, using their configured dimensions.
 
         Args:
             cloudwatch_client: boto3 CloudWatch client
-            instance_id: EC2 instance ID
+            configs: Configurations of running EC2 instances
+            end_time: End of the lookback window (UTC)
             minutes: Lookback period in minutes
 
         Returns:
-            Optional[float]: Average CPU utilization percentage, or None if no data
+            tuple: (instance ID to CPU utilization %, instance ID to disk used %);
+                   instances without data are absent
+
+        Raises:
+            Exception: If GetMetricData fails (including throttling)
 
         Note:
             CloudWatch metrics have up to 5 minute delay for basic monitoring
         """
-        try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(minutes=minutes)
+        if not configs:
+            return {}, {}
 
-            response = cloudwatch_client.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='CPUUtilization',
-                Dimensions=[
-                    {
-                        'Name': 'InstanceId',
-                        'Value': instance_id
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5 minutes
-                Statistics=['Average']
-            )
+        start_time = end_time - timedelta(minutes=minutes)
 
-            datapoints = response.get('Datapoints', [])
+        queries = []
+        targets_by_query = {}
+        for i, config in enumerate(configs):
+            queries.append(self._metric_query(
+                f"cpu{i}", 'AWS/EC2', 'CPUUtilization',
+                [{'Name': 'InstanceId', 'Value': config.instance_id}]
+            ))
+            targets_by_query[f"cpu{i}"] = ('cpu', config.instance_id)
 
-            if not datapoints:
-                self.logger.warning(f"No CPU metrics available for {instance_id}")
-                return None
+            if config.monitor_disk:
+                queries.append(self._metric_query(
+                    f"disk{i}", config.disk_namespace, 'disk_used_percent',
+                    self._cached_disk_dimensions(config.instance_id) or self._disk_dimensions(config)
+                ))
+                targets_by_query[f"disk{i}"] = ('disk', config.instance_id)
 
-            # Get most recent datapoint
-            latest = sorted(datapoints, key=lambda x: x['Timestamp'], reverse=True)[0]
-            return latest['Average']
+        latest = {'cpu': {}, 'disk': {}}
+        for values_by_query in self._get_metric_data(cloudwatch_client, queries, start_time, end_time):
+            for query_id, value in values_by_query.items():
+                metric, instance_id = targets_by_query[query_id]
+                latest[metric][instance_id] = value
 
-        except Exception as e:
-            self.logger.error(f"Failed to get CloudWatch metrics for {instance_id}: {e}")
+        for config in configs:
+            if config.instance_id not in latest['cpu']:
+                self.logger.warning(f"No CPU metrics available for {config.instance_id}")
+
+        return latest['cpu'], latest['disk']
+
+    @staticmethod
+    def _metric_query(query_id: str, namespace: str, metric_name: str, dimensions: List[dict]) -> dict:
+        """Build one GetMetricData query for the 5-minute average of a metric."""
+        return {
+            'Id': query_id,
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': namespace,
+                    'MetricName': metric_name,
+                    'Dimensions': dimensions
+                },
+                'Period': 300,  # 5 minutes
+                'Stat': 'Average'
+            },
+            'ReturnData': True
+        }
+
+    @staticmethod
+    def _disk_dimensions(config: EC2InstanceConfig) -> List[dict]:
+        """
+        Build CloudWatch Agent disk metric dimensions from configuration.
+
+        Args:
+            config: EC2 instance configuration
+
+        Returns:
+            list: Dimensions, including device/fstype only when configured
+        """
+        dimensions = [
+            {'Name': 'InstanceId', 'Value': config.instance_id},
+            {'Name': 'path', 'Value': config.disk_path}
+        ]
+        if config.disk_device:
+            dimensions.append({'Name': 'device', 'Value': config.disk_device})
+        if config.disk_fstype:
+            dimensions.append({'Name': 'fstype', 'Value': config.disk_fstype})
+        return dimensions
+
+    def _cached_disk_dimensions(self, instance_id: str) -> Optional[List[dict]]:
+        """Return previously discovered disk dimensions for an instance, or None if absent or expired."""
+        cached = self._disk_dim_cache.get(instance_id)
+        if cached is None or time.monotonic() - cached[0] >= _DISK_DIMENSIONS_TTL_SECONDS:
             return None
+        return cached[1]
+
+    @staticmethod
+    def _get_metric_data(cloudwatch_client, queries: List[dict], start_time: datetime, end_time: datetime):
+        """
+        Run GetMetricData queries, following pagination and the per-call query limit.
+
+        Args:
+            cloudwatch_client: boto3 CloudWatch client
+            queries: MetricDataQueries entries
+            start_time: Window start
+            end_time: Window end
+
+        Yields:
+            dict: Query ID to latest value, per response page
+        """
+        for offset in range(0, len(queries), _MAX_METRIC_DATA_QUERIES):
+            kwargs = {
+                'MetricDataQueries': queries[offset:offset + _MAX_METRIC_DATA_QUERIES],
+                'StartTime': start_time,
+                'EndTime': end_time,
+                'ScanBy': 'TimestampDescending'
+            }
+            while True:
+                response = cloudwatch_client.get_metric_data(**kwargs)
+                # Newest first, so the first value is the most recent datapoint
+                yield {
+                    result['Id']: result['Values'][0]
+                    for result in response.get('MetricDataResults', [])
+                    if result.get('Values')
+                }
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+                kwargs['NextToken'] = next_token
 
-    @traceable(name="EC2Collector._get_disk_utilization")
     def _get_disk_utilization(
         self,
         cloudwatch_client,
         instance_id: str,
         config: EC2InstanceConfig,
+        end_time: datetime,
         minutes: int = 15
     ) -> Optional[float]:
         """
-        Get disk free percentage from CloudWatch Agent metrics.
+        Get disk free percentage from CloudWatch Agent metrics with auto-discovered dimensions.
+
+        Fallback for instances whose configured dimensions returned no data in the
+        batched _get_latest_metrics query: when device or fstype isn't configured,
+        the full dimension set is looked up with list_metrics and queried directly.
+        Discovered dimensions are cached so later ticks query them in the batch.
 
         Args:
             cloudwatch_client: boto3 CloudWatch client
             instance_id: EC2 instance ID
             config: EC2 instance configuration
+            end_time: End of the lookback window (UTC)
             minutes: Lookback period in minutes
 
         Returns:
@@ -345,36 +607,14 @@ class EC2Collector(BaseCollector):
             with threshold logic (disk_free_red: 10, disk_free_yellow: 20).
         """
         try:
-            end_time = datetime.utcnow()
             start_time = end_time - timedelta(minutes=minutes)
+            datapoints = []
 
-            # Build dimensions - only include non-None values
-            dimensions = [
-                {'Name': 'InstanceId', 'Value': instance_id},
-                {'Name': 'path', 'Value': config.disk_path}
-            ]
-
-            # Add optional dimensions if configured
-            if config.disk_device:
-                dimensions.append({'Name': 'device', 'Value': config.disk_device})
-            if config.disk_fstype:
-                dimensions.append({'Name': 'fstype', 'Value': config.disk_fstype})
-
-            # Try with specified dimensions first
-            response = cloudwatch_client.get_metric_statistics(
-                Namespace=config.disk_namespace,
-                MetricName='disk_used_percent',
-                Dimensions=dimensions,
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5 minutes
-                Statistics=['Average']
-            )
-
-            datapoints = response.get('Datapoints', [])
+            # Any cached dimensions just returned no data in the batch, so rediscover
+            self._disk_dim_cache.pop(instance_id, None)
 
-            # If no data and device/fstype not specified, try listing metrics to find them
-            if not datapoints and (not config.disk_device or not config.disk_fstype):
+            # Configured dimensions found nothing; if device/fstype not specified, list metrics to find them
+            if not config.disk_device or not config.disk_fstype:
                 self.logger.info(f"No disk metrics with specified dimensions for {instance_id}, attempting auto-discovery")
 
                 # List available metrics to find device/fstype
@@ -392,8 +632,9 @@ class EC2Collector(BaseCollector):
                     # Use first available metric's dimensions
                     discovered_dimensions = metrics[0]['Dimensions']
                     self.logger.info(f"Auto-discovered disk metric dimensions for {instance_id}: {discovered_dimensions}")
+                    self._disk_dim_cache[instance_id] = (time.monotonic(), discovered_dimensions)
 
-                    # Retry with discovered dimensions
+                    # Query with discovered dimensions
                     response = cloudwatch_client.get_metric_statistics(
                         Namespace=config.disk_namespace,
                         MetricName='disk_used_percent',
@@ -413,7 +654,7 @@ class EC2Collector(BaseCollector):
                 return None
 
             # Get most recent datapoint
-            latest = sorted(datapoints, key=lambda x: x['Timestamp'], reverse=True)[0]
+            latest = max(datapoints, key=itemgetter('Timestamp'))
             disk_used_pct = latest['Average']
 
             # Convert to disk_free_pct for consistency with thresholds
@@ -2,7 +2,13 @@
 
 import asyncio
 import json
-from typing import List
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import logging
 
 try:
@@ -15,11 +21,54 @@ try:
 except ImportError:
     httpx = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config.models import LLMModelConfig
 from ..utils.status import HealthStatus
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
-from .base import BaseCollector, safe_collect
+from .base import BaseCollector, as_completed_indexed, safe_collect
+
+
+# Region used for Bedrock model availability checks
+_BEDROCK_REGION = 'us-east-1'
+
+# Minimal test request (10 tokens max), serialized once
+_BEDROCK_PROBE_BODY = json.dumps({
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 10,
+    "messages": [{"role": "user", "content": "test"}]
+})
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# How long the Bedrock foundation model catalog is trusted before listing it again
+_BEDROCK_CATALOG_TTL_SECONDS = 3600
+
+# Upper bound on Bedrock checks run concurrently from the collector's thread pool
+_MAX_WORKERS = 16
+
+# Connection cap for the per-cycle Azure HTTP client
+_AZURE_MAX_CONNECTIONS = 32
+
+
+@cache
+def _azure_endpoint_info(endpoint: str) -> Tuple[str, str]:
+    """
+    Derive the report name and models URL for an Azure endpoint, once per endpoint.
+
+    Args:
+        endpoint: Azure OpenAI endpoint URL
+
+    Returns:
+        Tuple of (target_name, models_url)
+    """
+    resource = endpoint.split('//')[1].split('.')[0] if '//' in endpoint else 'unknown'
+    models_url = f"{endpoint.rstrip('/')}/openai/models?api-version=2023-05-15"
+    return f"Azure/{resource}", models_url
 
 
 class LLMCollector(BaseCollector):
@@ -41,6 +90,27 @@ class LLMCollector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # AWS clients reused across collect() ticks, keyed by (service, region)
+        self._clients: Dict[tuple, object] = {}
+        self._clients_lock = threading.Lock()
+
+        # Bedrock (ResourceNotFoundException, ThrottlingException), looked up once from the client
+        self._bedrock_errors: Optional[Tuple[type, type]] = None
+
+        # Bedrock foundation model IDs: (monotonic time listed, model IDs)
+        self._bedrock_catalog: Optional[Tuple[float, FrozenSet[str]]] = None
+        self._catalog_lock = threading.Lock()
+
+        # Dedicated pool for blocking Bedrock calls instead of the loop's default executor
+        bedrock_models = sum(1 for model_config in config if model_config.provider.lower() == "bedrock")
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(bedrock_models or 1, _MAX_WORKERS),
+            thread_name_prefix="llm-collect"
+        )
+
+        # AZURE_OPENAI_KEY, read from the environment until it is found
+        self._azure_key: Optional[str] = None
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -55,35 +125,136 @@ class LLMCollector(BaseCollector):
 
         self.logger.info(f"Checking {len(self.config)} LLM model(s)")
 
-        # Run all checks concurrently
-        tasks = [self._check_model(model_config) for model_config in self.config]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions from gather
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                model_name = f"{self.config[i].provider}/{self.config[i].model_id or 'unknown'}" if i < len(self.config) else "unknown"
-                self.logger.error(f"LLM check failed for {model_name}: {result}")
-                final_results.append(CollectorResult(
-                    collector_name="llm",
-                    target_name=model_name,
-                    status=HealthStatus.UNKNOWN,
-                    metrics={},
-                    message=f"Check failed: {str(result)}",
-                    error=str(result)
-                ))
-            else:
-                final_results.append(result)
+        # One client for all Azure checks in this cycle so connections (and TLS
+        # sessions) are pooled; like the API collector, it isn't kept between
+        # cycles, which run hours apart
+        needs_http = httpx is not None and any(
+            model_config.provider.lower() == "azure" for model_config in self.config
+        )
+        http_context = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=_AZURE_MAX_CONNECTIONS,
+                max_keepalive_connections=_AZURE_MAX_CONNECTIONS
+            )
+        ) if needs_http else nullcontext()
+
+        # Run all checks concurrently, handling each as it finishes so a slow
+        # endpoint doesn't hold up the rest
+        final_results: List[Optional[CollectorResult]] = [None] * len(self.config)
+        async with http_context as http_client:
+            tasks = [self._check_model(model_config, http_client) for model_config in self.config]
+            async for i, result in as_completed_indexed(tasks):
+                if isinstance(result, Exception):
+                    model_name = f"{self.config[i].provider}/{self.config[i].model_id or 'unknown'}"
+                    self.logger.error(f"LLM check failed for {model_name}: {result}")
+                    final_results[i] = CollectorResult(
+                        collector_name="llm",
+                        target_name=model_name,
+                        status=HealthStatus.UNKNOWN,
+                        metrics={},
+                        message=f"Check failed: {str(result)}",
+                        error=str(result)
+                    )
+                else:
+                    final_results[i] = result
 
         return final_results
 
-    async def _check_model(self, config: LLMModelConfig) -> CollectorResult:
+    async def close(self) -> None:
+        """Close cached AWS clients and the collector's thread pool."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing AWS client: {e}")
+
+        self._executor.shutdown(wait=False)
+
+    def _get_azure_key(self) -> Optional[str]:
+        """Return AZURE_OPENAI_KEY, reading the environment only until it is set."""
+        if self._azure_key is None:
+            self._azure_key = os.getenv('AZURE_OPENAI_KEY')
+        return self._azure_key
+
+    def _get_bedrock_catalog(self) -> FrozenSet[str]:
+        """
+        Return active, on-demand Bedrock foundation model IDs, listing them at most once per TTL.
+
+        A listing only shows the model exists in the region, not that this
+        account can invoke it (model access may not be granted).
+
+        Returns:
+            frozenset: Model IDs, or an empty set if the catalog can't be listed
+        """
+        with self._catalog_lock:
+            if self._bedrock_catalog is not None:
+                listed_at, model_ids = self._bedrock_catalog
+                if time.monotonic() - listed_at < _BEDROCK_CATALOG_TTL_SECONDS:
+                    return model_ids
+
+            try:
+                response = self._get_client('bedrock', _BEDROCK_REGION).list_foundation_models()
+                # Only models callable on demand by ID; LEGACY models and ones that need an
+                # inference profile fail invoke_model, so they must not skip the invocation
+                model_ids = frozenset(
+                    summary['modelId'] for summary in response.get('modelSummaries', [])
+                    if summary.get('modelLifecycle', {}).get('status') == 'ACTIVE'
+                    and 'ON_DEMAND' in summary.get('inferenceTypesSupported', ())
+                )
+            except Exception as e:
+                # Not cached, so the next tick tries again; checks fall back to invoke_model
+                self.logger.warning(f"Failed to list Bedrock foundation models: {sanitize_error(e)}")
+                return frozenset()
+
+            self._bedrock_catalog = (time.monotonic(), model_ids)
+            return model_ids
+
+    def _get_bedrock_errors(self, client) -> Tuple[type, type]:
+        """Return the Bedrock error classes handled by _invoke_bedrock, resolving them on first use."""
+        if self._bedrock_errors is None:
+            self._bedrock_errors = (
+                client.exceptions.ResourceNotFoundException,
+                client.exceptions.ThrottlingException
+            )
+        return self._bedrock_errors
+
+    def _get_client(self, service: str, region: str):
+        """
+        Return the cached boto3 client for a service and region, creating it on first use.
+
+        Args:
+            service: AWS service name
+            region: AWS region name
+
+        Returns:
+            boto3 client for the service
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            # Bedrock checks run in parallel threads; client creation is not thread-safe
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = boto3.client(service, region_name=region)
+                    self._clients[key] = client
+        return client
+
+    async def _check_model(
+        self,
+        config: LLMModelConfig,
+        http_client: Optional["httpx.AsyncClient"] = None
+    ) -> CollectorResult:
         """
         Check single LLM model availability.
 
         Args:
             config: LLM model configuration
+            http_client: HTTP client for Azure checks, shared within the cycle
 
         Returns:
             CollectorResult: Model availability result
@@ -91,7 +262,7 @@ class LLMCollector(BaseCollector):
         if config.provider.lower() == "bedrock":
             return await self._check_bedrock(config)
         elif config.provider.lower() == "azure":
-            return await self._check_azure(config)
+            return await self._check_azure(config, http_client)
         else:
             return CollectorResult(
                 collector_name="llm",
@@ -126,11 +297,12 @@ class LLMCollector(BaseCollector):
 
         try:
             # Run blocking boto3 call in thread pool
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self._executor,
                 self._invoke_bedrock,
-                config.model_id
+                config.model_id,
+                config.force_full_check
             )
 
             return result
@@ -146,34 +318,47 @@ class LLMCollector(BaseCollector):
                 error=safe_msg
             )
 
-    def _invoke_bedrock(self, model_id: str) -> CollectorResult:
+    def _invoke_bedrock(self, model_id: str, force_full_check: bool = False) -> CollectorResult:
         """
         Invoke Bedrock model (blocking call).
 
+        Models listed in the cached foundation model catalog are reported as
+        available without invoking them, so routine checks don't spend tokens.
+        Models missing from the catalog (e.g. inference profiles) still get a
+        minimal invocation.
+
         Args:
             model_id: Bedrock model ID
+            force_full_check: Invoke the model even if it is listed in the catalog
 
         Returns:
             CollectorResult: Check result
         """
         target_name = f"Bedrock/{model_id}"
 
-        try:
-            client = boto3.client('bedrock-runtime', region_name='us-east-1')
+        if not force_full_check and model_id in self._get_bedrock_catalog():
+            return CollectorResult(
+                collector_name="llm",
+                target_name=target_name,
+                status=HealthStatus.GREEN,
+                metrics={
+                    "model_id": model_id,
+                    "tokens_used": 0,
+                    "provider": "bedrock"
+                },
+                message="Model listed in Bedrock catalog"
+            )
 
-            # Minimal test request (10 tokens max)
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 10,
-                "messages": [{"role": "user", "content": "test"}]
-            }
+        client = self._get_client('bedrock-runtime', _BEDROCK_REGION)
+        not_found_error, throttling_error = self._get_bedrock_errors(client)
 
+        try:
             response = client.invoke_model(
                 modelId=model_id,
-                body=json.dumps(request_body)
+                body=_BEDROCK_PROBE_BODY
             )
 
-            response_body = json.loads(response['body'].read())
+            response_body = _json_loads(response['body'].read())
 
             # Extract token usage
             usage = response_body.get('usage', {})
@@ -191,7 +376,7 @@ class LLMCollector(BaseCollector):
                 message=f"Model accessible ({total_tokens} tokens)"
             )
 
-        except client.exceptions.ResourceNotFoundException:
+        except not_found_error:
             return CollectorResult(
                 collector_name="llm",
                 target_name=target_name,
@@ -201,7 +386,7 @@ class LLMCollector(BaseCollector):
                 error="ResourceNotFoundException"
             )
 
-        except client.exceptions.ThrottlingException:
+        except throttling_error:
             return CollectorResult(
                 collector_name="llm",
                 target_name=target_name,
@@ -222,12 +407,17 @@ class LLMCollector(BaseCollector):
                 error=safe_msg
             )
 
-    async def _check_azure(self, config: LLMModelConfig) -> CollectorResult:
+    async def _check_azure(
+        self,
+        config: LLMModelConfig,
+        http_client: "httpx.AsyncClient"
+    ) -> CollectorResult:
         """
         Check Azure OpenAI model availability.
 
         Args:
             config: LLM model configuration
+            http_client: HTTP client shared by the cycle's Azure checks
 
         Returns:
             CollectorResult: Azure model availability result
@@ -252,11 +442,10 @@ class LLMCollector(BaseCollector):
                 error="Missing endpoint"
             )
 
-        target_name = f"Azure/{config.endpoint.split('//')[1].split('.')[0] if '//' in config.endpoint else 'unknown'}"
+        target_name, models_url = _azure_endpoint_info(config.endpoint)
 
         try:
-            import os
-            api_key = os.getenv('AZURE_OPENAI_KEY')
+            api_key = self._get_azure_key()
 
             if not api_key:
                 return CollectorResult(
@@ -269,40 +458,37 @@ class LLMCollector(BaseCollector):
                 )
 
             # Simple health check to Azure endpoint
-            async with httpx.AsyncClient() as client:
-                # Azure OpenAI typically has a models endpoint we can check
-                models_url = f"{config.endpoint.rstrip('/')}/openai/models?api-version=2023-05-15"
-
-                response = await client.get(
-                    models_url,
-                    headers={"api-key": api_key},
-                    timeout=10.0
-                )
+            # Azure OpenAI typically has a models endpoint we can check
+            response = await http_client.get(
+                models_url,
+                headers={"api-key": api_key},
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    models_data = response.json()
-                    model_count = len(models_data.get('data', []))
+            if response.status_code == 200:
+                models_data = response.json()
+                model_count = len(models_data.get('data', []))
 
-                    return CollectorResult(
-                        collector_name="llm",
-                        target_name=target_name,
-                        status=HealthStatus.GREEN,
-                        metrics={
-                            "endpoint": config.endpoint,
-                            "model_count": model_count,
-                            "provider": "azure"
-                        },
-                        message=f"Endpoint accessible ({model_count} models)"
-                    )
-                else:
-                    return CollectorResult(
-                        collector_name="llm",
-                        target_name=target_name,
-                        status=HealthStatus.RED,
-                        metrics={"endpoint": config.endpoint},
-                        message=f"HTTP {response.status_code}",
-                        error=f"Unexpected status code: {response.status_code}"
-                    )
+                return CollectorResult(
+                    collector_name="llm",
+                    target_name=target_name,
+                    status=HealthStatus.GREEN,
+                    metrics={
+                        "endpoint": config.endpoint,
+                        "model_count": model_count,
+                        "provider": "azure"
+                    },
+                    message=f"Endpoint accessible ({model_count} models)"
+                )
+            else:
+                return CollectorResult(
+                    collector_name="llm",
+                    target_name=target_name,
+                    status=HealthStatus.RED,
+                    metrics={"endpoint": config.endpoint},
+                    message=f"HTTP {response.status_code}",
+                    error=f"Unexpected status code: {response.status_code}"
+                )
 
         except httpx.TimeoutException:
             return CollectorResult(
@@ -1,14 +1,18 @@
 """S3 bucket accessibility checker."""
 
 import asyncio
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import logging
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     boto3 = None
+    Config = None
     ClientError = None
 
 from ..config.models import S3BucketConfig
@@ -18,6 +22,17 @@ from ..utils.sanitize import sanitize_error
 from .base import BaseCollector, safe_collect
 
 
+# Timeout and retry settings shared by the cached S3 clients
+_CLIENT_CONFIG_KWARGS = {
+    'connect_timeout': 3,
+    'read_timeout': 5,
+    'retries': {'mode': 'standard', 'max_attempts': 3},
+}
+
+# Upper bound on buckets checked concurrently from the collector's thread pool
+_MAX_WORKERS = 16
+
+
 class S3Collector(BaseCollector):
     """Collector for S3 bucket accessibility checks."""
 
@@ -37,6 +52,16 @@ class S3Collector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # S3 clients reused across collect() ticks, keyed by region
+        self._clients: Dict[str, object] = {}
+        self._clients_lock = threading.Lock()
+
+        # Dedicated pool sized to the bucket list instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(len(config) or 1, _MAX_WORKERS),
+            thread_name_prefix="s3-collect"
+        )
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -84,6 +109,48 @@ class S3Collector(BaseCollector):
 
         return final_results
 
+    async def close(self) -> None:
+        """Close cached S3 clients and the collector's thread pool."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing S3 client: {e}")
+        self._executor.shutdown(wait=False)
+
+    def _get_client(self, region: str):
+        """
+        Return the cached S3 client for a region, creating it on first use.
+
+        Args:
+            region: AWS region name
+
+        Returns:
+            boto3 S3 client
+        """
+        client = self._clients.get(region)
+        if client is None:
+            # Bucket checks run in parallel threads; client creation is not thread-safe
+            with self._clients_lock:
+                client = self._clients.get(region)
+                if client is None:
+                    client = boto3.client(
+                        's3',
+                        region_name=region,
+                        # Enough keep-alive connections for every bucket to be checked at once
+                        config=Config(max_pool_connections=max(10, len(self.config)), **_CLIENT_CONFIG_KWARGS)
+                    )
+                    self._clients[region] = client
+        return client
+
+    @staticmethod
+    def _header_region(response: dict) -> Optional[str]:
+        """Return the x-amz-bucket-region header of an S3 response or error response, if present."""
+        return response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('x-amz-bucket-region')
+
     async def _check_bucket_async(self, config: S3BucketConfig) -> CollectorResult:
         """
         Async wrapper for S3 bucket check.
@@ -95,13 +162,18 @@ class S3Collector(BaseCollector):
             CollectorResult: Bucket check result
         """
         # Run blocking boto3 calls in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._check_bucket, config)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._check_bucket, config)
 
     def _check_bucket(self, config: S3BucketConfig) -> CollectorResult:
         """
         Check single S3 bucket accessibility.
 
+        One ListObjectsV2 call proves the bucket exists and is listable and
+        reports its region; HeadBucket only runs to tell "not listable" from
+        "no access" after an AccessDenied. deep_check restores the full
+        HeadBucket/GetBucketLocation/ListObjectsV2/GetBucketVersioning sequence.
+
         Args:
             config: S3 bucket configuration
 
@@ -109,97 +181,92 @@ class S3Collector(BaseCollector):
             CollectorResult: Bucket check result
         """
         try:
-            # Create S3 client
-            s3_client = boto3.client('s3', region_name=config.region)
+            s3_client = self._get_client(config.region)
+            head_response = None
 
-            # Check 1: Bucket exists and we have access (head_bucket)
-            try:
-                s3_client.head_bucket(Bucket=config.bucket)
-            except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == '404':
-                    return CollectorResult(
-                        collector_name="s3",
-                        target_name=config.bucket,
-                        status=HealthStatus.RED,
-                        metrics={
-                            "bucket": config.bucket,
-                            "region": config.region
-                        },
-                        message="Bucket not found",
-                        error="NoSuchBucket"
-                    )
-                elif error_code == '403':
-                    return CollectorResult(
-                        collector_name="s3",
-                        target_name=config.bucket,
-                        status=HealthStatus.RED,
-                        metrics={
-                            "bucket": config.bucket,
-                            "region": config.region
-                        },
-                        message="Access denied",
-                        error="Forbidden"
-                    )
-                else:
-                    raise
+            # Deep check: confirm the bucket exists and we have access first
+            if config.deep_check:
+                try:
+                    head_response = s3_client.head_bucket(Bucket=config.bucket)
+                except ClientError as e:
+                    result = self._client_error_result(config, e)
+                    if result is None:
+                        raise
+                    return result
 
-            # Check 2: Get bucket location
-            try:
-                location_response = s3_client.get_bucket_location(Bucket=config.bucket)
-                bucket_region = location_response.get('LocationConstraint') or 'us-east-1'
-            except Exception as e:
-                self.logger.warning(f"Failed to get bucket location for {config.bucket}: {e}")
-                bucket_region = config.region
-
-            # Check 3: List objects (just first page to verify read access)
+            # List objects (first key only) to verify existence and read access
             try:
                 list_response = s3_client.list_objects_v2(
                     Bucket=config.bucket,
                     MaxKeys=1  # Minimal request
                 )
-                object_count = list_response.get('KeyCount', 0)
-                has_contents = object_count > 0
             except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == 'AccessDenied':
-                    # Bucket exists but we can't list objects
-                    return CollectorResult(
-                        collector_name="s3",
-                        target_name=config.bucket,
-                        status=HealthStatus.YELLOW,
-                        metrics={
-                            "bucket": config.bucket,
-                            "region": bucket_region,
-                            "accessible": True,
-                            "listable": False
-                        },
-                        message="Bucket accessible but not listable"
-                    )
-                else:
-                    raise
+                if e.response['Error']['Code'] != 'AccessDenied':
+                    result = self._client_error_result(config, e)
+                    if result is None:
+                        raise
+                    return result
+
+                # Can't list: check whether the bucket itself is reachable
+                if head_response is None:
+                    try:
+                        head_response = s3_client.head_bucket(Bucket=config.bucket)
+                    except ClientError as head_error:
+                        result = self._client_error_result(config, head_error)
+                        if result is None:
+                            raise
+                        return result
+
+                # Bucket exists but we can't list objects
+                return CollectorResult(
+                    collector_name="s3",
+                    target_name=config.bucket,
+                    status=HealthStatus.YELLOW,
+                    metrics={
+                        "bucket": config.bucket,
+                        "region": self._header_region(head_response) or config.region,
+                        "accessible": True,
+                        "listable": False
+                    },
+                    message="Bucket accessible but not listable"
+                )
+
+            # Bucket location - ListObjectsV2 already reports it in a response
+            # header, so GetBucketLocation only runs when asked for
+            bucket_region = self._header_region(list_response) or config.region
+            if config.verify_location or config.deep_check:
+                try:
+                    location_response = s3_client.get_bucket_location(Bucket=config.bucket)
+                    bucket_region = location_response.get('LocationConstraint') or 'us-east-1'
+                except Exception as e:
+                    self.logger.warning(f"Failed to get bucket location for {config.bucket}: {e}")
+
+            metrics = {
+                "bucket": config.bucket,
+                "region": bucket_region,
+                "accessible": True,
+                "listable": True,
+                "has_objects": list_response.get('KeyCount', 0) > 0
+            }
+            message = "Bucket accessible"
 
             # Optional: Get bucket versioning status
-            try:
-                versioning_response = s3_client.get_bucket_versioning(Bucket=config.bucket)
-                versioning_status = versioning_response.get('Status', 'Disabled')
-            except Exception:
-                versioning_status = 'Unknown'
+            if config.include_versioning or config.deep_check:
+                try:
+                    versioning_response = s3_client.get_bucket_versioning(Bucket=config.bucket)
+                    versioning_status = versioning_response.get('Status', 'Disabled')
+                except Exception:
+                    versioning_status = 'Unknown'
+                metrics["versioning"] = versioning_status
+                message += f" (versioning: {versioning_status})"
 
             # Success - bucket is fully accessible
             return CollectorResult(
                 collector_name="s3",
                 target_name=config.bucket,
                 status=HealthStatus.GREEN,
-                metrics={
-                    "bucket": config.bucket,
-                    "region": bucket_region,
-                    "accessible": True,
-                    "listable": True,
-                    "has_objects": has_contents,
-                    "versioning": versioning_status
-                },
-                message=f"Bucket accessible (versioning: {versioning_status})"
+                metrics=metrics,
+                message=message
             )
 
         except ClientError as e:
@@ -223,3 +290,57 @@ class S3Collector(BaseCollector):
                 message=f"Check failed: {safe_msg}",
                 error=safe_msg
             )
+
+    def _client_error_result(self, config: S3BucketConfig, error: "ClientError") -> Optional[CollectorResult]:
+        """
+        Map a bucket-level S3 error to a check result.
+
+        Args:
+            config: S3 bucket configuration
+            error: Error raised by HeadBucket or ListObjectsV2
+
+        Returns:
+            CollectorResult for wrong-region, missing and forbidden buckets,
+            or None if the error isn't one of those
+        """
+        error_code = error.response['Error']['Code']
+        if error_code in ('301', 'PermanentRedirect'):
+            # Bucket lives in another region than configured
+            actual_region = self._header_region(error.response) or "unknown"
+            return CollectorResult(
+                collector_name="s3",
+                target_name=config.bucket,
+                status=HealthStatus.YELLOW,
+                metrics={
+                    "bucket": config.bucket,
+                    "region": actual_region,
+                    "configured_region": config.region
+                },
+                message=f"Bucket is in {actual_region}, configured region is {config.region}",
+                error="PermanentRedirect"
+            )
+        elif error_code in ('404', 'NoSuchBucket'):
+            return CollectorResult(
+                collector_name="s3",
+                target_name=config.bucket,
+                status=HealthStatus.RED,
+                metrics={
+                    "bucket": config.bucket,
+                    "region": config.region
+                },
+                message="Bucket not found",
+                error="NoSuchBucket"
+            )
+        elif error_code in ('403', 'AccessDenied', 'AllAccessDisabled'):
+            return CollectorResult(
+                collector_name="s3",
+                target_name=config.bucket,
+                status=HealthStatus.RED,
+                metrics={
+                    "bucket": config.bucket,
+                    "region": config.region
+                },
+                message="Access denied",
+                error="Forbidden"
+            )
+        return None
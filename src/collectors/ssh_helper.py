@@ -1,27 +1,79 @@
 """Shared SSH utilities for VPS and Docker collectors."""
 
 import logging
+from functools import cache
 from typing import Optional
 
-try:
-    import paramiko
-except ImportError:
-    paramiko = None
-
 from ..config.models import VPSServerConfig
 
 
+# Read size per recv() and default caps on what exec_command keeps in memory
+_RECV_CHUNK_BYTES = 8192
+_MAX_STDOUT_BYTES = 64 * 1024
+_MAX_STDERR_BYTES = 4 * 1024
+
+
+def _read_bounded(recv, limit: int) -> bytes:
+    """
+    Read a channel stream to EOF, keeping at most limit bytes.
+
+    Data past the limit is still drained (and discarded) so the remote
+    command can finish writing and exit.
+
+    Args:
+        recv: Channel read method (recv or recv_stderr)
+        limit: Maximum number of bytes to keep
+
+    Returns:
+        bytes: The first limit bytes of the stream
+    """
+    chunks = []
+    size = 0
+    while True:
+        chunk = recv(_RECV_CHUNK_BYTES)
+        if not chunk:
+            break
+        if size < limit:
+            chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)[:limit]
+
+
+@cache
+def _import_paramiko():
+    """
+    Import paramiko on first use.
+
+    paramiko (and the cryptography stack under it) is only needed when SSH
+    targets are configured, so it is not loaded at module import time.
+
+    Returns:
+        The paramiko module, or None if it is not installed
+    """
+    try:
+        import paramiko
+    except ImportError:
+        return None
+    return paramiko
+
+
 class SSHHelper:
     """Helper class for SSH operations."""
 
     @staticmethod
-    def create_client(config: VPSServerConfig, logger: logging.Logger) -> Optional[object]:
+    def create_client(
+        config: VPSServerConfig,
+        logger: logging.Logger,
+        keepalive_interval: int = 0
+    ) -> Optional[object]:
         """
         Create SSH client with key authentication.
 
         Args:
             config: VPS server configuration
             logger: Logger instance
+            keepalive_interval: Seconds between transport keepalives (0 disables),
+                for clients kept open across monitoring cycles
 
         Returns:
             paramiko.SSHClient or None if paramiko not installed
@@ -29,6 +81,7 @@ class SSHHelper:
         Raises:
             Exception: If connection fails
         """
+        paramiko = _import_paramiko()
         if paramiko is None:
             logger.error("paramiko library not installed")
             raise ImportError("paramiko library required for SSH connections")
@@ -48,6 +101,9 @@ class SSHHelper:
                 banner_timeout=10
             )
 
+            if keepalive_interval:
+                client.get_transport().set_keepalive(keepalive_interval)
+
             logger.debug(f"Successfully connected to {config.host}")
             return client
 
@@ -68,16 +124,21 @@ class SSHHelper:
         client: object,
         command: str,
         timeout: int = 30,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        max_bytes: int = _MAX_STDOUT_BYTES
     ) -> str:
         """
         Execute command on SSH client and return stdout.
 
+        Output is read from the channel as it arrives and truncated to
+        max_bytes (stderr to 4 KiB), so a runaway command can't exhaust memory.
+
         Args:
             client: paramiko.SSHClient instance
             command: Command to execute
             timeout: Command timeout in seconds
             logger: Optional logger instance
+            max_bytes: Maximum stdout bytes returned
 
         Returns:
             str: Command stdout
@@ -91,13 +152,12 @@ class SSHHelper:
 
         try:
             stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+            channel = stdout.channel
 
-            # Wait for command to complete
-            exit_code = stdout.channel.recv_exit_status()
-
-            # Read outputs
-            stdout_data = stdout.read().decode('utf-8', errors='replace')
-            stderr_data = stderr.read().decode('utf-8', errors='replace')
+            # Stream outputs while the command runs, then collect its exit status
+            stdout_data = _read_bounded(channel.recv, max_bytes).decode('utf-8', errors='replace')
+            stderr_data = _read_bounded(channel.recv_stderr, _MAX_STDERR_BYTES).decode('utf-8', errors='replace')
+            exit_code = channel.recv_exit_status()
 
             if exit_code != 0:
                 error_msg = f"Command failed with exit code {exit_code}: {stderr_data.strip()}"
@@ -133,6 +193,20 @@ class SSHHelper:
             if logger:
                 logger.warning(f"Error closing SSH connection: {e}")
 
+    @staticmethod
+    def is_connected(client: object) -> bool:
+        """
+        Check whether an SSH client still has an active transport.
+
+        Args:
+            client: paramiko.SSHClient instance
+
+        Returns:
+            bool: True if the client can run commands without reconnecting
+        """
+        transport = client.get_transport() if client else None
+        return transport is not None and transport.is_active()
+
     @staticmethod
     def is_available() -> bool:
         """
@@ -141,4 +215,4 @@ class SSHHelper:
         Returns:
             bool: True if paramiko is installed
         """
-        return paramiko is not None
+        return _import_paramiko() is not None
@@ -1,8 +1,11 @@
 """VPS server metrics collector via SSH."""
 
 import asyncio
+import re
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
 try:
@@ -15,13 +18,34 @@ except ImportError:
         return decorator if not args else decorator(args[0])
 
 from ..config.models import VPSServerConfig
-from ..utils.status import HealthStatus
+from ..utils.status import HealthStatus, worst_status
 from ..utils.metrics import CollectorResult
 from ..utils.sanitize import sanitize_error
 from .base import BaseCollector, safe_collect
 from .ssh_helper import SSHHelper
 
 
+# Keepalive interval for SSH connections held open between ticks
+_SSH_KEEPALIVE_SECONDS = 30
+
+# Upper bound on concurrent SSH sessions run from the collector's thread pool
+_MAX_WORKERS = 16
+
+# Output parsers, compiled once at import
+_PROC_STAT_CPU_RE = re.compile(r'(?m)^cpu\s+(\d+(?:[ \t]+\d+)*)')
+_MEMINFO_RE = re.compile(r'(?m)^(MemTotal|MemAvailable|MemFree):\s+(\d+)')
+_FREE_MEM_RE = re.compile(r'(?m)^Mem:\s+([\d.]+)\s+([\d.]+)')
+_DF_ROOT_RE = re.compile(r'(?m)^\S+\s+\S+\s+\S+\s+\S+\s+(\d+(?:\.\d+)?)%\s+/[ \t\r]*$')
+
+# RAM, disk and the first CPU sample in one SSH round trip; '&&' keeps the
+# exit status of each command, so a failing one still fails the check
+_OUTPUT_SEP = "---SEP---"
+_SNAPSHOT_COMMAND = (
+    f"cat /proc/meminfo && echo {_OUTPUT_SEP} && df -P / && echo {_OUTPUT_SEP} && head -1 /proc/stat"
+)
+_PROC_STAT_COMMAND = "head -1 /proc/stat"
+
+
 class VPSCollector(BaseCollector):
     """Collector for VPS server system metrics via SSH."""
 
@@ -41,6 +65,19 @@ class VPSCollector(BaseCollector):
         """
         super().__init__(config, thresholds, logger)
 
+        # SSH connections reused across collect() ticks, keyed by (host, port, username);
+        # each key has a lock so one server's connection is used by one thread at a time
+        self._ssh_clients: Dict[Tuple[str, int, str], object] = {}
+        self._ssh_locks: Dict[Tuple[str, int, str], threading.Lock] = {
+            self._ssh_key(server_config): threading.Lock() for server_config in config
+        }
+
+        # Dedicated pool sized to the server list instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(len(config) or 1, _MAX_WORKERS),
+            thread_name_prefix="vps-collect"
+        )
+
     @safe_collect
     async def collect(self) -> List[CollectorResult]:
         """
@@ -65,8 +102,11 @@ class VPSCollector(BaseCollector):
 
         self.logger.info(f"Checking {len(self.config)} VPS server(s)")
 
+        # Bound concurrent SSH handshakes to stay under sshd's MaxStartups
+        semaphore = asyncio.Semaphore(min(self.thresholds.get("ssh_max_concurrency", 8), len(self.config)))
+
         # Run all checks concurrently
-        tasks = [self._collect_server_async(server_config) for server_config in self.config]
+        tasks = [self._collect_server_async(server_config, semaphore) for server_config in self.config]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Handle exceptions from gather
@@ -88,19 +128,76 @@ class VPSCollector(BaseCollector):
 
         return final_results
 
-    async def _collect_server_async(self, config: VPSServerConfig) -> CollectorResult:
+    async def close(self) -> None:
+        """Close all cached SSH connections and the collector's thread pool."""
+        clients = list(self._ssh_clients.values())
+        self._ssh_clients.clear()
+        for client in clients:
+            SSHHelper.close_client(client, self.logger)
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _ssh_key(config: VPSServerConfig) -> Tuple[str, int, str]:
+        """Return the connection cache key for a server."""
+        return (config.host, config.port, config.username)
+
+    def _exec(self, config: VPSServerConfig, command: str, timeout: int) -> str:
+        """
+        Run a command on a server over its cached SSH connection.
+
+        Reconnects once if a connection reused from an earlier tick has
+        dropped. Must be called with the server's lock held.
+
+        Args:
+            config: VPS server configuration
+            command: Command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            str: Command stdout
+        """
+        key = self._ssh_key(config)
+        client = self._ssh_clients.get(key)
+        reused = client is not None and SSHHelper.is_connected(client)
+
+        if not reused:
+            if client is not None:
+                SSHHelper.close_client(client, self.logger)
+            # Establish SSH connection
+            client = SSHHelper.create_client(config, self.logger, keepalive_interval=_SSH_KEEPALIVE_SECONDS)
+            self._ssh_clients[key] = client
+
+        for attempt in (0, 1):
+            try:
+                return SSHHelper.exec_command(client, command, timeout=timeout, logger=self.logger)
+            except RuntimeError:
+                # Command ran and failed; the connection itself is fine
+                raise
+            except Exception:
+                # Transport-level failure: drop the connection so the next use reconnects
+                self._ssh_clients.pop(key, None)
+                SSHHelper.close_client(client, self.logger)
+                if attempt or not reused:
+                    raise
+                self.logger.info(f"Reconnecting to {config.host}: cached SSH connection dropped")
+                client = SSHHelper.create_client(config, self.logger, keepalive_interval=_SSH_KEEPALIVE_SECONDS)
+                self._ssh_clients[key] = client
+
+    async def _collect_server_async(self, config: VPSServerConfig, semaphore: asyncio.Semaphore) -> CollectorResult:
         """
         Async wrapper for VPS metrics collection.
 
         Args:
             config: VPS server configuration
+            semaphore: Limits SSH sessions in flight
 
         Returns:
             CollectorResult: Server metrics result
         """
         # Run blocking SSH calls in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._collect_server, config)
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._collect_server, config)
 
     @traceable(name="VPSCollector._collect_server")
     def _collect_server(self, config: VPSServerConfig) -> CollectorResult:
@@ -113,34 +210,30 @@ class VPSCollector(BaseCollector):
         Returns:
             CollectorResult: Server metrics result
         """
-        client = None
         try:
-            # Establish SSH connection
-            client = SSHHelper.create_client(config, self.logger)
-
-            # Execute system commands
-            # Collect RAM and disk FIRST — these double as settling time
-            # so parallel SSH handshakes (Docker/DockerLogs collectors also
-            # connect to this host) finish before we measure CPU.
-            free_output = SSHHelper.exec_command(client, "free -m", timeout=10, logger=self.logger)
-            df_output = SSHHelper.exec_command(client, "df -h", timeout=10, logger=self.logger)
-
-            # CPU: two /proc/stat snapshots with a local sleep in between.
-            # Python-side sleep avoids depending on the remote PATH having
-            # 'sleep'. 2-second window dilutes any residual overhead from
-            # parallel Docker commands still running on this host.
-            stat_reading1 = SSHHelper.exec_command(
-                client, "head -1 /proc/stat", timeout=10, logger=self.logger
-            )
-            time.sleep(2)
-            stat_reading2 = SSHHelper.exec_command(
-                client, "head -1 /proc/stat", timeout=10, logger=self.logger
-            )
+            # Serialize use of this server's cached connection
+            with self._ssh_locks[self._ssh_key(config)]:
+                # RAM, disk and the first /proc/stat sample in a single exec.
+                # CPU is sampled last so parallel SSH handshakes (Docker/DockerLogs
+                # collectors also connect to this host) are done before we measure.
+                snapshot = self._exec(config, _SNAPSHOT_COMMAND, timeout=15)
+                sections = snapshot.split(_OUTPUT_SEP)
+                if len(sections) != 3:
+                    raise ValueError(f"Unexpected command output: {snapshot[:200]}")
+                mem_output, df_output, stat_reading1 = sections
+
+                # CPU: second /proc/stat snapshot after a local sleep.
+                # Python-side sleep avoids depending on the remote PATH having
+                # 'sleep'. 2-second window dilutes any residual overhead from
+                # parallel Docker commands still running on this host.
+                time.sleep(2)
+                stat_reading2 = self._exec(config, _PROC_STAT_COMMAND, timeout=10)
+
             cpu_stat_output = stat_reading1.strip() + "\n" + stat_reading2.strip()
 
             # Parse metrics
             cpu_usage = self._parse_cpu(cpu_stat_output)
-            ram_usage = self._parse_memory(free_output)
+            ram_usage = self._parse_memory(mem_output)
             disk_free = self._parse_disk(df_output)
 
             # Determine status for each metric
@@ -150,12 +243,7 @@ class VPSCollector(BaseCollector):
 
             # Overall status (worst wins)
             statuses = [cpu_status, ram_status, disk_status]
-            if HealthStatus.RED in statuses:
-                overall_status = HealthStatus.RED
-            elif HealthStatus.YELLOW in statuses:
-                overall_status = HealthStatus.YELLOW
-            else:
-                overall_status = HealthStatus.GREEN
+            overall_status = worst_status(statuses)
 
             return CollectorResult(
                 collector_name="vps",
@@ -193,10 +281,6 @@ class VPSCollector(BaseCollector):
                 error=safe_msg
             )
 
-        finally:
-            if client:
-                SSHHelper.close_client(client, self.logger)
-
     def _parse_cpu(self, stat_output: str) -> float:
         """
         Parse CPU usage from two /proc/stat readings taken 1 second apart.
@@ -217,26 +301,19 @@ class VPSCollector(BaseCollector):
         Raises:
             ValueError: If parsing fails
         """
-        lines = [
-            line.strip() for line in stat_output.strip().split('\n')
-            if line.strip().startswith('cpu ')
-        ]
+        # Numeric jiffie counters of each aggregate 'cpu' line
+        readings = _PROC_STAT_CPU_RE.findall(stat_output)
 
-        if len(lines) < 2:
+        if len(readings) < 2:
             raise ValueError(
-                f"Expected 2 cpu lines from /proc/stat, got {len(lines)}: "
+                f"Expected 2 cpu lines from /proc/stat, got {len(readings)}: "
                 f"{stat_output[:200]}"
             )
 
-        def parse_cpu_line(line: str) -> list:
-            # parts[0] is 'cpu', rest are numeric jiffie counters
-            return [int(x) for x in line.split()[1:]]
-
-        try:
-            values1 = parse_cpu_line(lines[0])
-            values2 = parse_cpu_line(lines[1])
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Cannot parse /proc/stat cpu line: {e}")
+        values1 = [int(x) for x in readings[0].split()]
+        values2 = [int(x) for x in readings[1].split()]
+        if len(values1) < 4 or len(values2) < 4:
+            raise ValueError(f"Cannot parse /proc/stat cpu line: {stat_output[:200]}")
 
         deltas = [v2 - v1 for v1, v2 in zip(values1, values2)]
         total = sum(deltas)
@@ -248,12 +325,15 @@ class VPSCollector(BaseCollector):
 
         return ((total - idle) / total) * 100.0
 
-    def _parse_memory(self, free_output: str) -> float:
+    def _parse_memory(self, mem_output: str) -> float:
         """
-        Parse memory usage from free command output.
+        Parse memory usage from /proc/meminfo, or from free command output.
+
+        Used memory is MemTotal - MemAvailable (MemFree on kernels older
+        than 3.14), which counts reclaimable page cache as free.
 
         Args:
-            free_output: Output from 'free -m' command
+            mem_output: Contents of /proc/meminfo, or output from 'free -m'
 
         Returns:
             float: Memory usage percentage
@@ -261,33 +341,41 @@ class VPSCollector(BaseCollector):
         Raises:
             ValueError: If parsing fails
 
+        Example /proc/meminfo output:
+            MemTotal:        8009876 kB
+            MemFree:         1234567 kB
+            MemAvailable:    6123456 kB
+
         Example free output:
                       total        used        free      shared  buff/cache   available
             Mem:           7822        1234        5678         123        910        6123
         """
-        lines = free_output.strip().split('\n')
-
-        # Find memory line (usually second line, starts with "Mem:")
-        for line in lines:
-            if line.startswith('Mem:'):
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        total = float(parts[1])
-                        used = float(parts[2])
-                        if total > 0:
-                            return (used / total) * 100
-                    except (ValueError, IndexError):
-                        pass
-
-        raise ValueError(f"Cannot parse memory from free output: {free_output[:200]}")
+        meminfo = dict(_MEMINFO_RE.findall(mem_output))
+        if 'MemTotal' in meminfo:
+            total = int(meminfo['MemTotal'])
+            available = int(meminfo.get('MemAvailable', meminfo.get('MemFree', 0)))
+            if total > 0:
+                return ((total - available) / total) * 100
+
+        # Memory line (usually second line, starts with "Mem:"): total, used
+        match = _FREE_MEM_RE.search(mem_output)
+        if match:
+            try:
+                total = float(match.group(1))
+                used = float(match.group(2))
+                if total > 0:
+                    return (used / total) * 100
+            except ValueError:
+                pass
+
+        raise ValueError(f"Cannot parse memory from output: {mem_output[:200]}")
 
     def _parse_disk(self, df_output: str) -> float:
         """
         Parse root partition free space from df command output.
 
         Args:
-            df_output: Output from 'df -h' command
+            df_output: Output from 'df -P /' (or 'df -h') command
 
         Returns:
             float: Disk free space percentage
@@ -295,24 +383,14 @@ class VPSCollector(BaseCollector):
         Raises:
             ValueError: If parsing fails
 
-        Example df output:
-            Filesystem      Size  Used Avail Use% Mounted on
-            /dev/sda1        50G   30G   18G  63% /
+        Example df -P output:
+            Filesystem     1024-blocks     Used Available Capacity Mounted on
+            /dev/sda1         51474912 32430195  19044717      63% /
         """
-        lines = df_output.strip().split('\n')
-
-        # Skip header line
-        for line in lines[1:]:
-            # Look for root partition (mounted on /)
-            parts = line.split()
-            if len(parts) >= 6 and parts[-1] == '/':
-                # Use% column (e.g., "63%")
-                use_percent_str = parts[-2]
-                try:
-                    # Remove % sign and convert
-                    use_percent = float(use_percent_str.rstrip('%'))
-                    return 100.0 - use_percent
-                except ValueError:
-                    pass
+        # Root partition line (mounted on /); the header's "Use%" never matches
+        match = _DF_ROOT_RE.search(df_output)
+        if match:
+            # Use% column (e.g., "63%")
+            return 100.0 - float(match.group(1))
 
         raise ValueError(f"Cannot find root partition in df output: {df_output[:200]}")
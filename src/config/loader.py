@@ -4,13 +4,31 @@ import yaml
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 from .models import MonitoringSystemConfig
 
+try:
+    # libyaml C loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Load environment variables from .env file
 load_dotenv()
 
+# ${VAR_NAME} placeholder
+_ENV_VAR_RE = re.compile(r'\$\{(\w+)\}')
+
+
+def _env_value(match: re.Match) -> str:
+    """Return the environment value for a ${VAR_NAME} match ('' if unset)."""
+    return os.environ.get(match.group(1), '')
+
+
+# Validated configs by file path: (st_mtime_ns, st_size, referenced env values, config)
+_CACHE: Dict[str, Tuple[int, int, Tuple[Tuple[str, Optional[str]], ...], MonitoringSystemConfig]] = {}
+
 
 class ConfigLoader:
     """Load and validate monitoring system configuration."""
@@ -20,6 +38,10 @@ class ConfigLoader:
         """
         Load configuration from YAML file with environment variable substitution.
 
+        The validated config is cached while the file's mtime and size and the
+        environment variables it references are unchanged. Each call returns
+        its own deep copy, so callers can modify it without affecting the cache.
+
         Args:
             config_path: Path to YAML configuration file
 
@@ -32,23 +54,42 @@ class ConfigLoader:
             pydantic.ValidationError: If configuration validation fails
         """
         config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+        key = str(config_file.resolve())
+        cached = _CACHE.get(key)
+        if (
+            cached is not None
+            and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+            and all(os.getenv(name) == value for name, value in cached[2])
+        ):
+            return cached[3].model_copy(deep=True)
 
         with open(config_file, 'r') as f:
-            raw_config = yaml.safe_load(f)
+            text = f.read()
+        raw_config = yaml.load(text, Loader=_SafeLoader)
 
         # Substitute environment variables
         raw_config = ConfigLoader._substitute_env_vars(raw_config)
 
         # Validate with Pydantic
-        return MonitoringSystemConfig(**raw_config)
+        config = MonitoringSystemConfig(**raw_config)
+
+        env_used = tuple((name, os.getenv(name)) for name in dict.fromkeys(_ENV_VAR_RE.findall(text)))
+        _CACHE[key] = (stat.st_mtime_ns, stat.st_size, env_used, config)
+        return config.model_copy(deep=True)
 
     @staticmethod
     def _substitute_env_vars(obj: Any) -> Any:
         """
         Recursively substitute ${ENV_VAR} placeholders with environment values.
 
+        Dicts and lists are updated in place; only values that contain a
+        placeholder are replaced.
+
         Args:
             obj: Object to process (str, dict, list, or primitive)
 
@@ -56,14 +97,23 @@ class ConfigLoader:
             Object with environment variables substituted
         """
         if isinstance(obj, str):
-            # Replace ${VAR_NAME} with os.getenv('VAR_NAME')
-            pattern = r'\$\{(\w+)\}'
-            return re.sub(pattern, lambda m: os.getenv(m.group(1), ''), obj)
+            if '${' not in obj:
+                return obj
+            # Replace ${VAR_NAME} with os.environ.get('VAR_NAME', '')
+            return _ENV_VAR_RE.sub(_env_value, obj)
+
+        sub = ConfigLoader._substitute_env_vars
 
-        elif isinstance(obj, dict):
-            return {k: ConfigLoader._substitute_env_vars(v) for k, v in obj.items()}
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                new = sub(v)
+                if new is not v:
+                    obj[k] = new
 
         elif isinstance(obj, list):
-            return [ConfigLoader._substitute_env_vars(item) for item in obj]
+            for i, item in enumerate(obj):
+                new = sub(item)
+                if new is not item:
+                    obj[i] = new
 
         return obj
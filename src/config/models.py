@@ -48,8 +48,11 @@ class DatabaseConfig(BaseModel):
     port: int = 5432
     database: str
     table: Optional[str] = None
+    exact_count: bool = False  # COUNT(*) the table instead of using the planner's row estimate
     ssl_mode: str = "require"
     sslrootcert: Optional[str] = None  # Path to SSL CA certificate bundle
+    statement_timeout_ms: int = Field(default=5000, ge=0)  # Server-side cap per query (0 disables)
+    lock_timeout_ms: int = Field(default=2000, ge=0)  # Server-side cap on lock waits (0 disables)
 
 
 class LLMModelConfig(BaseModel):
@@ -57,12 +60,16 @@ class LLMModelConfig(BaseModel):
     provider: str  # "azure" or "bedrock"
     endpoint: Optional[str] = None
     model_id: Optional[str] = None
+    force_full_check: bool = False  # Bedrock: always invoke the model instead of trusting the model catalog
 
 
 class S3BucketConfig(BaseModel):
     """Configuration for S3 bucket monitoring."""
     bucket: str
     region: str = "us-east-1"
+    verify_location: bool = False  # Call GetBucketLocation instead of trusting region
+    include_versioning: bool = False  # Also report versioning status (GetBucketVersioning)
+    deep_check: bool = False  # Full HeadBucket/GetBucketLocation/ListObjectsV2/GetBucketVersioning sequence
 
     @field_validator('bucket')
     @classmethod
@@ -97,6 +104,9 @@ class ThresholdsConfig(BaseModel):
     disk_free_yellow: int = Field(default=20, ge=0, le=100)
     api_timeout_ms: int = Field(default=5000, ge=100)
     api_slow_ms: int = Field(default=2000, ge=100)
+    api_max_concurrency: int = Field(default=32, ge=1)  # Max in-flight API checks
+    ssh_max_concurrency: int = Field(default=8, ge=1)  # Max SSH sessions opened at once per collector
+    db_max_concurrency: int = Field(default=4, ge=1)  # Max database checks in flight at once
     docker_logs_errors_4h_red: int = Field(default=50, ge=0)
     docker_logs_errors_4h_yellow: int = Field(default=20, ge=0)
     docker_logs_errors_24h_red: int = Field(default=200, ge=0)
@@ -114,6 +124,7 @@ class MonitoringConfig(BaseModel):
     """Monitoring schedule configuration."""
     schedule: str = "0 */6 * * *"  # Cron syntax
     history_file_path: str = "./data/metric_history.json"
+    usage_log_path: str = "./data/usage_log.db"
 
     @field_validator('schedule')
     @classmethod
@@ -138,6 +149,9 @@ class LLMConfig(BaseModel):
     region: str = "us-east-1"
     max_tokens: int = Field(default=4096, ge=100, le=1000000)
     daily_budget_usd: float = Field(default=3.0, ge=0.1)
+    analysis_cache_file_path: str = "./data/analysis_cache.json"
+    analysis_cache_ttl_seconds: int = Field(default=3600, ge=0)  # 0 disables caching
+    analysis_cache_similarity: Optional[float] = Field(default=0.9, gt=0, le=1)  # None disables near-duplicate hits
 
 
 class TargetsConfig(BaseModel):
@@ -16,6 +16,11 @@ except ImportError:
     AsyncIOScheduler = None
     CronTrigger = None
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .config.loader import ConfigLoader
 from .config.models import MonitoringSystemConfig
 from .workflow import MonitoringWorkflow
@@ -132,7 +137,7 @@ class MonitoringApp:
             duration = time.time() - start_time
             total_checks = len(final_state.get('all_results', []))
             issues_count = len(final_state.get('issues', []))
-            tokens = final_state.get('token_usage', 0)
+            tokens = final_state.get('token_usage', {}).get('total', 0)
             telegram_sent = final_state.get('telegram_sent', False)
             errors = final_state.get('errors', [])
 
@@ -172,6 +177,13 @@ class MonitoringApp:
             # Re-raise in run-once mode to signal failure
             raise
 
+    async def run_once(self):
+        """Execute a single monitoring cycle and release collector resources."""
+        try:
+            await self.run_monitoring_cycle()
+        finally:
+            await self.workflow.close()
+
     async def _send_error_notification(self, error: Exception):
         """
         Send error alert to Telegram.
@@ -262,8 +274,11 @@ class MonitoringApp:
 
             # Keep running forever
             self.logger.info("Scheduler running. Press Ctrl+C to exit.")
-            while True:
-                await asyncio.sleep(60)  # Check every minute
+            try:
+                while True:
+                    await asyncio.sleep(60)  # Check every minute
+            finally:
+                await self.workflow.close()
 
         try:
             self.logger.info("Starting event loop...")
@@ -335,6 +350,10 @@ Examples:
     # Set log level
     logging.getLogger().setLevel(args.log_level)
 
+    # Faster event loop for the collector fan-out when available (Linux/macOS)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Create application
     try:
         app = MonitoringApp(
@@ -346,7 +365,7 @@ Examples:
             # Run once and exit
             exit_code = 0
             try:
-                asyncio.run(app.run_monitoring_cycle())
+                asyncio.run(app.run_once())
             except Exception:
                 exit_code = 1
 
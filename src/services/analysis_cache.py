@@ -0,0 +1,264 @@
+"""Fingerprint-keyed cache of AI analyses for repeated issue sets."""
+
+import copy
+import hashlib
+import json
+import logging
+import re
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils.metrics import CollectorResult
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes with sorted keys (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+# Numeric values (CPU %, response times, counts) in issue messages
+_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _issue_keys(signature) -> frozenset:
+    """Return the (collector, target, status) part of each signature entry."""
+    return frozenset(tuple(entry.split("|", 3)[:3]) for entry in signature)
+
+
+class AnalysisCache:
+    """
+    Cache root cause analyses keyed by a fingerprint of the issue set.
+
+    Sticky issues produce the same RED/YELLOW results cycle after cycle,
+    so an exact fingerprint hit lets the analysis agent reuse the previous
+    answer instead of calling Bedrock again. Entries expire after a TTL and
+    are persisted to a JSON file so hits survive process restarts.
+
+    On an exact miss, near-duplicate issue sets (same targets and statuses,
+    messages differing only in numbers, e.g. disk 91% vs 92%) can reuse a
+    cached analysis when their Jaccard similarity reaches the threshold.
+    An added, removed or re-graded issue is never a near-duplicate.
+    """
+
+    # Only the first N metrics of each issue (in insertion order) contribute
+    # to the fingerprint, matching what the analysis prompt shows to Claude
+    FINGERPRINT_METRICS = 5
+
+    def __init__(
+        self,
+        cache_file: str = "./data/analysis_cache.json",
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        similarity_threshold: Optional[float] = 0.9,
+        logger: logging.Logger = None,
+    ):
+        """
+        Initialize analysis cache.
+
+        Args:
+            cache_file: Path to persist cached analyses
+            ttl_seconds: Entry lifetime in seconds (0 disables caching)
+            max_entries: Maximum entries kept; oldest are evicted first
+            similarity_threshold: Minimum similarity for a near-duplicate hit
+                                  (None disables near-duplicate matching)
+            logger: Optional logger instance
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+        self._load_state()
+        self.logger.info(
+            f"AnalysisCache initialized from {self.cache_file} "
+            f"({len(self._entries)} entr(ies), ttl={ttl_seconds}s)"
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if caching is enabled (non-zero TTL)."""
+        return self.ttl_seconds > 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return exact-hit ratio over lookups made by this process."""
+        lookups = self.hits + self.similar_hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def similar_hit_ratio(self) -> float:
+        """Return near-duplicate hit ratio over lookups made by this process."""
+        lookups = self.hits + self.similar_hits + self.misses
+        return self.similar_hits / lookups if lookups else 0.0
+
+    @classmethod
+    def fingerprint(cls, issues: List[CollectorResult]) -> str:
+        """
+        Compute an order-independent fingerprint of an issue set.
+
+        Args:
+            issues: Issues passed to the analysis agent
+
+        Returns:
+            str: 32-character hex digest
+        """
+        signature = sorted(
+            _dumps([
+                issue.collector_name,
+                issue.target_name,
+                issue.status.value,
+                issue.message,
+                list(islice((issue.metrics or {}).items(), cls.FINGERPRINT_METRICS)),
+            ])
+            for issue in issues
+        )
+        payload = b"\n".join(signature)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def signature(issues: List[CollectorResult]) -> List[str]:
+        """
+        Build a number-insensitive signature of an issue set for similarity matching.
+
+        Args:
+            issues: Issues passed to the analysis agent
+
+        Returns:
+            List[str]: Sorted unique "collector|target|status|message" strings
+                       with numeric values masked
+        """
+        return sorted({
+            f"{issue.collector_name}|{issue.target_name}|{issue.status.value}|"
+            f"{_NUMBER_PATTERN.sub('#', issue.message)}"
+            for issue in issues
+        })
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached analysis for *key*, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry["created_at"] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return copy.deepcopy(entry["analysis"])
+
+    def get_similar(self, signature: List[str]) -> Optional[Tuple[Dict, float]]:
+        """
+        Find the most similar live entry for an issue signature.
+
+        Only entries with exactly the same (collector, target, status) set
+        are candidates, so a new issue always reaches the analysis. Should
+        be called after get() missed; a near-duplicate hit converts that
+        miss into a similar hit.
+
+        Args:
+            signature: Signature from signature()
+
+        Returns:
+            Tuple of (analysis copy, similarity) if the best match reaches
+            the threshold, else None
+        """
+        if not self.enabled or self.similarity_threshold is None or not signature:
+            return None
+
+        now = time.time()
+        wanted = set(signature)
+        wanted_keys = _issue_keys(wanted)
+        best_entry, best_score = None, 0.0
+
+        for entry in self._entries.values():
+            if now - entry["created_at"] > self.ttl_seconds:
+                continue
+            cached = set(entry.get("signature", ()))
+            if not cached or _issue_keys(cached) != wanted_keys:
+                continue
+            score = len(wanted & cached) / len(wanted | cached)
+            if score > best_score:
+                best_entry, best_score = entry, score
+
+        if best_entry is None or best_score < self.similarity_threshold:
+            return None
+
+        self.misses -= 1
+        self.similar_hits += 1
+        return copy.deepcopy(best_entry["analysis"]), best_score
+
+    def set(self, key: str, analysis: Dict, signature: Optional[List[str]] = None) -> None:
+        """Store an analysis under *key* (with optional signature) and persist the cache file."""
+        if not self.enabled:
+            return
+
+        self._entries[key] = {
+            "created_at": time.time(),
+            "analysis": {k: v for k, v in analysis.items() if k != "token_usage"},
+            "signature": signature or [],
+        }
+        self._evict()
+        self._save_state()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones beyond max_entries."""
+        now = time.time()
+        self._entries = {
+            k: v for k, v in self._entries.items()
+            if now - v["created_at"] <= self.ttl_seconds
+        }
+        if len(self._entries) > self.max_entries:
+            newest = sorted(
+                self._entries.items(), key=lambda kv: kv[1]["created_at"]
+            )[-self.max_entries:]
+            self._entries = dict(newest)
+
+    def _load_state(self) -> None:
+        """Load cached analyses from file, dropping expired entries."""
+        self._entries = {}
+
+        if not self.enabled or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r") as f:
+                self._entries = json.load(f).get("entries", {})
+            self._evict()
+        except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to load analysis cache: {e}, starting fresh")
+            self._entries = {}
+
+    def _save_state(self) -> None:
+        """Persist cached analyses to file, creating parent dirs as needed."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(self.cache_file, "w") as f:
+                json.dump({"entries": self._entries}, f)
+
+            self.logger.debug(f"Saved analysis cache to {self.cache_file}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to save analysis cache: {e}")
@@ -158,5 +158,4 @@ class BedrockClient:
         """
         import asyncio
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.invoke, prompt, system_prompt)
+        return await asyncio.to_thread(self.invoke, prompt, system_prompt)
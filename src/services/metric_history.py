@@ -2,7 +2,7 @@
 
 import json
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import List
 
@@ -62,7 +62,7 @@ class MetricHistoryStore:
 
     def increment(self, key: str) -> None:
         """Record one occurrence for a history key and persist the file."""
-        now = datetime.utcnow().isoformat()
+        now = datetime.now(timezone.utc).isoformat()
 
         if key not in self._incidents:
             self._incidents[key] = {"count": 0, "first_seen": now, "last_seen": now}
@@ -164,23 +164,29 @@ class TelegramClient:
         if len(message) <= max_length:
             return [message]
 
+        # Collect each chunk's lines and join once, instead of re-copying
+        # the growing chunk string for every appended line
         chunks = []
-        current_chunk = ""
+        current_lines: List[str] = []
+        current_len = 0
 
         for line in message.split('\n'):
             # Check if adding this line would exceed limit
-            if len(current_chunk) + len(line) + 1 > max_length:
+            if current_len + len(line) + 1 > max_length:
                 # Save current chunk and start new one
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = line
-            else:
+                if current_len:
+                    chunks.append('\n'.join(current_lines))
+                current_lines, current_len = [line], len(line)
+            elif current_len:
                 # Add line to current chunk
-                current_chunk += '\n' + line if current_chunk else line
+                current_lines.append(line)
+                current_len += len(line) + 1
+            else:
+                current_lines, current_len = [line], len(line)
 
         # Don't forget the last chunk
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_len:
+            chunks.append('\n'.join(current_lines))
 
         return chunks
 
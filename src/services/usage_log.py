@@ -0,0 +1,122 @@
+"""SQLite rolling log of per-cycle token usage for cost projections."""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+class UsageLog:
+    """
+    Record token usage and duration of every monitoring cycle.
+
+    Rows are kept in a local SQLite table for a rolling retention window,
+    so cost projections can be computed from real production history
+    instead of running (and paying for) a fresh profiling cycle.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "./data/usage_log.db",
+        retention_days: int = 90,
+        logger: logging.Logger = None,
+    ):
+        """
+        Initialize usage log.
+
+        Args:
+            db_path: Path to the SQLite database file
+            retention_days: Rows older than this are deleted on each record()
+            logger: Optional logger instance
+        """
+        self.db_path = Path(db_path)
+        self.retention_days = retention_days
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cycles (
+                cycle_id      TEXT PRIMARY KEY,
+                ts            REAL NOT NULL,
+                input_tokens  INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                duration_ms   INTEGER NOT NULL,
+                n_checks      INTEGER NOT NULL,
+                n_issues      INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cycles_ts ON cycles (ts)")
+        self._conn.commit()
+
+        self.logger.info(f"UsageLog initialized at {self.db_path}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        cycle_id: str,
+        input_tok: int,
+        output_tok: int,
+        duration_ms: int,
+        n_checks: int,
+        n_issues: int,
+    ) -> None:
+        """
+        Record one completed cycle and rotate rows past the retention window.
+
+        Failures are logged and swallowed - usage logging must never break
+        a monitoring cycle.
+
+        Args:
+            cycle_id: Unique cycle identifier
+            input_tok: Input tokens consumed by the cycle
+            output_tok: Output tokens consumed by the cycle
+            duration_ms: Cycle wall time in milliseconds
+            n_checks: Number of checks performed
+            n_issues: Number of issues detected
+        """
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cycles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (cycle_id, now, input_tok, output_tok, duration_ms, n_checks, n_issues),
+                )
+                self._conn.execute(
+                    "DELETE FROM cycles WHERE ts < ?",
+                    (now - self.retention_days * 86400,),
+                )
+            self.logger.debug(f"Recorded usage for cycle {cycle_id}")
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to record cycle usage: {e}")
+
+    def cycles(self, days: float) -> List[Dict]:
+        """
+        Return cycles recorded within the last *days* days, oldest first.
+
+        Args:
+            days: Look-back window in days
+
+        Returns:
+            List of dicts with cycle_id, ts, input_tokens, output_tokens,
+            duration_ms, n_checks and n_issues
+        """
+        cursor = self._conn.execute(
+            "SELECT * FROM cycles WHERE ts > ? ORDER BY ts",
+            (time.time() - days * 86400,),
+        )
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -6,9 +6,13 @@ import time
 from .status import HealthStatus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CollectorResult:
-    """Standard result format from all collectors."""
+    """
+    Standard result format from all collectors.
+
+    Frozen: derive changed copies with dataclasses.replace().
+    """
 
     collector_name: str
     target_name: str
@@ -21,4 +25,4 @@ class CollectorResult:
     def __post_init__(self):
         """Set timestamp if not provided."""
         if self.timestamp is None:
-            self.timestamp = time.time()
+            object.__setattr__(self, 'timestamp', time.time())
@@ -1,6 +1,7 @@
 """Health status enumeration."""
 
 from enum import Enum
+from typing import Iterable
 
 
 class HealthStatus(Enum):
@@ -18,9 +19,36 @@ class HealthStatus(Enum):
         Returns:
             str: Emoji representing the health status
         """
-        return {
-            HealthStatus.GREEN: "🟢",
-            HealthStatus.YELLOW: "🟡",
-            HealthStatus.RED: "🔴",
-            HealthStatus.UNKNOWN: "⚪"
-        }[self]
+        return STATUS_EMOJI[self]
+
+
+# Status → emoji table; index directly on hot paths instead of calling to_emoji()
+STATUS_EMOJI = {
+    HealthStatus.GREEN: "🟢",
+    HealthStatus.YELLOW: "🟡",
+    HealthStatus.RED: "🔴",
+    HealthStatus.UNKNOWN: "⚪",
+}
+
+# Severity used to combine statuses (worst wins); a result that couldn't be
+# judged outranks GREEN but not a real warning or failure
+_SEVERITY = {
+    HealthStatus.GREEN: 0,
+    HealthStatus.UNKNOWN: 1,
+    HealthStatus.YELLOW: 2,
+    HealthStatus.RED: 3,
+}
+_SEVERITY_GET = _SEVERITY.get
+
+
+def worst_status(statuses: Iterable[HealthStatus]) -> HealthStatus:
+    """
+    Combine several statuses into one overall status (worst wins).
+
+    Args:
+        statuses: Statuses to combine (at least one)
+
+    Returns:
+        HealthStatus: The most severe status
+    """
+    return max(statuses, key=_SEVERITY_GET)
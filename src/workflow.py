@@ -2,9 +2,13 @@
 
 import asyncio
 import dataclasses
+import hashlib
+import json
 import time
 import logging
 import os
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict
 
 try:
@@ -13,12 +17,14 @@ except ImportError:
     StateGraph = None
     END = None
 
-from .agents.state import MonitoringState
+from .agents.state import MonitoringState, empty_token_usage, index_results
 from .agents.analysis_agent import AnalysisAgent
 from .agents.report_agent import ReportAgent
+from .services.analysis_cache import AnalysisCache
 from .services.bedrock_client import BedrockClient
 from .services.budget_tracker import BudgetTracker
 from .services.metric_history import MetricHistoryStore
+from .services.usage_log import UsageLog
 from .config.models import MonitoringSystemConfig
 from .utils.status import HealthStatus
 from .utils.logger import setup_logger
@@ -41,13 +47,25 @@ class MonitoringWorkflow:
     Coordinates parallel data collection, AI analysis, and report generation.
     """
 
-    def __init__(self, config: MonitoringSystemConfig, logger: logging.Logger = None):
+    def __init__(
+        self,
+        config: MonitoringSystemConfig,
+        logger: logging.Logger = None,
+        record_usage: bool = True,
+        send_telegram: bool = True,
+        update_history: bool = True
+    ):
         """
         Initialize monitoring workflow.
 
         Args:
             config: System configuration
             logger: Optional logger instance
+            record_usage: Write each cycle to the usage log (False for
+                          profiling runs, which must not skew production history)
+            send_telegram: Deliver the report via Telegram (False logs it only)
+            update_history: Count RED metrics in the daily metric history
+                            (False still reads it to dampen first occurrences)
 
         Raises:
             ImportError: If langgraph not installed
@@ -57,6 +75,9 @@ class MonitoringWorkflow:
 
         self.config = config
         self.logger = logger or setup_logger("workflow")
+        self.record_usage = record_usage
+        self.send_telegram = send_telegram
+        self.update_history = update_history
 
         # Setup LangSmith tracing if enabled
         self._setup_langsmith()
@@ -72,12 +93,23 @@ class MonitoringWorkflow:
             history_file=config.monitoring.history_file_path,
             logger=self.logger
         )
+        self.usage_log = UsageLog(
+            db_path=config.monitoring.usage_log_path,
+            logger=self.logger
+        )
+        self.analysis_cache = AnalysisCache(
+            cache_file=config.llm.analysis_cache_file_path,
+            ttl_seconds=config.llm.analysis_cache_ttl_seconds,
+            similarity_threshold=config.llm.analysis_cache_similarity,
+            logger=self.logger
+        )
 
         # Initialize agents
         self.analysis_agent = AnalysisAgent(
             self.bedrock_client,
             self.budget_tracker,
-            self.logger
+            self.logger,
+            analysis_cache=self.analysis_cache
         )
         self.report_agent = ReportAgent(self.logger)
 
@@ -148,6 +180,19 @@ class MonitoringWorkflow:
         self.graph = self._build_graph()
         self.logger.info("Workflow initialized successfully")
 
+    async def close(self):
+        """Release resources collectors and the usage log hold across monitoring cycles."""
+        for name, collector in self.collectors.items():
+            try:
+                await collector.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close {name} collector: {e}")
+
+        try:
+            self.usage_log.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close usage log: {e}")
+
     def _setup_langsmith(self):
         """
         Setup LangSmith tracing if environment variables are configured.
@@ -215,7 +260,7 @@ class MonitoringWorkflow:
             state: Current workflow state
 
         Returns:
-            dict: Updates to state (all_results, issues)
+            dict: Updates to state (all_results, issues and their precomputed views)
         """
         self.logger.info(f"Starting parallel collection from {len(self.collectors)} collector(s)")
 
@@ -247,21 +292,18 @@ class MonitoringWorkflow:
             else:
                 self.logger.warning(f"Unexpected collector result type: {type(result)}")
 
-        # Filter issues (RED, YELLOW, or UNKNOWN status)
-        issues = [
-            r for r in all_results
-            if r.status in [HealthStatus.RED, HealthStatus.YELLOW, HealthStatus.UNKNOWN]
-        ]
+        # Filter issues (RED, YELLOW, or UNKNOWN status) and index results in one pass
+        update = index_results(all_results)
+        counts = update["status_counts"]
 
         self.logger.info(
             f"Collection complete: {len(all_results)} total checks, "
-            f"{len(issues)} issue(s) detected"
+            f"{len(update['issues'])} issue(s) detected "
+            f"({counts[HealthStatus.RED]} red, {counts[HealthStatus.YELLOW]} yellow, "
+            f"{counts[HealthStatus.UNKNOWN]} unknown)"
         )
 
-        return {
-            "all_results": all_results,
-            "issues": issues
-        }
+        return update
 
     async def _history_filter(self, state: MonitoringState) -> Dict:
         """
@@ -275,7 +317,7 @@ class MonitoringWorkflow:
             state: Current workflow state with raw all_results
 
         Returns:
-            dict: Updated all_results and issues
+            dict: Updated all_results, issues and their precomputed views
         """
         thresholds = self.config.thresholds.__dict__
         adjusted = []
@@ -296,9 +338,10 @@ class MonitoringWorkflow:
                 self.history_store.get_daily_count(k) == 0 for k in red_keys
             )
 
-            # Always increment counts for all red metric keys
-            for k in red_keys:
-                self.history_store.increment(k)
+            # Count this occurrence for every red metric key (unless disabled)
+            if self.update_history:
+                for k in red_keys:
+                    self.history_store.increment(k)
 
             if all_first_occurrence:
                 dampened = dataclasses.replace(
@@ -314,16 +357,13 @@ class MonitoringWorkflow:
             else:
                 adjusted.append(result)
 
-        issues = [
-            r for r in adjusted
-            if r.status in [HealthStatus.RED, HealthStatus.YELLOW, HealthStatus.UNKNOWN]
-        ]
+        update = index_results(adjusted)
 
         self.logger.info(
-            f"History filter complete: {len(adjusted)} results, {len(issues)} issue(s)"
+            f"History filter complete: {len(adjusted)} results, {len(update['issues'])} issue(s)"
         )
 
-        return {"all_results": adjusted, "issues": issues}
+        return update
 
     async def _ai_analysis(self, state: MonitoringState) -> Dict:
         """
@@ -342,7 +382,7 @@ class MonitoringWorkflow:
             return {
                 "root_cause_analysis": {"root_cause": "All systems healthy"},
                 "recommendations": [],
-                "token_usage": 0
+                "token_usage": empty_token_usage()
             }
 
         self.logger.info(f"Starting AI analysis of {len(issues)} issue(s)")
@@ -350,9 +390,17 @@ class MonitoringWorkflow:
         # Run analysis
         analysis_result = await self.analysis_agent.analyze(issues)
 
-        token_usage = analysis_result.get('token_usage', {}).get('total_tokens', 0)
+        usage = analysis_result.get('token_usage', {})
+        token_usage = {
+            "input": usage.get('input_tokens', 0),
+            "output": usage.get('output_tokens', 0),
+            "total": usage.get('total_tokens', 0),
+        }
 
-        self.logger.info(f"AI analysis complete: {token_usage} tokens used")
+        self.logger.info(
+            f"AI analysis complete: {token_usage['total']} tokens used "
+            f"({token_usage['input']} input, {token_usage['output']} output)"
+        )
 
         return {
             "root_cause_analysis": analysis_result,
@@ -396,6 +444,10 @@ class MonitoringWorkflow:
             self.logger.warning("No Telegram message to send")
             return {"telegram_sent": False}
 
+        if not self.send_telegram:
+            self.logger.info("Telegram delivery disabled, skipping send")
+            return {"telegram_sent": False}
+
         self.logger.info("Sending report via Telegram")
 
         try:
@@ -423,22 +475,48 @@ class MonitoringWorkflow:
             self.logger.error(f"Telegram delivery failed: {e}", exc_info=True)
             return {"telegram_sent": False}
 
-    def visualize_graph(self, output_path: str = "workflow_graph.png") -> bool:
+    def visualize_graph(self, output_path: str = "workflow_graph.png", cache_dir: str = ".cache") -> bool:
         """
         Generate visual representation of the workflow graph.
 
+        The rendered PNG is cached under *cache_dir* keyed by a hash of the
+        graph topology, and *output_path* is symlinked to it, so re-running
+        on an unchanged workflow skips rendering entirely.
+
         Args:
             output_path: Path to save the graph image
+            cache_dir: Directory holding rendered graphs
 
         Returns:
             bool: True if visualization was generated successfully
         """
         try:
-            # Generate mermaid PNG
-            mermaid_png = self.graph.get_graph().draw_mermaid_png()
+            graph = self.graph.get_graph()
+            topology = json.dumps(graph.to_json(), sort_keys=True, default=str)
+            digest = hashlib.sha1(topology.encode()).hexdigest()[:12]
+            cached_png = (Path(cache_dir) / f"workflow_{digest}.png").resolve()
+            output = Path(output_path)
+
+            if output.is_symlink() and output.resolve() == cached_png and cached_png.exists():
+                self.logger.info(f"Graph unchanged, {output_path} is up to date")
+                return True
+
+            if cached_png.exists():
+                self.logger.info(f"Reusing cached graph rendering {cached_png}")
+            else:
+                # Generate mermaid PNG
+                mermaid_png = graph.draw_mermaid_png()
+
+                cached_png.parent.mkdir(parents=True, exist_ok=True)
+                tmp_png = cached_png.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_png, 'wb') as f:
+                    f.write(mermaid_png)
+                os.replace(tmp_png, cached_png)
 
-            with open(output_path, 'wb') as f:
-                f.write(mermaid_png)
+            # Point output_path at the cached rendering (atomic swap of the link)
+            tmp_link = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+            os.symlink(cached_png, tmp_link)
+            os.replace(tmp_link, output)
 
             self.logger.info(f"Graph visualization saved to {output_path}")
             return True
@@ -468,7 +546,7 @@ class MonitoringWorkflow:
         # Initialize state
         initial_state: MonitoringState = {
             "execution_start": time.time(),
-            "token_usage": 0,
+            "token_usage": empty_token_usage(),
             "errors": []
         }
 
@@ -480,15 +558,29 @@ class MonitoringWorkflow:
             duration = time.time() - initial_state['execution_start']
             total_checks = len(final_state.get('all_results', []))
             issues_count = len(final_state.get('issues', []))
-            tokens = final_state.get('token_usage', 0)
+            tokens = final_state.get('token_usage', {})
 
             self.logger.info("=" * 60)
             self.logger.info("Workflow execution completed")
             self.logger.info(f"Duration: {duration:.1f}s")
             self.logger.info(f"Checks: {total_checks} total, {issues_count} issues")
-            self.logger.info(f"Tokens: {tokens:,}")
+            self.logger.info(
+                f"Tokens: {tokens.get('total', 0):,} "
+                f"({tokens.get('input', 0):,} input, {tokens.get('output', 0):,} output)"
+            )
             self.logger.info("=" * 60)
 
+            # Keep per-cycle usage so cost projections can use real history
+            if self.record_usage:
+                self.usage_log.record(
+                    cycle_id=datetime.fromtimestamp(initial_state['execution_start'], timezone.utc).isoformat(),
+                    input_tok=tokens.get('input', 0),
+                    output_tok=tokens.get('output', 0),
+                    duration_ms=int(duration * 1000),
+                    n_checks=total_checks,
+                    n_issues=issues_count,
+                )
+
             return final_state
 
         except Exception as e:
@@ -252,6 +252,54 @@ This should resolve the issue."""
         assert "Connection timeout" in prompt
         assert "prod-db" in prompt
 
+    @pytest.mark.asyncio
+    async def test_build_analysis_prompt_dedupes_identical_issues(self, mock_bedrock_client, mock_budget_tracker):
+        """Test identical issues on several targets are emitted as one block."""
+        issues = [
+            CollectorResult(
+                collector_name="api",
+                target_name=f"endpoint-{i}",
+                status=HealthStatus.RED,
+                metrics={"status_code": 502},
+                message="HTTP 502"
+            )
+            for i in range(3)
+        ]
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker)
+        prompt = agent._build_analysis_prompt(issues)
+
+        assert prompt.count("- Message: HTTP 502") == 1
+        assert "Affected targets (3): endpoint-0, endpoint-1, endpoint-2" in prompt
+
+    @pytest.mark.asyncio
+    async def test_deduped_targets_reported_as_affected(self, mock_bedrock_client, mock_budget_tracker):
+        """Test every collapsed target ends up in affected_systems."""
+        issues = [
+            CollectorResult(
+                collector_name="api",
+                target_name=f"endpoint-{i}",
+                status=HealthStatus.RED,
+                metrics={},
+                message="HTTP 502"
+            )
+            for i in range(3)
+        ]
+        mock_bedrock_client.ainvoke.return_value = (
+            json.dumps({
+                "root_cause": "Upstream gateway down",
+                "severity": "critical",
+                "affected_systems": ["endpoint-0"],
+                "recommendations": []
+            }),
+            {"input_tokens": 500, "output_tokens": 100, "total_tokens": 600}
+        )
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker)
+        result = await agent.analyze(issues)
+
+        assert result['affected_systems'] == ["endpoint-0", "endpoint-1", "endpoint-2"]
+
     @pytest.mark.asyncio
     async def test_get_system_prompt(self, mock_bedrock_client, mock_budget_tracker):
         """Test system prompt content."""
@@ -283,6 +331,22 @@ This should resolve the issue."""
         assert result['root_cause'] == "Memory leak"
         assert result['extra_field'] == "should be preserved"
 
+    @pytest.mark.asyncio
+    async def test_parse_analysis_response_ignores_trailing_text(self, mock_bedrock_client, mock_budget_tracker):
+        """Test parsing stops at the end of the first JSON object."""
+        response = (
+            'Analysis:\n{"root_cause": "Disk full", "severity": "high", '
+            '"affected_systems": ["db-1"], "recommendations": []}\n'
+            'Note: see {runbook} for details.'
+        )
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker)
+        result = agent._parse_analysis_response(response)
+
+        assert result['root_cause'] == "Disk full"
+        assert result['affected_systems'] == ["db-1"]
+        assert "parse_error" not in result
+
     @pytest.mark.asyncio
     async def test_parse_analysis_response_with_incomplete_recommendations(self, mock_bedrock_client, mock_budget_tracker):
         """Test parsing response with incomplete recommendation objects."""
@@ -357,3 +421,101 @@ This should resolve the issue."""
         assert "Traffic spike" in result['root_cause']
         assert len(result['affected_systems']) == 3
         assert result['severity'] == "critical"
+
+
+class TestAnalysisAgentCache:
+    """Test suite for AnalysisAgent with an AnalysisCache."""
+
+    @pytest.fixture
+    def analysis_cache(self, tmp_path):
+        from src.services.analysis_cache import AnalysisCache
+        return AnalysisCache(cache_file=str(tmp_path / "analysis_cache.json"))
+
+    @pytest.mark.asyncio
+    async def test_repeated_issues_served_from_cache(self, mock_bedrock_client, mock_budget_tracker,
+                                                     sample_issues, analysis_cache):
+        """Test identical issue sets only call the LLM once."""
+        mock_bedrock_client.ainvoke.return_value = (
+            json.dumps({"root_cause": "Traffic spike", "severity": "high",
+                        "affected_systems": ["prod-server-1"], "recommendations": []}),
+            {"input_tokens": 1000, "output_tokens": 500, "total_tokens": 1500}
+        )
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker, analysis_cache=analysis_cache)
+        first = await agent.analyze(sample_issues)
+        second = await agent.analyze(sample_issues)
+
+        assert first['token_usage']['total_tokens'] == 1500
+        assert second['root_cause'] == "Traffic spike"
+        assert second['token_usage']['total_tokens'] == 0
+        assert second['token_usage']['cached'] is True
+        mock_bedrock_client.ainvoke.assert_called_once()
+        mock_budget_tracker.record_usage.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_near_identical_issues_served_from_cache(self, mock_bedrock_client, mock_budget_tracker,
+                                                           analysis_cache):
+        """Test issue sets differing only in metric values reuse the cached analysis."""
+        mock_bedrock_client.ainvoke.return_value = (
+            json.dumps({"root_cause": "Disk filling up", "severity": "high",
+                        "affected_systems": ["db-1"], "recommendations": []}),
+            {"input_tokens": 1000, "output_tokens": 500, "total_tokens": 1500}
+        )
+
+        def disk_issue(free_pct):
+            return [CollectorResult(
+                collector_name="vps", target_name="db-1", status=HealthStatus.RED,
+                metrics={"disk_free_pct": free_pct}, message=f"Disk free: {free_pct}%"
+            )]
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker, analysis_cache=analysis_cache)
+        await agent.analyze(disk_issue(9.0))
+        second = await agent.analyze(disk_issue(8.0))
+
+        assert second['root_cause'] == "Disk filling up"
+        assert second['token_usage']['semantic_cached'] is True
+        mock_bedrock_client.ainvoke.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_added_issue_not_served_from_cache(self, mock_bedrock_client, mock_budget_tracker,
+                                                     analysis_cache):
+        """Test a new RED issue on top of cached warnings is analyzed, not a near-duplicate."""
+        mock_bedrock_client.ainvoke.return_value = (
+            json.dumps({"root_cause": "Disks filling up", "severity": "medium",
+                        "affected_systems": [], "recommendations": []}),
+            {"input_tokens": 1000, "output_tokens": 500, "total_tokens": 1500}
+        )
+
+        warnings = [
+            CollectorResult(
+                collector_name="vps", target_name=f"server-{i}", status=HealthStatus.YELLOW,
+                metrics={"disk_free_pct": 15.0}, message="Disk free: 15.0%"
+            )
+            for i in range(10)
+        ]
+        outage = CollectorResult(
+            collector_name="database", target_name="db/main", status=HealthStatus.RED,
+            metrics={}, message="Connection failed"
+        )
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker, analysis_cache=analysis_cache)
+        await agent.analyze(warnings)
+        second = await agent.analyze(warnings + [outage])
+
+        # 10/11 Jaccard similarity would pass the 0.9 threshold
+        assert not second['token_usage'].get('semantic_cached')
+        assert mock_bedrock_client.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_cached(self, mock_bedrock_client, mock_budget_tracker,
+                                                   sample_issues, analysis_cache):
+        """Test parse failures are retried rather than served from cache."""
+        mock_bedrock_client.ainvoke.return_value = (
+            "not json", {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+        )
+
+        agent = AnalysisAgent(mock_bedrock_client, mock_budget_tracker, analysis_cache=analysis_cache)
+        await agent.analyze(sample_issues)
+        await agent.analyze(sample_issues)
+
+        assert mock_bedrock_client.ainvoke.call_count == 2
@@ -0,0 +1,35 @@
+"""Tests for report generation."""
+
+from src.agents.report_agent import ReportAgent
+from src.utils.metrics import CollectorResult
+from src.utils.status import HealthStatus
+
+
+def _result(collector, status):
+    return CollectorResult(
+        collector_name=collector, target_name=f"{collector}-target", status=status,
+        metrics={}, message="msg"
+    )
+
+
+class TestSummarySection:
+    """Test per-collector summary lines."""
+
+    def test_red_outranks_unknown(self):
+        section = ReportAgent()._build_summary_section({
+            "vps": [_result("vps", HealthStatus.UNKNOWN), _result("vps", HealthStatus.RED)],
+        })
+
+        assert "🔴 **VPS**: 0/2 healthy" in section
+
+    def test_worst_status_per_collector(self):
+        section = ReportAgent()._build_summary_section({
+            "api": [_result("api", HealthStatus.GREEN), _result("api", HealthStatus.YELLOW),
+                    _result("api", HealthStatus.RED)],
+            "s3": [_result("s3", HealthStatus.GREEN), _result("s3", HealthStatus.UNKNOWN)],
+            "ec2": [_result("ec2", HealthStatus.GREEN)],
+        })
+
+        assert "🔴 **API**: 1/3 healthy" in section
+        assert "⚪ **S3**: 1/2 healthy" in section
+        assert "🟢 **EC2**: 1/1 healthy" in section
@@ -0,0 +1,54 @@
+"""Tests for workflow state helpers."""
+
+from src.agents.state import add_token_usage, empty_token_usage, index_results
+from src.utils.metrics import CollectorResult
+from src.utils.status import HealthStatus
+
+
+class TestTokenUsageReducer:
+    """Test cumulative token usage reducer."""
+
+    def test_sums_each_key(self):
+        total = add_token_usage(
+            {"input": 100, "output": 20, "total": 120},
+            {"input": 50, "output": 10, "total": 60},
+        )
+
+        assert total == {"input": 150, "output": 30, "total": 180}
+
+    def test_missing_side_treated_as_zero(self):
+        usage = {"input": 5, "output": 1, "total": 6}
+
+        assert add_token_usage(None, usage) == usage
+        assert add_token_usage(usage, {}) == usage
+
+    def test_empty_token_usage_is_zeroed(self):
+        assert empty_token_usage() == {"input": 0, "output": 0, "total": 0}
+
+
+class TestIndexResults:
+    """Test single-pass result indexing."""
+
+    def test_builds_issue_partitions_and_groups(self):
+        results = [
+            CollectorResult("ec2", "a", HealthStatus.RED, {}, "High CPU"),
+            CollectorResult("ec2", "b", HealthStatus.GREEN, {}, "OK"),
+            CollectorResult("api", "c", HealthStatus.YELLOW, {}, "Slow"),
+            CollectorResult("api", "d", HealthStatus.UNKNOWN, {}, "Check failed"),
+        ]
+
+        update = index_results(results)
+
+        assert update["all_results"] is results
+        assert [r.target_name for r in update["issues"]] == ["a", "c", "d"]
+        assert update["status_counts"][HealthStatus.GREEN] == 1
+        assert update["status_counts"][HealthStatus.RED] == 1
+        assert [r.target_name for r in update["issues_by_status"][HealthStatus.YELLOW]] == ["c"]
+        assert [r.target_name for r in update["results_by_collector"]["ec2"]] == ["a", "b"]
+
+    def test_empty_results(self):
+        update = index_results([])
+
+        assert update["issues"] == []
+        assert update["results_by_collector"] == {}
+        assert all(count == 0 for count in update["status_counts"].values())
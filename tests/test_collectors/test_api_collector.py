@@ -172,5 +172,25 @@ async def test_api_collector_parallel_execution(api_configs, thresholds, logger)
         assert len(results) == 2
 
 
+
+@pytest.mark.asyncio
+async def test_api_collector_shares_one_client(api_configs, thresholds, logger):
+    """Test that all endpoints are checked through a single HTTP client."""
+    collector = APICollector(api_configs, thresholds, logger)
+
+    with patch('httpx.AsyncClient') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_client.get.return_value = mock_response
+
+        results = await collector.collect()
+
+        assert mock_client_class.call_count == 1
+        assert mock_client.get.call_count == len(api_configs)
+        assert len(results) == len(api_configs)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,8 +1,10 @@
 """Tests for BaseCollector class."""
 
+import asyncio
+
 import pytest
-from src.collectors.base import BaseCollector
-from src.utils.status import HealthStatus
+from src.collectors.base import BaseCollector, as_completed_indexed, safe_collect
+from src.utils.status import HealthStatus, worst_status
 from src.utils.metrics import CollectorResult
 
 
@@ -243,3 +245,78 @@ class TestBaseCollector:
         assert collector._determine_status("metric", 90.1, True) == HealthStatus.RED
         assert collector._determine_status("metric", 70.5, True) == HealthStatus.YELLOW
         assert collector._determine_status("metric", 69.9, True) == HealthStatus.GREEN
+
+
+class FailingCollector(MockCollector):
+    """Collector whose collect() always raises."""
+
+    @safe_collect
+    async def collect(self):
+        """Raise to exercise safe_collect."""
+        raise RuntimeError("boom")
+
+
+class TestSafeCollect:
+    """Test suite for safe_collect decorator."""
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_unknown_result(self):
+        """Test that collector exceptions are converted to an UNKNOWN result."""
+        results = await FailingCollector().collect()
+
+        assert len(results) == 1
+        assert results[0].status == HealthStatus.UNKNOWN
+        assert results[0].collector_name == "failing"
+
+    def test_untraced_wrapper_is_single_layer(self, monkeypatch):
+        """Test that the traceable layer is skipped when tracing is disabled."""
+        monkeypatch.delenv("LANGCHAIN_TRACING_V2", raising=False)
+        monkeypatch.delenv("LANGSMITH_TRACING", raising=False)
+
+        async def collect(self):
+            return []
+
+        wrapped = safe_collect(collect)
+
+        assert wrapped.__name__ == "collect"
+        assert wrapped.__wrapped__ is collect
+
+
+class TestAsCompletedIndexed:
+    """Test suite for as_completed_indexed helper."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order_with_indices(self):
+        """Test that results arrive as they finish, tagged with their position."""
+        async def value_after(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        async def fail():
+            raise ValueError("bad")
+
+        seen = [item async for item in as_completed_indexed([
+            value_after("slow", 0.05),
+            value_after("fast", 0),
+            fail(),
+        ])]
+
+        assert seen[-1] == (0, "slow")
+        assert (1, "fast") in seen
+        errors = [(i, r) for i, r in seen if isinstance(r, Exception)]
+        assert len(errors) == 1 and errors[0][0] == 2
+
+
+class TestWorstStatus:
+    """Test suite for worst_status helper."""
+
+    def test_worst_status_wins(self):
+        """Test that the most severe status is returned regardless of order."""
+        assert worst_status([HealthStatus.GREEN, HealthStatus.RED, HealthStatus.YELLOW]) == HealthStatus.RED
+        assert worst_status([HealthStatus.YELLOW, HealthStatus.GREEN]) == HealthStatus.YELLOW
+        assert worst_status([HealthStatus.GREEN]) == HealthStatus.GREEN
+
+    def test_unknown_ranks_between_green_and_yellow(self):
+        """Test that an unjudged metric outranks GREEN but not YELLOW."""
+        assert worst_status([HealthStatus.GREEN, HealthStatus.UNKNOWN]) == HealthStatus.UNKNOWN
+        assert worst_status([HealthStatus.UNKNOWN, HealthStatus.YELLOW]) == HealthStatus.YELLOW
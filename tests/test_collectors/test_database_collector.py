@@ -1,7 +1,7 @@
 """Tests for Database collector."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.collectors.database_collector import DatabaseCollector
 from src.config.models import DatabaseConfig
@@ -23,27 +23,46 @@ def db_configs(database_configs):
     ]
 
 
+class _PostgresError(Exception):
+    """Stand-in for asyncpg.PostgresError."""
+
+
+class _InterfaceError(Exception):
+    """Stand-in for asyncpg.InterfaceError."""
+
+
+def _mock_asyncpg(fetchval_side_effect=None, create_pool_side_effect=None):
+    """Build an asyncpg module mock whose pools hand out one mocked connection."""
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(side_effect=fetchval_side_effect)
+
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool.close = AsyncMock()
+
+    module = MagicMock()
+    module.PostgresError = _PostgresError
+    module.InterfaceError = _InterfaceError
+    module.create_pool = AsyncMock(return_value=pool, side_effect=create_pool_side_effect)
+    return module
+
+
+def _credentials(key, default=None):
+    return {
+        'POSTGRES_USER': 'test_user',
+        'POSTGRES_PASSWORD': 'test_pass'
+    }.get(key, default)
+
+
 @pytest.mark.asyncio
 async def test_database_collector_success(db_configs, thresholds, logger):
     """Test successful database connections."""
     collector = DatabaseCollector(db_configs, thresholds, logger)
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=lambda q, *args: "PostgreSQL 14.5" if "version" in q else 1)
 
-    with patch('src.collectors.database_collector.psycopg2') as mock_psycopg2:
-        # Mock successful connection
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-
-        mock_cursor.fetchone.return_value = ("PostgreSQL 14.5",)
-        mock_conn.cursor.return_value = mock_cursor
-        mock_psycopg2.connect.return_value = mock_conn
-
-        # Mock environment variables
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'POSTGRES_USER': 'test_user',
-                'POSTGRES_PASSWORD': 'test_pass'
-            }.get(key, default)
-
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
             # Execute
             results = await collector.collect()
 
@@ -63,24 +82,11 @@ async def test_database_collector_with_table_count(db_configs, thresholds, logge
     """Test database check with table row count."""
     collector = DatabaseCollector([db_configs[1]], thresholds, logger)
 
-    with patch('src.collectors.database_collector.psycopg2') as mock_psycopg2:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-
-        # Mock version query and table count
-        mock_cursor.fetchone.side_effect = [
-            ("PostgreSQL 14.5",),  # Version query
-            (12345,)  # Row count query
-        ]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_psycopg2.connect.return_value = mock_conn
-
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'POSTGRES_USER': 'test_user',
-                'POSTGRES_PASSWORD': 'test_pass'
-            }.get(key, default)
+    # Mock version query and table count
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=["PostgreSQL 14.5", 12345])
 
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
             # Execute
             results = await collector.collect()
 
@@ -89,6 +95,51 @@ async def test_database_collector_with_table_count(db_configs, thresholds, logge
             assert results[0].status == HealthStatus.GREEN
             assert "row_count" in results[0].metrics
             assert results[0].metrics["row_count"] == 12345
+            assert results[0].metrics["row_count_estimated"] is True
+
+            # Estimate comes from the catalog, not a table scan
+            table_query = mock_asyncpg.create_pool.return_value.acquire.return_value \
+                .__aenter__.return_value.fetchval.await_args
+            assert "reltuples" in table_query.args[0]
+            assert db_configs[1].table in table_query.args[1]
+
+
+@pytest.mark.asyncio
+async def test_database_collector_unanalyzed_table(db_configs, thresholds, logger):
+    """Test that a never-analyzed table reports an unknown row count without a COUNT."""
+    collector = DatabaseCollector([db_configs[1]], thresholds, logger)
+
+    # Version, then reltuples = -1 (never analyzed)
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=["PostgreSQL 14.5", -1])
+
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
+            results = await collector.collect()
+
+            assert results[0].status == HealthStatus.GREEN
+            assert results[0].metrics["row_count"] is None
+            assert results[0].metrics["row_count_note"] == "never analyzed"
+            assert "never analyzed" in results[0].message
+            conn = mock_asyncpg.create_pool.return_value.acquire.return_value.__aenter__.return_value
+            assert conn.fetchval.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_database_collector_missing_table(db_configs, thresholds, logger):
+    """Test that a table unknown to to_regclass() is reported without a COUNT."""
+    collector = DatabaseCollector([db_configs[1]], thresholds, logger)
+
+    # Version, then no pg_class row
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=["PostgreSQL 14.5", None])
+
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
+            results = await collector.collect()
+
+            assert results[0].status == HealthStatus.GREEN
+            assert results[0].metrics["table_query_error"] == "UndefinedTableError"
+            conn = mock_asyncpg.create_pool.return_value.acquire.return_value.__aenter__.return_value
+            assert conn.fetchval.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -96,16 +147,11 @@ async def test_database_collector_connection_failure(db_configs, thresholds, log
     """Test database connection failure (RED)."""
     collector = DatabaseCollector([db_configs[0]], thresholds, logger)
 
-    with patch('src.collectors.database_collector.psycopg2') as mock_psycopg2:
-        # Mock connection error
-        mock_psycopg2.connect.side_effect = Exception("Connection refused")
-
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'POSTGRES_USER': 'test_user',
-                'POSTGRES_PASSWORD': 'test_pass'
-            }.get(key, default)
+    # Mock connection error
+    mock_asyncpg = _mock_asyncpg(create_pool_side_effect=OSError("Connection refused"))
 
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
             # Execute
             results = await collector.collect()
 
@@ -117,35 +163,33 @@ async def test_database_collector_connection_failure(db_configs, thresholds, log
 
 @pytest.mark.asyncio
 async def test_database_collector_missing_credentials(db_configs, thresholds, logger):
-    """Test missing database credentials (RED)."""
+    """Test missing database credentials (UNKNOWN)."""
     collector = DatabaseCollector([db_configs[0]], thresholds, logger)
 
-    with patch('src.collectors.database_collector.psycopg2'):
+    with patch('src.collectors.database_collector.asyncpg', _mock_asyncpg()):
         # Mock missing credentials
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.return_value = None
-
+        with patch('os.getenv', return_value=None):
             # Execute
             results = await collector.collect()
 
-            # Verify RED status for missing credentials
+            # Verify UNKNOWN status for missing credentials
             assert len(results) == 1
-            assert results[0].status == HealthStatus.RED
+            assert results[0].status == HealthStatus.UNKNOWN
 
 
 @pytest.mark.asyncio
-async def test_database_collector_no_psycopg2(db_configs, thresholds, logger):
-    """Test graceful handling when psycopg2 not installed."""
+async def test_database_collector_no_asyncpg(db_configs, thresholds, logger):
+    """Test graceful handling when asyncpg not installed."""
     collector = DatabaseCollector(db_configs, thresholds, logger)
 
-    # Mock psycopg2 as unavailable
-    with patch('src.collectors.database_collector.psycopg2', None):
+    # Mock asyncpg as unavailable
+    with patch('src.collectors.database_collector.asyncpg', None):
         results = await collector.collect()
 
         # Should return single UNKNOWN result
         assert len(results) == 1
         assert results[0].status == HealthStatus.UNKNOWN
-        assert "psycopg2" in results[0].message.lower()
+        assert "asyncpg" in results[0].message.lower()
 
 
 @pytest.mark.asyncio
@@ -163,20 +207,10 @@ async def test_database_collector_empty_config(thresholds, logger):
 async def test_database_collector_parallel_execution(db_configs, thresholds, logger):
     """Test that multiple databases are checked in parallel."""
     collector = DatabaseCollector(db_configs, thresholds, logger)
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=lambda q, *args: "PostgreSQL 14.5" if "version" in q else 1)
 
-    with patch('src.collectors.database_collector.psycopg2') as mock_psycopg2:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = ("PostgreSQL 14.5",)
-        mock_conn.cursor.return_value = mock_cursor
-        mock_psycopg2.connect.return_value = mock_conn
-
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'POSTGRES_USER': 'test_user',
-                'POSTGRES_PASSWORD': 'test_pass'
-            }.get(key, default)
-
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
             # Execute
             import time
             start = time.time()
@@ -193,30 +227,62 @@ async def test_database_collector_query_error(db_configs, thresholds, logger):
     """Test database query execution error."""
     collector = DatabaseCollector([db_configs[1]], thresholds, logger)
 
-    with patch('src.collectors.database_collector.psycopg2') as mock_psycopg2:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-
-        # First query (version) succeeds, second query (table count) fails
-        mock_cursor.fetchone.side_effect = [
-            ("PostgreSQL 14.5",),
-            Exception("Table does not exist")
-        ]
-        mock_cursor.execute.side_effect = [None, Exception("Table does not exist")]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_psycopg2.connect.return_value = mock_conn
-
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'POSTGRES_USER': 'test_user',
-                'POSTGRES_PASSWORD': 'test_pass'
-            }.get(key, default)
+    # First query (version) succeeds, second query (table count) fails
+    mock_asyncpg = _mock_asyncpg(
+        fetchval_side_effect=["PostgreSQL 14.5", _PostgresError("Table does not exist")]
+    )
 
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
             # Execute
             results = await collector.collect()
 
             # Should still return GREEN if connection works, even if table query fails
             assert len(results) == 1
+            assert results[0].status == HealthStatus.GREEN
+            assert results[0].metrics["table_query_error"] == "_PostgresError"
+
+
+@pytest.mark.asyncio
+async def test_database_collector_reuses_pool(db_configs, thresholds, logger):
+    """Test that the connection pool is created once and reused across ticks."""
+    collector = DatabaseCollector([db_configs[0]], thresholds, logger)
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=lambda q, *args: "PostgreSQL 14.5")
+
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials) as getenv:
+            await collector.collect()
+            await collector.collect()
+
+            assert mock_asyncpg.create_pool.await_count == 1
+            # Credentials are read from the environment once, not per check
+            assert getenv.call_count == 2
+            server_settings = mock_asyncpg.create_pool.await_args.kwargs["server_settings"]
+            assert server_settings["statement_timeout"] == "5000"
+            assert server_settings["lock_timeout"] == "2000"
+
+            await collector.close()
+            mock_asyncpg.create_pool.return_value.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_database_collector_reconnects_stale_pool(db_configs, thresholds, logger):
+    """Test that a pooled connection lost between ticks is rebuilt once."""
+    collector = DatabaseCollector([db_configs[0]], thresholds, logger)
+    mock_asyncpg = _mock_asyncpg(fetchval_side_effect=[
+        "PostgreSQL 14.5",                          # First tick
+        _InterfaceError("connection was closed"),   # Second tick, stale pool
+        "PostgreSQL 14.5",                          # Retry on a fresh pool
+    ])
+
+    with patch('src.collectors.database_collector.asyncpg', mock_asyncpg):
+        with patch('os.getenv', side_effect=_credentials):
+            await collector.collect()
+            results = await collector.collect()
+
+            assert results[0].status == HealthStatus.GREEN
+            assert mock_asyncpg.create_pool.await_count == 2
+            mock_asyncpg.create_pool.return_value.terminate.assert_called_once()
 
 
 if __name__ == "__main__":
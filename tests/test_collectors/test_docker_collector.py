@@ -13,43 +13,39 @@ from src.utils.status import HealthStatus
 
 @pytest.fixture
 def mock_docker_outputs():
-    """Create mock docker ps JSON outputs."""
+    """Create mock docker inspect JSON outputs (one object per container)."""
     return {
         'healthy': json.dumps({
-            "Command": "nginx -g 'daemon off;'",
-            "CreatedAt": "2024-01-15 10:30:45",
-            "ID": "abc123def456",
+            "ID": "abc123def456789",
+            "Name": "/web-server",
             "Image": "nginx:latest",
-            "Names": "web-server",
-            "Ports": "0.0.0.0:80->80/tcp",
-            "Status": "Up 2 days (healthy)"
+            "State": "running",
+            "ExitCode": 0,
+            "Health": "healthy"
         }),
         'unhealthy': json.dumps({
-            "Command": "python app.py",
-            "CreatedAt": "2024-01-15 10:30:50",
-            "ID": "def456ghi789",
+            "ID": "def456ghi789012",
+            "Name": "/api-server",
             "Image": "python:3.11",
-            "Names": "api-server",
-            "Ports": "0.0.0.0:8000->8000/tcp",
-            "Status": "Up 2 days (unhealthy)"
+            "State": "running",
+            "ExitCode": 0,
+            "Health": "unhealthy"
         }),
         'stopped': json.dumps({
-            "Command": "/bin/sh",
-            "CreatedAt": "2024-01-14 10:00:00",
-            "ID": "ghi789jkl012",
+            "ID": "ghi789jkl012345",
+            "Name": "/worker",
             "Image": "alpine:latest",
-            "Names": "worker",
-            "Ports": "",
-            "Status": "Exited (1) 2 hours ago"
+            "State": "exited",
+            "ExitCode": 1,
+            "Health": None
         }),
         'restarting': json.dumps({
-            "Command": "node server.js",
-            "CreatedAt": "2024-01-15 11:00:00",
-            "ID": "jkl012mno345",
+            "ID": "jkl012mno345678",
+            "Name": "/frontend",
             "Image": "node:18",
-            "Names": "frontend",
-            "Ports": "3000/tcp",
-            "Status": "Restarting (1) 5 seconds ago"
+            "State": "restarting",
+            "ExitCode": 1,
+            "Health": None
         })
     }
 
@@ -64,7 +60,7 @@ async def test_docker_collector_healthy_containers(vps_configs, thresholds, logg
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock docker ps output with healthy container
+        # Mock docker inspect output with healthy container
         mock_ssh.exec_command.return_value = mock_docker_outputs['healthy']
 
         # Execute
@@ -89,7 +85,7 @@ async def test_docker_collector_unhealthy_container(vps_configs, thresholds, log
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock docker ps output with unhealthy container
+        # Mock docker inspect output with unhealthy container
         mock_ssh.exec_command.return_value = mock_docker_outputs['unhealthy']
 
         # Execute
@@ -111,7 +107,7 @@ async def test_docker_collector_stopped_container(vps_configs, thresholds, logge
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock docker ps output with exited container
+        # Mock docker inspect output with exited container
         mock_ssh.exec_command.return_value = mock_docker_outputs['stopped']
 
         # Execute
@@ -133,7 +129,7 @@ async def test_docker_collector_restarting_container(vps_configs, thresholds, lo
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock docker ps output with restarting container
+        # Mock docker inspect output with restarting container
         mock_ssh.exec_command.return_value = mock_docker_outputs['restarting']
 
         # Execute
@@ -155,7 +151,7 @@ async def test_docker_collector_multiple_containers(vps_configs, thresholds, log
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock docker ps output with multiple containers (one per line)
+        # Mock docker inspect output with multiple containers (one per line)
         docker_output = "\n".join([
             mock_docker_outputs['healthy'],
             mock_docker_outputs['unhealthy'],
@@ -183,7 +179,7 @@ async def test_docker_collector_no_containers(vps_configs, thresholds, logger):
         mock_ssh.create_client.return_value = mock_client
         mock_ssh.is_available.return_value = True
 
-        # Mock empty docker ps output
+        # Mock empty docker inspect output
         mock_ssh.exec_command.return_value = ""
 
         # Execute
@@ -241,7 +237,7 @@ async def test_docker_collector_empty_config(thresholds, logger):
 
 @pytest.mark.asyncio
 async def test_docker_collector_invalid_json(vps_configs, thresholds, logger):
-    """Test handling of invalid JSON in docker ps output."""
+    """Test handling of invalid JSON in docker inspect output."""
     collector = DockerCollector(vps_configs, thresholds, logger)
 
     with patch('src.collectors.docker_collector.SSHHelper') as mock_ssh:
@@ -272,11 +268,12 @@ async def test_docker_collector_exit_code_zero(vps_configs, thresholds, logger):
 
         # Mock stopped container with exit code 0
         stopped_clean = json.dumps({
-            "Command": "echo done",
             "ID": "abc123",
+            "Name": "/one-time-job",
             "Image": "alpine",
-            "Names": "one-time-job",
-            "Status": "Exited (0) 1 hour ago"
+            "State": "exited",
+            "ExitCode": 0,
+            "Health": None
         })
 
         mock_ssh.exec_command.return_value = stopped_clean
@@ -290,5 +287,50 @@ async def test_docker_collector_exit_code_zero(vps_configs, thresholds, logger):
         assert "0" in results[0].message or "clean" in results[0].message.lower()
 
 
+@pytest.mark.asyncio
+async def test_docker_collector_reuses_ssh_connection(vps_configs, thresholds, logger, mock_docker_outputs):
+    """Test that the SSH connection is opened once and reused across ticks."""
+    collector = DockerCollector([vps_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.docker_collector.SSHHelper') as mock_ssh:
+        mock_client = MagicMock()
+        mock_ssh.create_client.return_value = mock_client
+        mock_ssh.is_available.return_value = True
+        mock_ssh.is_connected.return_value = True
+        mock_ssh.exec_command.return_value = mock_docker_outputs['healthy']
+
+        await collector.collect()
+        await collector.collect()
+
+        assert mock_ssh.create_client.call_count == 1
+        assert mock_ssh.exec_command.call_count == 2
+        mock_ssh.close_client.assert_not_called()
+
+        await collector.close()
+        mock_ssh.close_client.assert_called_once_with(mock_client, collector.logger)
+
+
+@pytest.mark.asyncio
+async def test_docker_collector_reconnects_dropped_connection(vps_configs, thresholds, logger, mock_docker_outputs):
+    """Test that a cached connection that drops between ticks is replaced once."""
+    collector = DockerCollector([vps_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.docker_collector.SSHHelper') as mock_ssh:
+        mock_ssh.create_client.side_effect = [MagicMock(), MagicMock()]
+        mock_ssh.is_available.return_value = True
+        mock_ssh.is_connected.return_value = True
+        mock_ssh.exec_command.side_effect = [
+            mock_docker_outputs['healthy'],        # First tick
+            EOFError("connection reset"),          # Second tick, stale connection
+            mock_docker_outputs['healthy'],        # Retry on a new connection
+        ]
+
+        await collector.collect()
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert mock_ssh.create_client.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,6 +10,42 @@ from src.utils.status import HealthStatus
 # Fixtures imported from conftest.py: ec2_configs, thresholds, logger
 
 
+def _metric_data(value, disk_used=None):
+    """Build a get_metric_data side effect returning value for CPU queries and disk_used for disk ones (None = no data)."""
+    def get_metric_data(MetricDataQueries, **kwargs):
+        results = []
+        for query in MetricDataQueries:
+            metric_name = query['MetricStat']['Metric']['MetricName']
+            result = disk_used if metric_name == 'disk_used_percent' else value
+            results.append({
+                'Id': query['Id'],
+                'Timestamps': [] if result is None else [datetime.utcnow()],
+                'Values': [] if result is None else [result],
+                'StatusCode': 'Complete'
+            })
+        return {'MetricDataResults': results}
+    return get_metric_data
+
+
+def _describe_instances(state='running'):
+    """Build a describe_instances side effect echoing every requested instance."""
+    def describe_instances(InstanceIds):
+        return {
+            'Reservations': [{
+                'Instances': [
+                    {
+                        'InstanceId': instance_id,
+                        'State': {'Name': state},
+                        'InstanceType': 't3.medium',
+                        'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
+                    }
+                    for instance_id in InstanceIds
+                ]
+            }]
+        }
+    return describe_instances
+
+
 @pytest.mark.asyncio
 async def test_ec2_collector_success(ec2_configs, thresholds, logger):
     """Test successful EC2 instance checks using real config."""
@@ -25,28 +61,11 @@ async def test_ec2_collector_success(ec2_configs, thresholds, logger):
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        # Mock describe_instances response for any instance
-        def mock_describe_instances(InstanceIds):
-            return {
-                'Reservations': [{
-                    'Instances': [{
-                        'InstanceId': InstanceIds[0],
-                        'State': {'Name': 'running'},
-                        'InstanceType': 't3.medium',
-                        'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                    }]
-                }]
-            }
-
-        mock_ec2_client.describe_instances.side_effect = mock_describe_instances
+        # Mock describe_instances response for every requested instance
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
-        # Mock get_metric_statistics response (low CPU)
-        mock_cloudwatch_client.get_metric_statistics.return_value = {
-            'Datapoints': [{
-                'Timestamp': datetime.utcnow(),
-                'Average': 25.5
-            }]
-        }
+        # Mock get_metric_data response (low CPU)
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(25.5)
 
         # Execute
         results = await collector.collect()
@@ -79,24 +98,10 @@ async def test_ec2_collector_high_cpu(ec2_configs, thresholds, logger):
         }[service]
 
         # Mock running instance
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
         # Mock high CPU metric
-        mock_cloudwatch_client.get_metric_statistics.return_value = {
-            'Datapoints': [{
-                'Timestamp': datetime.utcnow(),
-                'Average': 95.0
-            }]
-        }
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(95.0)
 
         # Execute
         results = await collector.collect()
@@ -118,16 +123,7 @@ async def test_ec2_collector_instance_stopped(ec2_configs, thresholds, logger):
         mock_boto3.client.return_value = mock_ec2_client
 
         # Mock stopped instance
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'stopped'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances('stopped')
 
         # Execute
         results = await collector.collect()
@@ -154,21 +150,10 @@ async def test_ec2_collector_no_metrics(ec2_configs, thresholds, logger):
         }[service]
 
         # Mock running instance
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
         # Mock no metrics available
-        mock_cloudwatch_client.get_metric_statistics.return_value = {
-            'Datapoints': []
-        }
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(None)
 
         # Execute
         results = await collector.collect()
@@ -232,6 +217,60 @@ async def test_ec2_collector_aws_api_error(ec2_configs, thresholds, logger):
         assert results[0].status == HealthStatus.RED
 
 
+@pytest.mark.asyncio
+async def test_ec2_collector_throttled(ec2_configs, thresholds, logger):
+    """Test that throttling is YELLOW and a throttled batch isn't retried per instance."""
+    collector = EC2Collector(ec2_configs, thresholds, logger)
+
+    with patch('src.collectors.ec2_collector.boto3') as mock_boto3:
+        mock_ec2_client = MagicMock()
+        mock_boto3.client.return_value = mock_ec2_client
+
+        from botocore.exceptions import ClientError
+        mock_ec2_client.describe_instances.side_effect = ClientError(
+            {'Error': {'Code': 'RequestLimitExceeded', 'Message': 'Request limit exceeded.'}},
+            'DescribeInstances'
+        )
+
+        results = await collector.collect()
+
+        assert all(r.status == HealthStatus.YELLOW for r in results)
+        assert "throttled" in results[0].message.lower()
+        # One batched call per region, no per-instance fallback
+        regions = {config.region for config in ec2_configs}
+        assert mock_ec2_client.describe_instances.call_count == len(regions)
+
+
+@pytest.mark.asyncio
+async def test_ec2_collector_metric_data_throttled(ec2_configs, thresholds, logger):
+    """Test that a throttled GetMetricData is YELLOW and skips the per-instance disk fallback."""
+    configs = [config.model_copy(update={"monitor_disk": True}) for config in ec2_configs]
+    collector = EC2Collector(configs, thresholds, logger)
+
+    with patch('src.collectors.ec2_collector.boto3') as mock_boto3:
+        mock_ec2_client = MagicMock()
+        mock_cloudwatch_client = MagicMock()
+
+        mock_boto3.client.side_effect = lambda service, **kwargs: {
+            'ec2': mock_ec2_client,
+            'cloudwatch': mock_cloudwatch_client
+        }[service]
+
+        from botocore.exceptions import ClientError
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
+        mock_cloudwatch_client.get_metric_data.side_effect = ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}},
+            'GetMetricData'
+        )
+
+        results = await collector.collect()
+
+        assert all(r.status == HealthStatus.YELLOW for r in results)
+        assert all(r.message == "AWS API throttled" for r in results)
+        mock_cloudwatch_client.get_metric_statistics.assert_not_called()
+        mock_cloudwatch_client.list_metrics.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_ec2_collector_no_boto3(ec2_configs, thresholds, logger):
     """Test graceful handling when boto3 not installed."""
@@ -273,23 +312,9 @@ async def test_ec2_collector_multiple_regions(ec2_configs, thresholds, logger):
                 mock_clients[key] = MagicMock()
 
                 if service == 'ec2':
-                    # Return correct instance based on InstanceIds parameter
-                    def mock_describe_instances(InstanceIds):
-                        return {
-                            'Reservations': [{
-                                'Instances': [{
-                                    'InstanceId': InstanceIds[0],
-                                    'State': {'Name': 'running'},
-                                    'InstanceType': 't3.medium',
-                                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                                }]
-                            }]
-                        }
-                    mock_clients[key].describe_instances.side_effect = mock_describe_instances
+                    mock_clients[key].describe_instances.side_effect = _describe_instances()
                 elif service == 'cloudwatch':
-                    mock_clients[key].get_metric_statistics.return_value = {
-                        'Datapoints': [{'Timestamp': datetime.utcnow(), 'Average': 30.0}]
-                    }
+                    mock_clients[key].get_metric_data.side_effect = _metric_data(30.0)
 
             return mock_clients[key]
 
@@ -320,23 +345,9 @@ async def test_ec2_collector_parallel_execution(ec2_configs, thresholds, logger)
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        # Mock describe_instances to return correct instance based on InstanceIds parameter
-        def mock_describe_instances(InstanceIds):
-            return {
-                'Reservations': [{
-                    'Instances': [{
-                        'InstanceId': InstanceIds[0],
-                        'State': {'Name': 'running'},
-                        'InstanceType': 't3.medium',
-                        'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                    }]
-                }]
-            }
-
-        mock_ec2_client.describe_instances.side_effect = mock_describe_instances
-        mock_cloudwatch_client.get_metric_statistics.return_value = {
-            'Datapoints': [{'Timestamp': datetime.utcnow(), 'Average': 30.0}]
-        }
+        # Mock describe_instances to return every requested instance
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(30.0)
 
         # Execute
         import time
@@ -376,38 +387,10 @@ async def test_ec2_collector_with_disk_monitoring(thresholds, logger):
         }[service]
 
         # Mock running instance
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
-        # Mock get_metric_statistics to return different metrics based on call
-        def mock_get_metrics(**kwargs):
-            metric_name = kwargs.get('MetricName')
-            if metric_name == 'CPUUtilization':
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 25.0
-                    }]
-                }
-            elif metric_name == 'disk_used_percent':
-                # 75% used = 25% free (GREEN)
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 75.0
-                    }]
-                }
-            return {'Datapoints': []}
-
-        mock_cloudwatch_client.get_metric_statistics.side_effect = mock_get_metrics
+        # CPU and disk in one batched call: 75% used = 25% free (GREEN)
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(25.0, disk_used=75.0)
 
         # Execute
         results = await collector.collect()
@@ -420,6 +403,10 @@ async def test_ec2_collector_with_disk_monitoring(thresholds, logger):
         assert "CPU: 25.0%" in results[0].message
         assert "Disk free: 25.0%" in results[0].message
 
+        # Both metrics came from one GetMetricData request
+        assert mock_cloudwatch_client.get_metric_data.call_count == 1
+        mock_cloudwatch_client.get_metric_statistics.assert_not_called()
+
 
 @pytest.mark.asyncio
 async def test_ec2_collector_low_disk_space(thresholds, logger):
@@ -444,37 +431,10 @@ async def test_ec2_collector_low_disk_space(thresholds, logger):
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
-        def mock_get_metrics(**kwargs):
-            metric_name = kwargs.get('MetricName')
-            if metric_name == 'CPUUtilization':
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 30.0
-                    }]
-                }
-            elif metric_name == 'disk_used_percent':
-                # 95% used = 5% free (RED - below threshold of 10%)
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 95.0
-                    }]
-                }
-            return {'Datapoints': []}
-
-        mock_cloudwatch_client.get_metric_statistics.side_effect = mock_get_metrics
+        # 95% used = 5% free (RED - below threshold of 10%)
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(30.0, disk_used=95.0)
 
         # Execute
         results = await collector.collect()
@@ -509,34 +469,11 @@ async def test_ec2_collector_disk_monitoring_no_agent(thresholds, logger):
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
-            }]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
-        def mock_get_metrics(**kwargs):
-            metric_name = kwargs.get('MetricName')
-            if metric_name == 'CPUUtilization':
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 30.0
-                    }]
-                }
-            elif metric_name == 'disk_used_percent':
-                # No data - CloudWatch Agent not installed
-                return {'Datapoints': []}
-            return {'Datapoints': []}
-
-        # list_metrics also returns empty (agent not installed)
+        # No disk data - CloudWatch Agent not installed; list_metrics also returns empty
         mock_cloudwatch_client.list_metrics.return_value = {'Metrics': []}
-        mock_cloudwatch_client.get_metric_statistics.side_effect = mock_get_metrics
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(30.0, disk_used=None)
 
         # Execute
         results = await collector.collect()
@@ -574,45 +511,17 @@ async def test_ec2_collector_disk_auto_discovery(thresholds, logger):
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        mock_ec2_client.describe_instances.return_value = {
-            'Reservations': [{
-                'Instances': [{
-                    'InstanceId': 'i-1234567890abcdef0',
-                    'State': {'Name': 'running'},
-                    'InstanceType': 't3.medium',
-                    'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                }]
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
+
+        # Batched query with partial dimensions returns no disk data;
+        # the per-instance fallback finds it after auto-discovery
+        mock_cloudwatch_client.get_metric_statistics.return_value = {
+            'Datapoints': [{
+                'Timestamp': datetime.utcnow(),
+                'Average': 60.0
             }]
         }
 
-        # First call with partial dimensions returns no data
-        # Second call after auto-discovery returns data
-        call_count = [0]
-
-        def mock_get_metrics(**kwargs):
-            metric_name = kwargs.get('MetricName')
-            if metric_name == 'CPUUtilization':
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 40.0
-                    }]
-                }
-            elif metric_name == 'disk_used_percent':
-                call_count[0] += 1
-                if call_count[0] == 1:
-                    # First call - no data with partial dimensions
-                    return {'Datapoints': []}
-                else:
-                    # Second call - after auto-discovery
-                    return {
-                        'Datapoints': [{
-                            'Timestamp': datetime.utcnow(),
-                            'Average': 60.0
-                        }]
-                    }
-            return {'Datapoints': []}
-
         # Mock list_metrics to return discovered dimensions
         mock_cloudwatch_client.list_metrics.return_value = {
             'Metrics': [{
@@ -627,7 +536,7 @@ async def test_ec2_collector_disk_auto_discovery(thresholds, logger):
             }]
         }
 
-        mock_cloudwatch_client.get_metric_statistics.side_effect = mock_get_metrics
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(40.0, disk_used=None)
 
         # Execute
         results = await collector.collect()
@@ -637,6 +546,58 @@ async def test_ec2_collector_disk_auto_discovery(thresholds, logger):
         assert results[0].status == HealthStatus.GREEN
         assert results[0].metrics["disk_free_pct"] == 40.0  # 100 - 60
         assert "Disk free: 40.0%" in results[0].message
+        discovered = mock_cloudwatch_client.get_metric_statistics.call_args.kwargs['Dimensions']
+        assert {'Name': 'device', 'Value': 'nvme0n1p1'} in discovered
+
+
+@pytest.mark.asyncio
+async def test_ec2_collector_reuses_discovered_disk_dimensions(thresholds, logger):
+    """Test that auto-discovered disk dimensions are queried in the batch on later ticks."""
+    from src.config.models import EC2InstanceConfig
+
+    config_auto_disk = EC2InstanceConfig(
+        instance_id="i-1234567890abcdef0",
+        name="test-auto-disk",
+        region="us-east-1",
+        monitor_disk=True
+    )
+
+    collector = EC2Collector([config_auto_disk], thresholds, logger)
+
+    with patch('src.collectors.ec2_collector.boto3') as mock_boto3:
+        mock_ec2_client = MagicMock()
+        mock_cloudwatch_client = MagicMock()
+
+        mock_boto3.client.side_effect = lambda service, **kwargs: {
+            'ec2': mock_ec2_client,
+            'cloudwatch': mock_cloudwatch_client
+        }[service]
+
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
+        discovered = [
+            {'Name': 'InstanceId', 'Value': 'i-1234567890abcdef0'},
+            {'Name': 'path', 'Value': '/'},
+            {'Name': 'device', 'Value': 'xvda1'},
+            {'Name': 'fstype', 'Value': 'xfs'}
+        ]
+        mock_cloudwatch_client.list_metrics.return_value = {'Metrics': [{'Dimensions': discovered}]}
+        mock_cloudwatch_client.get_metric_statistics.return_value = {
+            'Datapoints': [{'Timestamp': datetime.utcnow(), 'Average': 60.0}]
+        }
+
+        # First tick: partial dimensions find nothing, so discovery runs
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(40.0, disk_used=None)
+        await collector.collect()
+
+        # Second tick: the batch already uses the discovered dimensions
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(40.0, disk_used=70.0)
+        results = await collector.collect()
+
+        assert results[0].metrics["disk_free_pct"] == 30.0
+        assert mock_cloudwatch_client.list_metrics.call_count == 1
+        queries = mock_cloudwatch_client.get_metric_data.call_args.kwargs['MetricDataQueries']
+        disk_query = next(q for q in queries if q['Id'].startswith('disk'))
+        assert disk_query['MetricStat']['Metric']['Dimensions'] == discovered
 
 
 @pytest.mark.asyncio
@@ -654,22 +615,8 @@ async def test_ec2_collector_backward_compatibility(ec2_configs, thresholds, log
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        def mock_describe_instances(InstanceIds):
-            return {
-                'Reservations': [{
-                    'Instances': [{
-                        'InstanceId': InstanceIds[0],
-                        'State': {'Name': 'running'},
-                        'InstanceType': 't3.medium',
-                        'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                    }]
-                }]
-            }
-
-        mock_ec2_client.describe_instances.side_effect = mock_describe_instances
-        mock_cloudwatch_client.get_metric_statistics.return_value = {
-            'Datapoints': [{'Timestamp': datetime.utcnow(), 'Average': 25.5}]
-        }
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(25.5)
 
         # Execute
         results = await collector.collect()
@@ -714,30 +661,11 @@ async def test_ec2_collector_mixed_configs(thresholds, logger):
             'cloudwatch': mock_cloudwatch_client
         }[service]
 
-        def mock_describe_instances(InstanceIds):
-            return {
-                'Reservations': [{
-                    'Instances': [{
-                        'InstanceId': InstanceIds[0],
-                        'State': {'Name': 'running'},
-                        'InstanceType': 't3.medium',
-                        'LaunchTime': datetime(2024, 1, 1, 10, 0, 0)
-                    }]
-                }]
-            }
-
-        mock_ec2_client.describe_instances.side_effect = mock_describe_instances
+        mock_ec2_client.describe_instances.side_effect = _describe_instances()
 
         def mock_get_metrics(**kwargs):
             metric_name = kwargs.get('MetricName')
-            if metric_name == 'CPUUtilization':
-                return {
-                    'Datapoints': [{
-                        'Timestamp': datetime.utcnow(),
-                        'Average': 30.0
-                    }]
-                }
-            elif metric_name == 'disk_used_percent':
+            if metric_name == 'disk_used_percent':
                 return {
                     'Datapoints': [{
                         'Timestamp': datetime.utcnow(),
@@ -747,6 +675,7 @@ async def test_ec2_collector_mixed_configs(thresholds, logger):
             return {'Datapoints': []}
 
         mock_cloudwatch_client.get_metric_statistics.side_effect = mock_get_metrics
+        mock_cloudwatch_client.get_metric_data.side_effect = _metric_data(30.0)
 
         # Execute
         results = await collector.collect()
@@ -764,5 +693,85 @@ async def test_ec2_collector_mixed_configs(thresholds, logger):
         assert "disk_free_pct" not in cpu_only_result.metrics
 
 
+@pytest.mark.asyncio
+async def test_ec2_collector_batches_calls_per_region(thresholds, logger):
+    """Test that each region gets one describe_instances and one get_metric_data call."""
+    from src.config.models import EC2InstanceConfig
+
+    configs = [
+        EC2InstanceConfig(instance_id="i-1111111111111111", name="east-1", region="us-east-1"),
+        EC2InstanceConfig(instance_id="i-2222222222222222", name="west-1", region="eu-west-1"),
+        EC2InstanceConfig(instance_id="i-3333333333333333", name="east-2", region="us-east-1"),
+    ]
+
+    collector = EC2Collector(configs, thresholds, logger)
+
+    with patch('src.collectors.ec2_collector.boto3') as mock_boto3:
+        mock_clients = {}
+
+        def get_client(service, region_name=None, **kwargs):
+            key = (service, region_name)
+            if key not in mock_clients:
+                mock_clients[key] = MagicMock()
+                mock_clients[key].describe_instances.side_effect = _describe_instances()
+                mock_clients[key].get_metric_data.side_effect = _metric_data(30.0)
+            return mock_clients[key]
+
+        mock_boto3.client.side_effect = get_client
+
+        # Execute
+        results = await collector.collect()
+
+        # Results keep configured order
+        assert [r.target_name for r in results] == ["east-1", "west-1", "east-2"]
+        assert all(r.status == HealthStatus.GREEN for r in results)
+
+        east_ec2 = mock_clients[('ec2', 'us-east-1')]
+        east_cw = mock_clients[('cloudwatch', 'us-east-1')]
+        assert east_ec2.describe_instances.call_count == 1
+        assert east_ec2.describe_instances.call_args.kwargs["InstanceIds"] == [
+            "i-1111111111111111", "i-3333333333333333"
+        ]
+        assert east_cw.get_metric_data.call_count == 1
+        assert len(east_cw.get_metric_data.call_args.kwargs["MetricDataQueries"]) == 2
+
+
+def test_ec2_collector_chunks_describe_instances(thresholds, logger):
+    """Test that DescribeInstances is split into chunks of at most 1000 IDs."""
+    collector = EC2Collector([], thresholds, logger)
+    ec2_client = MagicMock()
+    ec2_client.describe_instances.side_effect = _describe_instances()
+
+    instance_ids = [f"i-{n:016x}" for n in range(2500)]
+    statuses = collector._get_instance_statuses(ec2_client, instance_ids)
+
+    assert set(statuses) == set(instance_ids)
+    assert [len(c.kwargs["InstanceIds"]) for c in ec2_client.describe_instances.call_args_list] == [1000, 1000, 500]
+
+
+@pytest.mark.asyncio
+async def test_ec2_collector_reuses_clients_across_ticks(thresholds, logger):
+    """Test that AWS clients are created once per region and reused."""
+    from src.config.models import EC2InstanceConfig
+
+    config = EC2InstanceConfig(instance_id="i-1234567890abcdef0", name="test", region="us-east-1")
+    collector = EC2Collector([config], thresholds, logger)
+
+    with patch('src.collectors.ec2_collector.boto3') as mock_boto3:
+        mock_client = MagicMock()
+        mock_client.describe_instances.side_effect = _describe_instances()
+        mock_client.get_metric_data.side_effect = _metric_data(30.0)
+        mock_boto3.client.return_value = mock_client
+
+        await collector.collect()
+        await collector.collect()
+
+        # One ec2 and one cloudwatch client, shared by both ticks
+        assert mock_boto3.client.call_count == 2
+
+        await collector.close()
+        assert mock_client.close.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,7 +1,7 @@
 """Tests for LLM collector."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import json
 
 from src.collectors.llm_collector import LLMCollector
@@ -10,6 +10,15 @@ from src.utils.status import HealthStatus
 # Fixtures imported from conftest.py: llm_configs, thresholds, logger
 
 
+def _catalog_entry(model_id, status='ACTIVE', inference_types=('ON_DEMAND',)):
+    """Build a ListFoundationModels model summary."""
+    return {
+        'modelId': model_id,
+        'modelLifecycle': {'status': status},
+        'inferenceTypesSupported': list(inference_types),
+    }
+
+
 @pytest.mark.asyncio
 async def test_llm_collector_bedrock_success(llm_configs, thresholds, logger):
     """Test successful Bedrock model check."""
@@ -63,7 +72,7 @@ async def test_llm_collector_azure_success(llm_configs, thresholds, logger):
             'usage': {'total_tokens': 15}
         }
 
-        mock_client.post.return_value = mock_response
+        mock_client.get = AsyncMock(return_value=mock_response)
 
         with patch('os.getenv') as mock_getenv:
             mock_getenv.side_effect = lambda key, default=None: {
@@ -191,7 +200,7 @@ async def test_llm_collector_mixed_providers(llm_configs, thresholds, logger):
             'usage': {'total_tokens': 15}
         }
 
-        mock_azure_client.post.return_value = mock_azure_response
+        mock_azure_client.get = AsyncMock(return_value=mock_azure_response)
 
         with patch('os.getenv') as mock_getenv:
             mock_getenv.side_effect = lambda key, default=None: {
@@ -239,5 +248,131 @@ async def test_llm_collector_minimal_tokens(llm_configs, thresholds, logger):
         assert len(body['messages'][0]['content']) < 20  # Short prompt
 
 
+
+@pytest.mark.asyncio
+async def test_llm_collector_reuses_bedrock_client(llm_configs, thresholds, logger):
+    """Test that the Bedrock client is created once and reused across ticks."""
+    collector = LLMCollector([llm_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.llm_collector.boto3') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.invoke_model.return_value = {'body': MagicMock()}
+        mock_client.invoke_model.return_value['body'].read.return_value = json.dumps({
+            'usage': {'input_tokens': 10, 'output_tokens': 5}
+        }).encode()
+
+        await collector.collect()
+        await collector.collect()
+
+        # One runtime client (plus one catalog client), reused for both ticks
+        created = [c.args[0] for c in mock_boto3.client.call_args_list]
+        assert created.count('bedrock-runtime') == 1
+        assert mock_client.invoke_model.call_count == 2
+
+        await collector.close()
+        assert mock_client.close.call_count == len(created)
+
+
+@pytest.mark.asyncio
+async def test_llm_collector_bedrock_catalog_skips_invoke(llm_configs, thresholds, logger):
+    """Test that models listed in the Bedrock catalog are not invoked, and the catalog is listed once."""
+    model_id = llm_configs[0].model_id
+    collector = LLMCollector([llm_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.llm_collector.boto3') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.list_foundation_models.return_value = {'modelSummaries': [_catalog_entry(model_id)]}
+
+        results = await collector.collect()
+        await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert results[0].metrics["tokens_used"] == 0
+        mock_client.invoke_model.assert_not_called()
+        assert mock_client.list_foundation_models.call_count == 1
+
+    # force_full_check still invokes the model
+    forced = llm_configs[0].model_copy(update={"force_full_check": True})
+    collector = LLMCollector([forced], thresholds, logger)
+
+    with patch('src.collectors.llm_collector.boto3') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.list_foundation_models.return_value = {'modelSummaries': [_catalog_entry(model_id)]}
+        mock_client.invoke_model.return_value = {'body': MagicMock()}
+        mock_client.invoke_model.return_value['body'].read.return_value = json.dumps({
+            'usage': {'input_tokens': 10, 'output_tokens': 5}
+        }).encode()
+
+        results = await collector.collect()
+
+        assert results[0].metrics["tokens_used"] == 15
+        mock_client.invoke_model.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_llm_collector_bedrock_catalog_requires_active_on_demand(llm_configs, thresholds, logger):
+    """Test that LEGACY or profile-only catalog entries don't skip the invocation."""
+    model_id = llm_configs[0].model_id
+
+    for entry in (
+        _catalog_entry(model_id, status='LEGACY'),
+        _catalog_entry(model_id, inference_types=('INFERENCE_PROFILE',)),
+    ):
+        collector = LLMCollector([llm_configs[0]], thresholds, logger)
+
+        with patch('src.collectors.llm_collector.boto3') as mock_boto3:
+            mock_client = MagicMock()
+            mock_boto3.client.return_value = mock_client
+            mock_client.list_foundation_models.return_value = {'modelSummaries': [entry]}
+            mock_client.invoke_model.side_effect = Exception("ValidationException: on-demand throughput isn't supported")
+
+            results = await collector.collect()
+
+            assert results[0].status == HealthStatus.RED
+            mock_client.invoke_model.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_llm_collector_azure_http_client_per_cycle(llm_configs, thresholds, logger):
+    """Test that each collect() opens and closes its own HTTP client for Azure checks."""
+    if len(llm_configs) < 2 or llm_configs[1].provider.lower() != 'azure':
+        pytest.skip("No Azure model configured in llm_configs")
+
+    collector = LLMCollector([llm_configs[1]], thresholds, logger)
+
+    with patch('src.collectors.llm_collector.httpx') as mock_httpx:
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=Mock(status_code=200, json=Mock(return_value={'data': []})))
+        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+
+        with patch('os.getenv', side_effect=lambda key, default=None: 'test_key' if key == 'AZURE_OPENAI_KEY' else default) as mock_getenv:
+            await collector.collect()
+            await collector.collect()
+
+        assert mock_httpx.AsyncClient.call_count == 2
+        assert mock_httpx.AsyncClient.return_value.__aexit__.await_count == 2
+        assert mock_client.get.await_count == 2
+        # API key is read from the environment once, not every tick
+        assert mock_getenv.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_collector_bedrock_only_skips_http_client(llm_configs, thresholds, logger):
+    """Test that no HTTP client is opened when no Azure models are configured."""
+    collector = LLMCollector([llm_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.llm_collector.boto3') as mock_boto3, \
+         patch('src.collectors.llm_collector.httpx') as mock_httpx:
+        mock_boto3.client.return_value.list_foundation_models.return_value = {
+            'modelSummaries': [_catalog_entry(llm_configs[0].model_id)]
+        }
+
+        await collector.collect()
+
+        mock_httpx.AsyncClient.assert_not_called()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -12,7 +12,8 @@ from src.utils.status import HealthStatus
 @pytest.mark.asyncio
 async def test_s3_collector_success(s3_configs, thresholds, logger):
     """Test successful S3 bucket checks using real config."""
-    collector = S3Collector(s3_configs, thresholds, logger)
+    configs = [c.model_copy(update={"include_versioning": True}) for c in s3_configs]
+    collector = S3Collector(configs, thresholds, logger)
 
     with patch('src.collectors.s3_collector.boto3') as mock_boto3:
         # Mock S3 client
@@ -63,15 +64,15 @@ async def test_s3_collector_bucket_not_found(s3_configs, thresholds, logger):
         mock_s3_client = MagicMock()
         mock_boto3.client.return_value = mock_s3_client
 
-        # Mock 404 error (bucket not found)
+        # Mock NoSuchBucket error (bucket not found)
         from botocore.exceptions import ClientError
         error_response = {
             'Error': {
-                'Code': '404',
-                'Message': 'Not Found'
+                'Code': 'NoSuchBucket',
+                'Message': 'The specified bucket does not exist'
             }
         }
-        mock_s3_client.head_bucket.side_effect = ClientError(error_response, 'head_bucket')
+        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, 'list_objects_v2')
 
         # Execute
         results = await collector.collect()
@@ -91,8 +92,11 @@ async def test_s3_collector_access_denied(s3_configs, thresholds, logger):
         mock_s3_client = MagicMock()
         mock_boto3.client.return_value = mock_s3_client
 
-        # Mock 403 error (access denied)
+        # Mock access denied on both list and head
         from botocore.exceptions import ClientError
+        mock_s3_client.list_objects_v2.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'list_objects_v2'
+        )
         error_response = {
             'Error': {
                 'Code': '403',
@@ -150,7 +154,8 @@ async def test_s3_collector_bucket_not_listable(s3_configs, thresholds, logger):
 @pytest.mark.asyncio
 async def test_s3_collector_empty_bucket(s3_configs, thresholds, logger):
     """Test S3 bucket with no objects (GREEN)."""
-    collector = S3Collector([s3_configs[0]], thresholds, logger)
+    config = s3_configs[0].model_copy(update={"include_versioning": True})
+    collector = S3Collector([config], thresholds, logger)
 
     with patch('src.collectors.s3_collector.boto3') as mock_boto3:
         mock_s3_client = MagicMock()
@@ -185,7 +190,8 @@ async def test_s3_collector_empty_bucket(s3_configs, thresholds, logger):
 @pytest.mark.asyncio
 async def test_s3_collector_us_east_1_location(s3_configs, thresholds, logger):
     """Test S3 bucket in us-east-1 (special case with None location)."""
-    collector = S3Collector([s3_configs[0]], thresholds, logger)
+    config = s3_configs[0].model_copy(update={"region": "eu-west-1", "verify_location": True})
+    collector = S3Collector([config], thresholds, logger)
 
     with patch('src.collectors.s3_collector.boto3') as mock_boto3:
         mock_s3_client = MagicMock()
@@ -210,6 +216,55 @@ async def test_s3_collector_us_east_1_location(s3_configs, thresholds, logger):
         assert results[0].metrics["region"] == "us-east-1"
 
 
+@pytest.mark.asyncio
+async def test_s3_collector_region_from_list_response(s3_configs, thresholds, logger):
+    """Test that one ListObjectsV2 call reports the region, without HeadBucket or GetBucketLocation."""
+    collector = S3Collector([s3_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.s3_collector.boto3') as mock_boto3:
+        mock_s3_client = MagicMock()
+        mock_boto3.client.return_value = mock_s3_client
+
+        mock_s3_client.list_objects_v2.return_value = {
+            'KeyCount': 1,
+            'ResponseMetadata': {'HTTPHeaders': {'x-amz-bucket-region': 'eu-central-1'}}
+        }
+
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert results[0].metrics["region"] == "eu-central-1"
+        assert "versioning" not in results[0].metrics
+        mock_s3_client.head_bucket.assert_not_called()
+        mock_s3_client.get_bucket_location.assert_not_called()
+        mock_s3_client.get_bucket_versioning.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_s3_collector_region_mismatch(s3_configs, thresholds, logger):
+    """Test that a bucket in another region than configured is YELLOW."""
+    collector = S3Collector([s3_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.s3_collector.boto3') as mock_boto3:
+        mock_s3_client = MagicMock()
+        mock_boto3.client.return_value = mock_s3_client
+
+        from botocore.exceptions import ClientError
+        mock_s3_client.list_objects_v2.side_effect = ClientError(
+            {
+                'Error': {'Code': 'PermanentRedirect', 'Message': 'Moved Permanently'},
+                'ResponseMetadata': {'HTTPHeaders': {'x-amz-bucket-region': 'ap-southeast-2'}}
+            },
+            'ListObjectsV2'
+        )
+
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.YELLOW
+        assert results[0].metrics["region"] == "ap-southeast-2"
+        assert results[0].metrics["configured_region"] == s3_configs[0].region
+
+
 @pytest.mark.asyncio
 async def test_s3_collector_no_boto3(s3_configs, thresholds, logger):
     """Test graceful handling when boto3 not installed."""
@@ -276,7 +331,7 @@ async def test_s3_collector_aws_api_error(s3_configs, thresholds, logger):
                 'Message': 'Service temporarily unavailable'
             }
         }
-        mock_s3_client.head_bucket.side_effect = ClientError(error_response, 'head_bucket')
+        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, 'list_objects_v2')
 
         # Execute
         results = await collector.collect()
@@ -284,6 +339,7 @@ async def test_s3_collector_aws_api_error(s3_configs, thresholds, logger):
         # Verify RED status
         assert len(results) == 1
         assert results[0].status == HealthStatus.RED
+        assert "ServiceUnavailable" in results[0].message
 
 
 @pytest.mark.asyncio
@@ -314,7 +370,8 @@ async def test_s3_collector_parallel_execution(s3_configs, thresholds, logger):
 @pytest.mark.asyncio
 async def test_s3_collector_versioning_suspended(s3_configs, thresholds, logger):
     """Test S3 bucket with versioning suspended."""
-    collector = S3Collector([s3_configs[0]], thresholds, logger)
+    config = s3_configs[0].model_copy(update={"include_versioning": True})
+    collector = S3Collector([config], thresholds, logger)
 
     with patch('src.collectors.s3_collector.boto3') as mock_boto3:
         mock_s3_client = MagicMock()
@@ -336,5 +393,49 @@ async def test_s3_collector_versioning_suspended(s3_configs, thresholds, logger)
         assert results[0].metrics["versioning"] == "Suspended"
 
 
+@pytest.mark.asyncio
+async def test_s3_collector_deep_check(s3_configs, thresholds, logger):
+    """Test that deep_check runs the full HeadBucket/location/list/versioning sequence."""
+    config = s3_configs[0].model_copy(update={"deep_check": True})
+    collector = S3Collector([config], thresholds, logger)
+
+    with patch('src.collectors.s3_collector.boto3') as mock_boto3:
+        mock_s3_client = MagicMock()
+        mock_boto3.client.return_value = mock_s3_client
+
+        mock_s3_client.head_bucket.return_value = {}
+        mock_s3_client.get_bucket_location.return_value = {'LocationConstraint': 'eu-west-1'}
+        mock_s3_client.list_objects_v2.return_value = {'KeyCount': 1}
+        mock_s3_client.get_bucket_versioning.return_value = {'Status': 'Enabled'}
+
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert results[0].metrics["region"] == "eu-west-1"
+        assert results[0].metrics["versioning"] == "Enabled"
+        mock_s3_client.head_bucket.assert_called_once()
+        mock_s3_client.get_bucket_location.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_s3_collector_reuses_clients_across_ticks(s3_configs, thresholds, logger):
+    """Test that one S3 client is created per region and reused."""
+    collector = S3Collector(s3_configs, thresholds, logger)
+
+    with patch('src.collectors.s3_collector.boto3') as mock_boto3:
+        mock_s3_client = MagicMock()
+        mock_boto3.client.return_value = mock_s3_client
+        mock_s3_client.list_objects_v2.return_value = {'KeyCount': 1}
+
+        await collector.collect()
+        await collector.collect()
+
+        regions = {config.region for config in s3_configs}
+        assert mock_boto3.client.call_count == len(regions)
+
+        await collector.close()
+        assert mock_s3_client.close.call_count == len(regions)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,54 @@
+"""Tests for SSHHelper."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.collectors.ssh_helper import SSHHelper
+
+
+def _mock_client(stdout: bytes, stderr: bytes = b"", exit_code: int = 0) -> MagicMock:
+    """Create a mock SSH client whose channel yields the given output in 8 KiB reads."""
+    def reader(data):
+        chunks = [data[i:i + 8192] for i in range(0, len(data), 8192)]
+        return MagicMock(side_effect=chunks + [b""])
+
+    channel = MagicMock()
+    channel.recv = reader(stdout)
+    channel.recv_stderr = reader(stderr)
+    channel.recv_exit_status.return_value = exit_code
+
+    stdout_file = MagicMock()
+    stdout_file.channel = channel
+    client = MagicMock()
+    client.exec_command.return_value = (MagicMock(), stdout_file, MagicMock())
+    return client
+
+
+def test_exec_command_returns_stdout():
+    """Test that stdout is decoded and returned."""
+    client = _mock_client(b"Mem: 8000 5000\n")
+
+    assert SSHHelper.exec_command(client, "free -m") == "Mem: 8000 5000\n"
+
+
+def test_exec_command_truncates_large_output():
+    """Test that output past max_bytes is drained but not kept."""
+    client = _mock_client(b"x" * 100_000)
+
+    output = SSHHelper.exec_command(client, "yes", max_bytes=10_000)
+
+    assert output == "x" * 10_000
+    # Everything was read so the remote command could exit
+    assert client.exec_command.return_value[1].channel.recv.call_count == 14
+
+
+def test_exec_command_nonzero_exit():
+    """Test that a failing command raises with its stderr."""
+    client = _mock_client(b"", stderr=b"df: permission denied\n", exit_code=1)
+
+    with pytest.raises(RuntimeError, match="exit code 1: df: permission denied"):
+        SSHHelper.exec_command(client, "df -h")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
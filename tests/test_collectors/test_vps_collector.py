@@ -9,12 +9,18 @@ from src.utils.status import HealthStatus
 # Fixtures imported from conftest.py: vps_configs, thresholds, logger
 
 
+def _snapshot(mem, df, cpu_stat):
+    """Join outputs the way the combined meminfo/df/proc-stat command prints them."""
+    return f"{mem}\n---SEP---\n{df}\n---SEP---\n{cpu_stat}"
+
+
 @pytest.fixture
 def mock_ssh_outputs():
     """Create mock SSH command outputs.
 
     /proc/stat cpu line fields: user nice system idle iowait irq softirq steal
-    Two separate readings simulate the two 'head -1 /proc/stat' calls.
+    The first reading comes with the meminfo/df snapshot, the second from a
+    separate 'head -1 /proc/stat' call.
     With delta total=200 and delta idle=159 → CPU = (200-159)/200*100 = 20.5%
     """
     return {
@@ -26,11 +32,19 @@ def mock_ssh_outputs():
         'cpu_stat_high_1': "cpu  10000 0 5000 80000 500 0 0 0 0 0\n",
         'cpu_stat_high_2': "cpu  10170 0 5020 80008 502 0 0 0 0 0\n",
 
+        # 62.5% used: (8000000 - 3000000) / 8000000
+        'meminfo': """MemTotal:        8000000 kB
+MemFree:         1500000 kB
+MemAvailable:    3000000 kB
+Buffers:          100000 kB
+Cached:          1400000 kB
+""",
+
         'free': """              total        used        free      shared  buff/cache   available
 Mem:           8000        5000        1500         200        1500        2000
 Swap:          2000           0        2000""",
 
-        'df': """Filesystem     1K-blocks    Used Available Use% Mounted on
+        'df': """Filesystem     1024-blocks    Used Available Capacity Mounted on
 /dev/sda1       51474912 30880896  20594016  60% /
 tmpfs            4096000        0   4096000   0% /dev/shm
 /dev/sdb1      103809024 83047219  20761805  81% /data"""
@@ -50,13 +64,11 @@ async def test_vps_collector_success(vps_configs, thresholds, logger, mock_ssh_o
         mock_ssh.is_available.return_value = True
 
         # Mock SSH outputs for all configured servers
-        # Order: free, df, stat1, stat2 (CPU measured last, after settling)
+        # Order: meminfo/df/stat1 snapshot, then stat2
         outputs = []
         for _ in vps_configs:
             outputs.extend([
-                mock_ssh_outputs['free'],
-                mock_ssh_outputs['df'],
-                mock_ssh_outputs['cpu_stat_1'],
+                _snapshot(mock_ssh_outputs['meminfo'], mock_ssh_outputs['df'], mock_ssh_outputs['cpu_stat_1']),
                 mock_ssh_outputs['cpu_stat_2'],
             ])
 
@@ -77,6 +89,9 @@ async def test_vps_collector_success(vps_configs, thresholds, logger, mock_ssh_o
             assert "ram_usage_pct" in result.metrics
             assert "disk_free_pct" in result.metrics
 
+        # One combined snapshot plus the second CPU sample per server
+        assert mock_ssh.exec_command.call_count == 2 * len(vps_configs)
+
 
 @pytest.mark.asyncio
 async def test_vps_collector_high_cpu(vps_configs, thresholds, logger, mock_ssh_outputs):
@@ -90,9 +105,7 @@ async def test_vps_collector_high_cpu(vps_configs, thresholds, logger, mock_ssh_
         mock_ssh.is_available.return_value = True
 
         mock_ssh.exec_command.side_effect = [
-            mock_ssh_outputs['free'],
-            mock_ssh_outputs['df'],
-            mock_ssh_outputs['cpu_stat_high_1'],
+            _snapshot(mock_ssh_outputs['meminfo'], mock_ssh_outputs['df'], mock_ssh_outputs['cpu_stat_high_1']),
             mock_ssh_outputs['cpu_stat_high_2'],
         ]
 
@@ -121,9 +134,7 @@ async def test_vps_collector_low_disk(vps_configs, thresholds, logger, mock_ssh_
 /dev/sda1       51474912 48901160   2573752  95% /"""
 
         mock_ssh.exec_command.side_effect = [
-            mock_ssh_outputs['free'],
-            low_disk_output,
-            mock_ssh_outputs['cpu_stat_1'],
+            _snapshot(mock_ssh_outputs['meminfo'], low_disk_output, mock_ssh_outputs['cpu_stat_1']),
             mock_ssh_outputs['cpu_stat_2'],
         ]
 
@@ -218,10 +229,10 @@ async def test_vps_collector_parsing_edge_cases(vps_configs, thresholds, logger)
         alt_free = """       total   used   free  shared  buffers  cached
 Mem:    8000   6000   2000     100      500    1000"""
 
+        alt_df = "Filesystem     Size  Used Avail Use% Mounted on\n/dev/sda1       50G   30G   20G  60% /"
+
         mock_ssh.exec_command.side_effect = [
-            alt_free,
-            "Filesystem     Size  Used Avail Use% Mounted on\n/dev/sda1       50G   30G   20G  60% /",
-            alt_cpu_stat_1,
+            _snapshot(alt_free, alt_df, alt_cpu_stat_1),
             alt_cpu_stat_2,
         ]
 
@@ -247,13 +258,11 @@ async def test_vps_collector_parallel_execution(vps_configs, thresholds, logger,
         mock_ssh.is_available.return_value = True
 
         # Mock SSH outputs for all configured servers
-        # Order: free, df, stat1, stat2 (CPU measured last)
+        # Order: meminfo/df/stat1 snapshot, then stat2
         outputs = []
         for _ in vps_configs:
             outputs.extend([
-                mock_ssh_outputs['free'],
-                mock_ssh_outputs['df'],
-                mock_ssh_outputs['cpu_stat_1'],
+                _snapshot(mock_ssh_outputs['meminfo'], mock_ssh_outputs['df'], mock_ssh_outputs['cpu_stat_1']),
                 mock_ssh_outputs['cpu_stat_2'],
             ])
         mock_ssh.exec_command.side_effect = outputs
@@ -269,5 +278,72 @@ async def test_vps_collector_parallel_execution(vps_configs, thresholds, logger,
         assert len(results) == len(vps_configs)
 
 
+@pytest.mark.asyncio
+async def test_vps_collector_reuses_ssh_connection(vps_configs, thresholds, logger, mock_ssh_outputs):
+    """Test that the SSH connection is opened once and reused across ticks."""
+    collector = VPSCollector([vps_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.vps_collector.SSHHelper') as mock_ssh, \
+         patch('src.collectors.vps_collector.time') as mock_time:
+        mock_client = MagicMock()
+        mock_ssh.create_client.return_value = mock_client
+        mock_ssh.is_available.return_value = True
+        mock_ssh.is_connected.return_value = True
+        snapshot = _snapshot(mock_ssh_outputs['meminfo'], mock_ssh_outputs['df'], mock_ssh_outputs['cpu_stat_1'])
+        mock_ssh.exec_command.side_effect = [snapshot, mock_ssh_outputs['cpu_stat_2']] * 2
+
+        await collector.collect()
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert mock_ssh.create_client.call_count == 1
+        mock_ssh.close_client.assert_not_called()
+
+        await collector.close()
+        mock_ssh.close_client.assert_called_once_with(mock_client, collector.logger)
+
+
+@pytest.mark.asyncio
+async def test_vps_collector_reconnects_dropped_connection(vps_configs, thresholds, logger, mock_ssh_outputs):
+    """Test that a cached connection that drops between ticks is replaced once."""
+    collector = VPSCollector([vps_configs[0]], thresholds, logger)
+
+    with patch('src.collectors.vps_collector.SSHHelper') as mock_ssh, \
+         patch('src.collectors.vps_collector.time') as mock_time:
+        stale_client, fresh_client = MagicMock(), MagicMock()
+        mock_ssh.create_client.side_effect = [stale_client, fresh_client]
+        mock_ssh.is_available.return_value = True
+        mock_ssh.is_connected.return_value = True
+        snapshot = _snapshot(mock_ssh_outputs['meminfo'], mock_ssh_outputs['df'], mock_ssh_outputs['cpu_stat_1'])
+        mock_ssh.exec_command.side_effect = [
+            snapshot, mock_ssh_outputs['cpu_stat_2'],
+            EOFError("connection reset"), snapshot, mock_ssh_outputs['cpu_stat_2'],
+        ]
+
+        await collector.collect()
+        results = await collector.collect()
+
+        assert results[0].status == HealthStatus.GREEN
+        assert mock_ssh.create_client.call_count == 2
+        mock_ssh.close_client.assert_called_once_with(stale_client, collector.logger)
+
+
+def test_vps_collector_parsers(thresholds, logger, mock_ssh_outputs):
+    """Test the output parsers directly, including CRLF line endings and a missing root mount."""
+    collector = VPSCollector([], thresholds, logger)
+
+    stat = mock_ssh_outputs['cpu_stat_1'] + mock_ssh_outputs['cpu_stat_2']
+    assert collector._parse_cpu(stat) == pytest.approx(20.5)
+    assert collector._parse_memory(mock_ssh_outputs['meminfo']) == pytest.approx(62.5)
+    assert collector._parse_memory(mock_ssh_outputs['free']) == pytest.approx(62.5)
+    assert collector._parse_memory("MemTotal: 1000 kB\nMemFree: 400 kB\n") == pytest.approx(60.0)
+    assert collector._parse_disk(mock_ssh_outputs['df'].replace("\n", "\r\n")) == 40.0
+
+    with pytest.raises(ValueError):
+        collector._parse_disk("Filesystem Size Used Avail Use% Mounted on\n/dev/sdb1 50G 30G 20G 60% /data")
+    with pytest.raises(ValueError):
+        collector._parse_cpu("cpu0 1 2 3 4\n")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
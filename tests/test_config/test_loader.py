@@ -0,0 +1,102 @@
+"""Tests for ConfigLoader."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.config.loader import ConfigLoader
+
+
+CONFIG_TEMPLATE = """
+monitoring:
+  schedule: "{schedule}"
+targets: {{}}
+thresholds: {{}}
+telegram:
+  bot_token: "${{TEST_TELEGRAM_TOKEN}}"
+  chat_id: "123"
+llm: {{}}
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Write a minimal config that references one environment variable."""
+    monkeypatch.setenv("TEST_TELEGRAM_TOKEN", "token-1")
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_TEMPLATE.format(schedule="0 */6 * * *"))
+    return path
+
+
+def test_load_substitutes_env_vars(config_file):
+    """Test that ${VAR} placeholders are replaced from the environment."""
+    config = ConfigLoader.load_from_file(str(config_file))
+
+    assert config.telegram.bot_token == "token-1"
+    assert config.monitoring.schedule == "0 */6 * * *"
+
+
+def test_load_reuses_validated_config(config_file):
+    """Test that an unchanged file is not parsed and validated again."""
+    first = ConfigLoader.load_from_file(str(config_file))
+
+    with patch("src.config.loader.MonitoringSystemConfig") as mock_model:
+        second = ConfigLoader.load_from_file(str(config_file))
+
+    mock_model.assert_not_called()
+    assert second == first
+
+
+def test_load_returns_independent_copies(config_file):
+    """Test that modifying a returned config does not affect later loads."""
+    first = ConfigLoader.load_from_file(str(config_file))
+    first.telegram.bot_token = "mutated"
+
+    second = ConfigLoader.load_from_file(str(config_file))
+
+    assert second is not first
+    assert second.telegram.bot_token == "token-1"
+
+
+def test_load_reloads_changed_file(config_file):
+    """Test that a modified file is reloaded."""
+    first = ConfigLoader.load_from_file(str(config_file))
+
+    config_file.write_text(CONFIG_TEMPLATE.format(schedule="0 */1 * * *"))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = ConfigLoader.load_from_file(str(config_file))
+    assert second is not first
+    assert second.monitoring.schedule == "0 */1 * * *"
+
+
+def test_load_reloads_on_env_change(config_file, monkeypatch):
+    """Test that a changed referenced environment variable invalidates the cache."""
+    ConfigLoader.load_from_file(str(config_file))
+
+    monkeypatch.setenv("TEST_TELEGRAM_TOKEN", "token-2")
+
+    assert ConfigLoader.load_from_file(str(config_file)).telegram.bot_token == "token-2"
+
+
+def test_substitute_env_vars_nested(monkeypatch):
+    """Test substitution in nested dicts and lists, leaving other values untouched."""
+    monkeypatch.setenv("TEST_HOST", "db.internal")
+    monkeypatch.delenv("TEST_UNSET", raising=False)
+    raw = {"hosts": ["${TEST_HOST}", "static"], "port": 5432, "dsn": "pg://${TEST_HOST}/${TEST_UNSET}x"}
+
+    result = ConfigLoader._substitute_env_vars(raw)
+
+    assert result == {"hosts": ["db.internal", "static"], "port": 5432, "dsn": "pg://db.internal/x"}
+
+
+def test_load_missing_file(tmp_path):
+    """Test that a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        ConfigLoader.load_from_file(str(tmp_path / "missing.yaml"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+"""Tests for AnalysisCache service."""
+
+import json
+import time
+import pytest
+
+from src.services.analysis_cache import AnalysisCache
+from src.utils.metrics import CollectorResult
+from src.utils.status import HealthStatus
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Return path to a cache file inside a tmp directory."""
+    return str(tmp_path / "analysis_cache.json")
+
+
+@pytest.fixture
+def cache(cache_file):
+    """AnalysisCache backed by a temp file."""
+    return AnalysisCache(cache_file=cache_file, ttl_seconds=3600)
+
+
+def make_issue(target_name, message="High CPU", metrics=None, status=HealthStatus.RED):
+    return CollectorResult(
+        collector_name="ec2",
+        target_name=target_name,
+        status=status,
+        metrics=metrics if metrics is not None else {"cpu_usage_pct": 95.0},
+        message=message,
+    )
+
+
+SAMPLE_ANALYSIS = {
+    "root_cause": "Traffic spike",
+    "severity": "high",
+    "affected_systems": ["server-1"],
+    "recommendations": [],
+    "token_usage": {"input_tokens": 100, "output_tokens": 50, "total_tokens": 150},
+}
+
+
+class TestFingerprint:
+    def test_same_issues_same_fingerprint(self):
+        a = [make_issue("server-1"), make_issue("server-2")]
+        b = [make_issue("server-1"), make_issue("server-2")]
+        assert AnalysisCache.fingerprint(a) == AnalysisCache.fingerprint(b)
+
+    def test_order_independent(self):
+        a = [make_issue("server-1"), make_issue("server-2")]
+        b = [make_issue("server-2"), make_issue("server-1")]
+        assert AnalysisCache.fingerprint(a) == AnalysisCache.fingerprint(b)
+
+    def test_message_change_changes_fingerprint(self):
+        a = [make_issue("server-1", message="High CPU")]
+        b = [make_issue("server-1", message="Instance stopped")]
+        assert AnalysisCache.fingerprint(a) != AnalysisCache.fingerprint(b)
+
+    def test_status_change_changes_fingerprint(self):
+        a = [make_issue("server-1", status=HealthStatus.RED)]
+        b = [make_issue("server-1", status=HealthStatus.YELLOW)]
+        assert AnalysisCache.fingerprint(a) != AnalysisCache.fingerprint(b)
+
+    def test_only_prompted_metrics_count(self):
+        # The prompt shows the first five metrics in insertion order
+        shown = {f"m{i}": i for i in range(5)}
+        a = [make_issue("server-1", metrics={**shown, "zzz": 1})]
+        b = [make_issue("server-1", metrics={**shown, "zzz": 2})]
+        c = [make_issue("server-1", metrics={"aaa": 1, **shown})]
+        assert AnalysisCache.fingerprint(a) == AnalysisCache.fingerprint(b)
+        assert AnalysisCache.fingerprint(a) != AnalysisCache.fingerprint(c)
+
+
+class TestGetAndSet:
+    def test_miss_returns_none(self, cache):
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_hit_returns_analysis_without_token_usage(self, cache):
+        cache.set("key", SAMPLE_ANALYSIS)
+        result = cache.get("key")
+        assert result["root_cause"] == "Traffic spike"
+        assert "token_usage" not in result
+        assert cache.hits == 1
+
+    def test_hit_returns_copy(self, cache):
+        cache.set("key", SAMPLE_ANALYSIS)
+        cache.get("key")["affected_systems"].append("mutated")
+        assert cache.get("key")["affected_systems"] == ["server-1"]
+
+    def test_expired_entry_is_miss(self, cache):
+        cache.set("key", SAMPLE_ANALYSIS)
+        cache._entries["key"]["created_at"] = time.time() - 7200
+        assert cache.get("key") is None
+
+    def test_disabled_cache_never_hits(self, cache_file):
+        cache = AnalysisCache(cache_file=cache_file, ttl_seconds=0)
+        cache.set("key", SAMPLE_ANALYSIS)
+        assert cache.get("key") is None
+
+    def test_max_entries_evicts_oldest(self, cache_file):
+        cache = AnalysisCache(cache_file=cache_file, ttl_seconds=3600, max_entries=2)
+        for i in range(3):
+            cache.set(f"key{i}", SAMPLE_ANALYSIS)
+            cache._entries[f"key{i}"]["created_at"] -= 10 - i
+        assert cache.get("key0") is None
+        assert cache.get("key2") is not None
+
+
+class TestSimilarity:
+    def test_signature_ignores_numbers(self):
+        a = [make_issue("server-1", message="Disk free: 9.0%")]
+        b = [make_issue("server-1", message="Disk free: 8.2%")]
+        assert AnalysisCache.signature(a) == AnalysisCache.signature(b)
+
+    def test_near_duplicate_hit(self, cache):
+        stored = [make_issue("server-1", message="CPU: 91.0%")]
+        cache.set("key", SAMPLE_ANALYSIS, AnalysisCache.signature(stored))
+
+        probe = [make_issue("server-1", message="CPU: 92.5%")]
+        assert cache.get(AnalysisCache.fingerprint(probe)) is None
+        analysis, score = cache.get_similar(AnalysisCache.signature(probe))
+
+        assert analysis["root_cause"] == "Traffic spike"
+        assert score == 1.0
+        assert cache.similar_hits == 1
+        assert cache.misses == 0
+
+    def test_status_change_is_not_similar(self, cache):
+        stored = [make_issue("server-1", status=HealthStatus.YELLOW)]
+        cache.set("key", SAMPLE_ANALYSIS, AnalysisCache.signature(stored))
+
+        probe = [make_issue("server-1", status=HealthStatus.RED)]
+        assert cache.get_similar(AnalysisCache.signature(probe)) is None
+
+    def test_below_threshold_is_miss(self, cache):
+        stored = [make_issue(f"server-{i}") for i in range(4)]
+        cache.set("key", SAMPLE_ANALYSIS, AnalysisCache.signature(stored))
+
+        probe = [make_issue(f"server-{i}") for i in range(2, 6)]  # 2 of 6 overlap
+        assert cache.get_similar(AnalysisCache.signature(probe)) is None
+
+    def test_disabled_similarity(self, cache_file):
+        cache = AnalysisCache(cache_file=cache_file, similarity_threshold=None)
+        signature = AnalysisCache.signature([make_issue("server-1")])
+        cache.set("key", SAMPLE_ANALYSIS, signature)
+        assert cache.get_similar(signature) is None
+
+
+class TestPersistence:
+    def test_entries_survive_reload(self, cache_file):
+        AnalysisCache(cache_file=cache_file).set("key", SAMPLE_ANALYSIS)
+        reloaded = AnalysisCache(cache_file=cache_file)
+        assert reloaded.get("key")["severity"] == "high"
+
+    def test_corrupt_file_starts_fresh(self, cache_file):
+        with open(cache_file, "w") as f:
+            f.write("{not json")
+        cache = AnalysisCache(cache_file=cache_file)
+        assert cache.get("key") is None
+
+    def test_expired_entries_dropped_on_load(self, cache_file):
+        with open(cache_file, "w") as f:
+            json.dump({"entries": {"old": {"created_at": 0, "analysis": {}}}}, f)
+        cache = AnalysisCache(cache_file=cache_file)
+        assert "old" not in cache._entries
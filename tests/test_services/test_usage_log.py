@@ -0,0 +1,97 @@
+"""Tests for UsageLog service."""
+
+import time
+
+import pytest
+
+from src.services.usage_log import UsageLog
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Return path to a usage database inside a tmp directory."""
+    return str(tmp_path / "data" / "usage_log.db")
+
+
+@pytest.fixture
+def usage_log(db_path):
+    """UsageLog backed by a temp database."""
+    log = UsageLog(db_path=db_path)
+    yield log
+    log.close()
+
+
+def _record(log, cycle_id, input_tok=1000, output_tok=200):
+    log.record(cycle_id, input_tok, output_tok, duration_ms=1500, n_checks=10, n_issues=2)
+
+
+# ---------------------------------------------------------------------------
+# record / cycles
+# ---------------------------------------------------------------------------
+
+class TestRecord:
+
+    def test_recorded_cycle_is_returned(self, usage_log):
+        _record(usage_log, "c1")
+
+        rows = usage_log.cycles(days=1)
+
+        assert len(rows) == 1
+        assert rows[0]["cycle_id"] == "c1"
+        assert rows[0]["input_tokens"] == 1000
+        assert rows[0]["output_tokens"] == 200
+        assert rows[0]["duration_ms"] == 1500
+        assert rows[0]["n_checks"] == 10
+        assert rows[0]["n_issues"] == 2
+
+    def test_cycles_ordered_oldest_first(self, usage_log):
+        _record(usage_log, "c1")
+        _record(usage_log, "c2")
+
+        assert [r["cycle_id"] for r in usage_log.cycles(days=1)] == ["c1", "c2"]
+
+    def test_window_excludes_older_cycles(self, usage_log):
+        _record(usage_log, "old")
+        usage_log._conn.execute(
+            "UPDATE cycles SET ts = ? WHERE cycle_id = 'old'", (time.time() - 3 * 86400,)
+        )
+        _record(usage_log, "new")
+
+        assert [r["cycle_id"] for r in usage_log.cycles(days=2)] == ["new"]
+        assert len(usage_log.cycles(days=7)) == 2
+
+    def test_rows_past_retention_are_rotated(self, db_path):
+        log = UsageLog(db_path=db_path, retention_days=1)
+        _record(log, "old")
+        log._conn.execute(
+            "UPDATE cycles SET ts = ? WHERE cycle_id = 'old'", (time.time() - 2 * 86400,)
+        )
+        _record(log, "new")
+
+        assert [r["cycle_id"] for r in log.cycles(days=30)] == ["new"]
+        log.close()
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+class TestPersistence:
+
+    def test_rows_survive_reopen(self, db_path):
+        log = UsageLog(db_path=db_path)
+        _record(log, "c1")
+        log.close()
+
+        reopened = UsageLog(db_path=db_path)
+        assert len(reopened.cycles(days=1)) == 1
+        reopened.close()
+
+    def test_record_failure_does_not_raise(self, usage_log):
+        usage_log.close()
+
+        _record(usage_log, "c1")  # Closed connection - logged, not raised